@@ -0,0 +1,96 @@
+/**
+ * Benchmarks code generation over a synthetic JDL with many modules and entities, reporting
+ * cold runs into an empty output directory and warm runs against the previous run's manifest.
+ */
+import { Command } from 'commander'
+import fs from 'fs-extra'
+import os from 'os'
+import path from 'path'
+import { generateFromJdl, GenerateOptions, GenerateResult } from '../generate-from-jdl.js'
+
+const FIELD_TYPES = ['String', 'Long', 'Integer', 'BigDecimal', 'Boolean', 'LocalDate', 'UUID', 'Double']
+const RESOURCE_TYPES = ['UnscopedResource', 'TenantResource', 'BusinessUnitResource']
+
+const program = new Command()
+
+program
+    .name('codegen-benchmark')
+    .option('--modules <n>', 'Number of synthetic modules', value => Number.parseInt(value, 10), 20)
+    .option('--entities <n>', 'Number of entities per module', value => Number.parseInt(value, 10), 25)
+    .option('--fields <n>', 'Number of fields per entity', value => Number.parseInt(value, 10), 12)
+    .option('--concurrency <n>', 'Worker pool size for the parallel runs', value => Number.parseInt(value, 10), os.availableParallelism())
+    .action(async (options) => {
+        const workDir = await fs.mkdtemp(path.join(os.tmpdir(), 'codegen-benchmark-'))
+        const jdlPath = path.join(workDir, 'synthetic.jdl')
+        const outputDir = path.join(workDir, 'output')
+
+        try {
+            await fs.writeFile(jdlPath, syntheticJdl(options.modules, options.entities, options.fields))
+            console.log(`📐 Synthetic JDL: ${options.modules} modules x ${options.entities} entities x ${options.fields} fields`)
+
+            const run = (label: string, overrides: Partial<GenerateOptions> = {}) =>
+                timed(label, { jdlPath, outputDir, concurrency: options.concurrency, ...overrides })
+
+            await run('cold, sequential', { concurrency: 1 })
+            await fs.remove(outputDir)
+            await run(`cold, concurrency ${options.concurrency}`)
+            await run('warm, full render')
+            await run('warm, --changed-only', { changedOnly: true })
+
+            await fs.writeFile(jdlPath, syntheticJdl(options.modules, options.entities, options.fields, 'Module0Entity0'))
+            await run('warm, --changed-only after editing one entity', { changedOnly: true })
+        } finally {
+            await fs.remove(workDir)
+        }
+    })
+
+program.parse()
+
+async function timed(label: string, options: GenerateOptions): Promise<GenerateResult> {
+    const log = console.log
+    console.log = () => {}
+    const result = await generateFromJdl(options).finally(() => {
+        console.log = log
+    })
+
+    console.log(
+        `⏱️  ${label.padEnd(48)} ${Math.round(result.elapsedMs).toString().padStart(6)} ms | ` +
+        `${result.regeneratedEntities}/${result.entities} entities, ` +
+        `${result.written} written, ${result.unchanged} unchanged`,
+    )
+    return result
+}
+
+function syntheticJdl(modules: number, entitiesPerModule: number, fields: number, editedEntity?: string): string {
+    const blocks: string[] = []
+
+    for (let m = 0; m < modules; m++) {
+        const entityNames: string[] = []
+
+        for (let e = 0; e < entitiesPerModule; e++) {
+            const name = `Module${m}Entity${e}`
+            entityNames.push(name)
+
+            const body = Array.from({ length: fields }, (_, f) => {
+                const required = f % 3 === 0 ? ' required' : ''
+                return `  /**\n   * Field ${f} of ${name}.\n   */\n  field${f} ${FIELD_TYPES[(e + f) % FIELD_TYPES.length]}${required}`
+            })
+            if (name === editedEntity) {
+                body.push('  editedField String')
+            }
+
+            blocks.push(
+                `/**\n * Synthetic entity ${e} of module ${m}.\n */\n` +
+                `@resourceType(${RESOURCE_TYPES[e % RESOURCE_TYPES.length]})\n@Auditable\n` +
+                `entity ${name} {\n${body.join(',\n\n')}\n}\n`,
+            )
+        }
+
+        blocks.push(
+            `application {\n  config {\n    baseName module${m}\n    packageName net.blugrid.core.module${m}\n    applicationType microservice\n  }\n\n` +
+            `  entities ${entityNames.join(', ')}\n}\n`,
+        )
+    }
+
+    return blocks.join('\n')
+}
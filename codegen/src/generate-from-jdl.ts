@@ -0,0 +1,242 @@
+import fs from 'fs-extra'
+import path from 'path'
+import {
+    generateCommonModuleFiles,
+    generateKotlinDbMigrationFiles,
+    generateKotlinEntityFile,
+    generateKotlinGenericCrudRepositoryFile,
+    generateKotlinMappingExtensionsFile,
+    generateKotlinMappingServiceFile,
+    generateKotlinResources,
+    generateKotlinServiceInterfaceFile,
+    generateKotlinStateServiceDbImplFile,
+} from './generators/kotlin/file-generators/index.js'
+import { KotlinModule, KotlinModuleType } from './generators/kotlin/model/KotlinModule.js'
+import { ScopePredicateMode } from './generators/kotlin/templates/db/sql/index.js'
+import { loadJdl } from './jdl/load-jdl.js'
+import { JdlEntity } from './jdl/models/JdlEntity.js'
+import { JdlModule } from './jdl/models/JdlModule.js'
+import { mapJdlEntityToCodegenEntity } from './mapper/index.js'
+import { mapJdlModuleToKotlinModule } from './mapper/JdlModuleToKotlinModule.js'
+import { CodegenEntityModel } from './model/index.js'
+import { generatedFiles, GeneratedFileStats, sha256 } from './utils/generated-file-writer.js'
+import { resolveFromProjectRoot } from './utils/resolveFromProjectRoot.js'
+import { runWithConcurrency } from './utils/run-with-concurrency.js'
+
+export interface GenerateOptions {
+    jdlPath: string
+    outputDir: string
+    /** Maximum number of modules and entities rendered at the same time */
+    concurrency: number
+    /** Only regenerate modules and entities whose JDL definition changed since the last run */
+    changedOnly?: boolean
+    /** How generated views filter rows to the current tenant, see ScopePredicateMode */
+    scopePredicates?: ScopePredicateMode
+}
+
+export interface GenerateResult extends GeneratedFileStats {
+    modules: number
+    entities: number
+    regeneratedModules: number
+    regeneratedEntities: number
+    elapsedMs: number
+}
+
+interface KotlinModules {
+    model: KotlinModule
+    db: KotlinModule
+    api: KotlinModule
+}
+
+interface GenerationUnit {
+    key: string
+    fingerprint: string
+    generate: () => Promise<void>
+}
+
+/**
+ * Generates the Kotlin modules of a JDL file.
+ *
+ * The JDL is parsed once and every module and entity is rendered as an independent unit on a
+ * pool of at most `concurrency` tasks. Output goes through the generated file manifest, so
+ * files whose content is unchanged are not rewritten, and with `changedOnly` units whose JDL
+ * definition and codegen sources are unchanged since the last run are skipped entirely.
+ */
+export async function generateFromJdl({
+    jdlPath,
+    outputDir,
+    concurrency,
+    changedOnly = false,
+    scopePredicates = 'function',
+}: GenerateOptions): Promise<GenerateResult> {
+    const startedAt = performance.now()
+
+    console.log(`📥 Loading JDL from: ${jdlPath}`)
+    const { entities: jdlEntities, modules: jdlModules } = loadJdl(jdlPath)
+    console.log(`✅ Successfully loaded ${jdlEntities.length} entities and ${jdlModules.length} modules.`)
+
+    const codegenFingerprint = await fingerprintCodegenSources() + scopePredicates
+    const previous = await generatedFiles.begin(outputDir, changedOnly)
+
+    const moduleUnits: GenerationUnit[] = []
+    const entityUnits: GenerationUnit[] = []
+
+    for (const module of jdlModules) {
+        const kotlinModules = toKotlinModules(module)
+
+        moduleUnits.push({
+            key: `module:${module.name}`,
+            fingerprint: sha256(codegenFingerprint + JSON.stringify(module)),
+            generate: () => generateModuleFiles(module, kotlinModules, outputDir),
+        })
+
+        const entitiesInModule = jdlEntities.filter(entity =>
+            module.entities?.entityList?.includes(entity.name),
+        )
+
+        console.log(`🗂️ Found ${entitiesInModule.length} entities in module: ${module.name}`)
+
+        for (const entity of entitiesInModule) {
+            entityUnits.push({
+                key: `entity:${module.name}/${entity.name}`,
+                fingerprint: entityFingerprint(codegenFingerprint, module, entity),
+                generate: () => generateEntityFiles(
+                    mapJdlEntityToCodegenEntity(entity, 'net.blugrid.api.core'),
+                    module,
+                    kotlinModules,
+                    outputDir,
+                    scopePredicates,
+                ),
+            })
+        }
+    }
+
+    const isStale = (unit: GenerationUnit) => !changedOnly || previous.units[unit.key] !== unit.fingerprint
+    const staleModules = moduleUnits.filter(isStale)
+    const staleEntities = entityUnits.filter(isStale)
+
+    if (changedOnly) {
+        console.log(`🔍 ${staleModules.length} modules and ${staleEntities.length} entities changed since the last run`)
+    }
+
+    await runWithConcurrency([...staleModules, ...staleEntities].map(unit => async () => {
+        await unit.generate()
+        generatedFiles.recordUnit(unit.key, unit.fingerprint)
+    }), concurrency)
+
+    const stats = await generatedFiles.commit(new Set([...moduleUnits, ...entityUnits].map(unit => unit.key)))
+
+    return {
+        ...stats,
+        modules: moduleUnits.length,
+        entities: entityUnits.length,
+        regeneratedModules: staleModules.length,
+        regeneratedEntities: staleEntities.length,
+        elapsedMs: performance.now() - startedAt,
+    }
+}
+
+function toKotlinModules(module: JdlModule): KotlinModules {
+    return {
+        model: mapJdlModuleToKotlinModule({
+            jdlModule: module,
+            moduleType: KotlinModuleType.Model,
+        }),
+        db: mapJdlModuleToKotlinModule({
+            jdlModule: module,
+            moduleType: KotlinModuleType.Db,
+            coreDependencies: [{ name: module.name, type: KotlinModuleType.Model }],
+            includeDb: true,
+            includeTest: true,
+        }),
+        api: mapJdlModuleToKotlinModule({
+            jdlModule: module,
+            moduleType: KotlinModuleType.Api,
+            coreDependencies: [{ name: module.name, type: KotlinModuleType.Model }],
+            includeDb: true,
+            includeTest: true,
+        }),
+    }
+}
+
+function moduleOutputPaths(module: JdlModule, { model, db, api }: KotlinModules, outputDir: string) {
+    return {
+        model: `${outputDir}/core-${module.name}-api/${model.baseName}-${model.moduleType}`,
+        db: `${outputDir}/core-${module.name}-api/${db.baseName}-${db.moduleType}`,
+        api: `${outputDir}/core-${module.name}-api/${api.baseName}`,
+    }
+}
+
+async function generateModuleFiles(module: JdlModule, kotlinModules: KotlinModules, outputDir: string) {
+    const outputPaths = moduleOutputPaths(module, kotlinModules, outputDir)
+
+    console.log(`\n📦 Generating API Model Module: ${kotlinModules.model.baseName}`)
+    await generateCommonModuleFiles(kotlinModules.model, outputPaths.model)
+
+    console.log(`\n🗄️  Generating DB Module: ${kotlinModules.db.baseName}`)
+    await generateCommonModuleFiles(kotlinModules.db, outputPaths.db)
+
+    console.log(`\n🌐 Generating API REST Server Module: ${kotlinModules.api.baseName}`)
+    await generateCommonModuleFiles(kotlinModules.api, outputPaths.api)
+}
+
+async function generateEntityFiles(
+    entity: CodegenEntityModel,
+    module: JdlModule,
+    kotlinModules: KotlinModules,
+    outputDir: string,
+    scopePredicates: ScopePredicateMode,
+) {
+    const outputPaths = moduleOutputPaths(module, kotlinModules, outputDir)
+    const packagePath = entity.packageName.replace(/\./g, '/')
+
+    const resourceOutputPath = path.join(outputPaths.model, 'src/main/kotlin', packagePath)
+    console.log(`🧱 Generating Resource Models and Interfaces for: ${entity.name}`)
+    await generateKotlinResources(entity, resourceOutputPath)
+    await generateKotlinServiceInterfaceFile(entity.name, kotlinModules.model.packageName, resourceOutputPath)
+
+    const dbPackageOutputPath = path.join(outputPaths.db, 'src/main/kotlin', packagePath)
+    console.log(`📄 Generating DB Entity, Migration, Repository, and Service implementation for: ${entity.name}`)
+    await generateKotlinDbMigrationFiles(entity, dbPackageOutputPath, scopePredicates)
+    await generateKotlinEntityFile(entity, dbPackageOutputPath)
+    await generateKotlinMappingExtensionsFile(entity, dbPackageOutputPath)
+    await generateKotlinMappingServiceFile(entity, dbPackageOutputPath)
+    await generateKotlinGenericCrudRepositoryFile(entity, dbPackageOutputPath)
+    await generateKotlinStateServiceDbImplFile(entity, dbPackageOutputPath)
+}
+
+function entityFingerprint(codegenFingerprint: string, module: JdlModule, entity: JdlEntity): string {
+    return sha256(codegenFingerprint + JSON.stringify(module.config) + JSON.stringify(entity))
+}
+
+let codegenSourcesFingerprint: Promise<string> | undefined
+
+/**
+ * Hash of the codegen sources and templates, so a change to the generator itself invalidates
+ * every module and entity recorded in the manifest.
+ */
+function fingerprintCodegenSources(): Promise<string> {
+    codegenSourcesFingerprint ??= (async () => {
+        const sourceDir = resolveFromProjectRoot('src')
+        if (!await fs.pathExists(sourceDir)) {
+            return ''
+        }
+
+        const files: string[] = []
+        const walk = async (dir: string) => {
+            for (const entry of await fs.readdir(dir, { withFileTypes: true })) {
+                const entryPath = path.join(dir, entry.name)
+                if (entry.isDirectory()) {
+                    await walk(entryPath)
+                } else {
+                    files.push(entryPath)
+                }
+            }
+        }
+        await walk(sourceDir)
+
+        const contents = await Promise.all(files.sort().map(file => fs.readFile(file, 'utf8')))
+        return sha256(files.map((file, i) => `${path.relative(sourceDir, file)}\n${contents[i]}`).join('\n'))
+    })()
+    return codegenSourcesFingerprint
+}
@@ -1,6 +1,7 @@
 import fs from 'fs-extra'
 import mustache from 'mustache'
 import path from 'path'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 import { resolveTemplate } from '../../../../utils/resolve-template.js'
 import { KotlinModule } from '../../model/KotlinModule.js'
 import { GradleBuildFileTemplate } from '../../templates/common/GradleBuildFileTemplate.js'
@@ -24,21 +25,33 @@ export async function generateCommonModuleFiles({
                                                 }: KotlinModule, outputDir: string): Promise<void> {
     // Gradle build file (build.gradle.kts)
     const gradleBuild = GradleBuildFileTemplate({ group, version, packageName, mainClassName, coreDependencies, includeDb, includeSecurity, includeWebService, includeTest })
-    await fs.outputFile(path.join(outputDir, gradleBuildFile), gradleBuild)
+    await generatedFiles.write(path.join(outputDir, gradleBuildFile), gradleBuild)
 
     // gradle.properties
     const gradleProps = GradlePropertiesTemplate()
-    await fs.outputFile(path.join(outputDir, gradlePropsFile), gradleProps)
+    await generatedFiles.write(path.join(outputDir, gradlePropsFile), gradleProps)
 
     // 3. Copy and render `gradlew` (mustache-based)
-    const gradlewTemplate = await fs.readFile(resolveTemplate('gradlew.mustache'), 'utf8')
+    const gradlewTemplate = await readTemplate('gradlew.mustache')
     const gradlewRendered = mustache.render(gradlewTemplate, null)
-    await fs.outputFile(path.join(outputDir, gradlewFiles), gradlewRendered)
+    await generatedFiles.write(path.join(outputDir, gradlewFiles), gradlewRendered)
 
     // 4. Copy and render `gradlew.bat`
-    const gradlewBatTemplate = await fs.readFile(resolveTemplate('gradlew.bat.mustache'), 'utf8')
+    const gradlewBatTemplate = await readTemplate('gradlew.bat.mustache')
     const gradlewBatRendered = mustache.render(gradlewBatTemplate, null)
-    await fs.outputFile(path.join(outputDir, gradlewBatFile), gradlewBatRendered)
+    await generatedFiles.write(path.join(outputDir, gradlewBatFile), gradlewBatRendered)
 
     console.log(`✅ Generated common Gradle files for ${name} in ${outputDir}`)
 }
+
+const templateCache = new Map<string, Promise<string>>()
+
+// Every module renders the same wrapper templates, so each one is read from disk once per process
+function readTemplate(templateName: string): Promise<string> {
+    let template = templateCache.get(templateName)
+    if (!template) {
+        template = fs.readFile(resolveTemplate(templateName), 'utf8')
+        templateCache.set(templateName, template)
+    }
+    return template
+}
@@ -1,17 +1,17 @@
-import fs from 'fs-extra'
 import path from 'path'
 import { CodegenEntityModel } from '../../../../model/index.js'
 import { toMustacheList } from '../../../../utils/index.js'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 import { RepeatableViewMigrationTemplate } from '../../templates/db/migrations/index.js'
-import { CreateTableSQLTemplate, CreateViewSQLTemplate } from '../../templates/db/sql/index.js'
+import { CreateTableSQLTemplate, CreateViewSQLTemplate, ScopePredicateMode } from '../../templates/db/sql/index.js'
 
 export async function generateKotlinDbMigrationFiles(
     entity: CodegenEntityModel,
     outputDir: string,
+    scopePredicates: ScopePredicateMode = 'function',
 ) {
     const name = entity.tableName;
     const migrationDir = path.join(outputDir, 'migration');
-    await fs.mkdir(migrationDir, { recursive: true });
 
     // --- Table Migration ---
     const tableSql = CreateTableSQLTemplate({
@@ -36,7 +36,7 @@ export async function generateKotlinDbMigrationFiles(
     });
 
     const tableKtPath = path.join(migrationDir, `R__5_table_${name}.kt`);
-    await fs.writeFile(tableKtPath, tableKt, 'utf-8');
+    await generatedFiles.write(tableKtPath, tableKt);
 
     // --- View Migration ---
     const viewSql = CreateViewSQLTemplate({
@@ -48,6 +48,7 @@ export async function generateKotlinDbMigrationFiles(
                     ? 'businessUnitScoped'
                     : 'unscoped',
         unscoped: entity.resourceType === 'UnscopedResource',
+        scopePredicates,
     });
 
     const viewKt = RepeatableViewMigrationTemplate({
@@ -57,7 +58,7 @@ export async function generateKotlinDbMigrationFiles(
     });
 
     const viewKtPath = path.join(migrationDir, `R__6_view_${name}.kt`);
-    await fs.writeFile(viewKtPath, viewKt, 'utf-8');
+    await generatedFiles.write(viewKtPath, viewKt);
 
     console.log(`✅ Generated DB table + view migrations for ${name}`);
 }
@@ -1,8 +1,8 @@
-import fs from 'fs-extra'
 import { capitalize } from 'lodash-es'
 import path from 'path'
 import { CodegenEntityModel } from '../../../../model/index.js'
 import { toMustacheList } from '../../../../utils/to-mustache-list.js'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 import { KotlinEntityTemplate } from '../../templates/db/repository/KotlinEntityTemplate.js'
 
 export async function generateKotlinEntityFile(
@@ -34,7 +34,7 @@ export async function generateKotlinEntityFile(
         isAudited: entity.isAuditable,
     })
 
-    await fs.outputFile(outputPath, rendered)
+    await generatedFiles.write(outputPath, rendered)
     console.log(`✅ Generated Entity: ${outputPath}`)
 }
 
@@ -1,6 +1,6 @@
-import fs from 'fs-extra';
 import path from 'path';
 import { CodegenEntityModel } from '../../../../model/CodegenEntityModel.js';
+import { generatedFiles } from '../../../../utils/generated-file-writer.js';
 import { KotlinGenericCrudRepositoryTemplate } from '../../templates/db/repository/KotlinGenericCrudRepositoryTemplate.js';
 
 export async function generateKotlinGenericCrudRepositoryFile(
@@ -16,6 +16,6 @@ export async function generateKotlinGenericCrudRepositoryFile(
     };
 
     const rendered = KotlinGenericCrudRepositoryTemplate(context);
-    await fs.outputFile(outputFile, rendered);
+    await generatedFiles.write(outputFile, rendered);
     console.log(`✅ Generated Repository: ${outputFile}`);
 }
@@ -1,7 +1,7 @@
-import fs from 'fs-extra'
 import path from 'path'
 import { KotlinMappingExtensionsTemplate } from '../../templates/db/mapping/KotlinMappingExtensionsTemplate.js'
 import { CodegenEntityModel } from '../../../../model/CodegenEntityModel.js'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 
 export async function generateKotlinMappingExtensionsFile(
     entity: CodegenEntityModel,
@@ -12,6 +12,6 @@ export async function generateKotlinMappingExtensionsFile(
 
     const kotlinCode = KotlinMappingExtensionsTemplate(entity)
 
-    await fs.outputFile(outputFile, kotlinCode, 'utf-8')
+    await generatedFiles.write(outputFile, kotlinCode)
     console.log(`✅ Generated Kotlin Mapping Extensions: ${outputFile}`)
 }
@@ -1,7 +1,7 @@
-import fs from 'fs-extra'
 import path from 'path'
 import { KotlinMappingServiceTemplate } from '../../templates/db/mapping/KotlinMappingServiceTemplate.js'
 import { CodegenEntityModel } from '../../../../model/CodegenEntityModel.js'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 
 export async function generateKotlinMappingServiceFile(
     entity: CodegenEntityModel,
@@ -12,6 +12,6 @@ export async function generateKotlinMappingServiceFile(
 
     const kotlinCode = KotlinMappingServiceTemplate({ packageName: entity.packageName, entityName: entity.name })
 
-    await fs.outputFile(outputFile, kotlinCode, 'utf-8')
+    await generatedFiles.write(outputFile, kotlinCode)
     console.log(`✅ Generated Kotlin Mapping Service: ${outputFile}`)
 }
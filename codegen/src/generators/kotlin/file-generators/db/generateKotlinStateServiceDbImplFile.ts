@@ -1,6 +1,6 @@
-import fs from 'fs-extra'
 import path from 'path'
 import { CodegenEntityModel } from '../../../../model/index.js'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 import { KotlinKotlinStateServiceDbImplTemplate } from '../../templates/db/service/KotlinStateServiceDbImplTemplate.js'
 
 export async function generateKotlinStateServiceDbImplFile(
@@ -11,6 +11,6 @@ export async function generateKotlinStateServiceDbImplFile(
     const outputFile = path.join(repositoryDir, `${entity.name}StateServiceDb.kt`)
 
     const rendered = KotlinKotlinStateServiceDbImplTemplate({ entityName: entity.name, packageName: entity.packageName, entityFolder: entity.name.toLowerCase() })
-    await fs.outputFile(outputFile, rendered)
+    await generatedFiles.write(outputFile, rendered)
     console.log(`✅ Generated State Service DB Impl: ${outputFile}`)
 }
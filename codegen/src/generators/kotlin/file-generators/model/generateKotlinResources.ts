@@ -1,8 +1,8 @@
-import fs from 'fs-extra'
 import { camelCase } from 'lodash-es'
 import path from 'path'
 import { CodegenEntityModel } from '../../../../model/CodegenEntityModel.js'
 import { toMustacheList } from '../../../../utils/index.js'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 import { KotlinResourceTemplate, KotlinResourceTemplateVariant } from '../../templates/model/KotlinResourceTemplate.js'
 
 export async function generateKotlinResources(
@@ -44,7 +44,7 @@ export async function generateKotlinResources(
             imports: toMustacheList(entity.importStatements),
         })
 
-        await fs.outputFile(outputFile, rendered)
+        await generatedFiles.write(outputFile, rendered)
         console.log(`✅ Generated ${outputFile}`)
     }
 }
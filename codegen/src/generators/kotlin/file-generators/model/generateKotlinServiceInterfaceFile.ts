@@ -1,6 +1,6 @@
-import fs from 'fs-extra'
 import { camelCase } from 'lodash-es'
 import path from 'path'
+import { generatedFiles } from '../../../../utils/generated-file-writer.js'
 import { KotlinStateServiceInterfaceTemplate } from '../../templates/model/KotlinStateServiceInterfaceTemplate.js'
 
 export async function generateKotlinServiceInterfaceFile(
@@ -12,6 +12,6 @@ export async function generateKotlinServiceInterfaceFile(
     const outputFile = path.join(repositoryDir, `${entityName}StateService.kt`)
 
     const rendered = KotlinStateServiceInterfaceTemplate({ entityName, entityFolder: camelCase(entityName), packageName })
-    await fs.outputFile(outputFile, rendered)
+    await generatedFiles.write(outputFile, rendered)
     console.log(`✅ Generated Service Interface: ${outputFile}`)
 }
@@ -77,6 +77,8 @@ CREATE UNIQUE INDEX IF NOT EXISTS ak_{{name}}_uuid ON {{name}} USING btree (uuid
 const tenantIndexesExtra = String.raw`
 CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id ON {{name}} USING btree (tenant_id);
 CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id_expiry ON {{name}} USING btree (tenant_id, expiry_timestamp);
+CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id_last_changed_xid ON {{name}} USING btree (tenant_id, last_changed_xid, id);
+CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id_active ON {{name}} USING btree (tenant_id, id) WHERE expiry_timestamp = 'infinity';
 `
 
 // language=mustache
@@ -84,6 +86,14 @@ const businessUnitIndexesExtra = String.raw`
 CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id ON {{name}} USING btree (tenant_id);
 CREATE INDEX IF NOT EXISTS idx_{{name}}_business_unit_id ON {{name}} USING btree (business_unit_id);
 CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id_expiry ON {{name}} USING btree (tenant_id, expiry_timestamp);
+CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id_last_changed_xid ON {{name}} USING btree (tenant_id, last_changed_xid, id);
+CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id_active ON {{name}} USING btree (tenant_id, id) WHERE expiry_timestamp = 'infinity';
+CREATE INDEX IF NOT EXISTS idx_{{name}}_tenant_id_business_unit_id_active ON {{name}} USING btree (tenant_id, business_unit_id, id) WHERE expiry_timestamp = 'infinity';
+`
+
+// language=mustache
+const unscopedIndexesExtra = String.raw`
+CREATE INDEX IF NOT EXISTS idx_{{name}}_last_changed_xid ON {{name}} USING btree (last_changed_xid, id);
 `
 
 // language=mustache
@@ -136,6 +146,10 @@ export const CreateTableSQLTemplate = (props: CreateTableSQLProps): string => {
     // 3. Indexes
     output.push(Mustache.render(genericIndexesTemplate, context))
 
+    if (scope === 'unscoped') {
+        output.push(Mustache.render(unscopedIndexesExtra, context))
+    }
+
     if (scope === 'tenantScoped') {
         output.push(Mustache.render(tenantIndexesExtra, context))
     }
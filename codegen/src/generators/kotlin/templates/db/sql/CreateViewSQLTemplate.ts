@@ -1,9 +1,26 @@
 import Mustache from 'mustache'
 
+/**
+ * How scoped views filter rows to the current request scope.
+ *
+ * - `function` (default): views filter on `expiry_timestamp > now()` and rely on the tenant
+ *   schema for isolation, using the plpgsql scope functions only for unscoped business unit views.
+ * - `inline`: views filter on `tenant_id = current_tenant_scope() AND expiry_timestamp = 'infinity'`,
+ *   and business unit views also on `business_unit_id = current_business_unit_scope()`. The
+ *   accessors are inlinable SQL functions, so the predicates are matched against the
+ *   tenant-leading partial indexes from CreateTableSQLTemplate.
+ *
+ * The modes do not select the same rows. Inline views add the scope filter themselves, so a
+ * session without `tenant.id` (scope 0) sees no rows, and they hide rows whose expiry is set
+ * in the future, which `expiry_timestamp > now()` still returns.
+ */
+export type ScopePredicateMode = 'function' | 'inline';
+
 export interface CreateViewSQLProps {
     name: string;
     type: 'generic' | 'unscoped' | 'tenantScoped' | 'businessUnitScoped';
     unscoped?: boolean;
+    scopePredicates?: ScopePredicateMode;   // defaults to 'function'
 }
 
 // --- TEMPLATES ---
@@ -63,6 +80,30 @@ WHERE
 WITH CHECK OPTION;
 `
 
+// language=mustache
+const inlineTenantScopedViewTemplate = String.raw`
+DROP VIEW IF EXISTS vw_{{name}} CASCADE;
+CREATE OR REPLACE VIEW vw_{{name}} WITH (security_barrier)
+AS
+SELECT *
+FROM {{name}}
+WHERE
+  tenant_id = current_tenant_scope() AND expiry_timestamp = 'infinity'
+WITH CHECK OPTION;
+`
+
+// language=mustache
+const inlineBusinessUnitScopedViewTemplate = String.raw`
+DROP VIEW IF EXISTS vw_{{name}} CASCADE;
+CREATE OR REPLACE VIEW vw_{{name}} WITH (security_barrier)
+AS
+SELECT *
+FROM {{name}}
+WHERE
+  tenant_id = current_tenant_scope() AND business_unit_id = current_business_unit_scope() AND expiry_timestamp = 'infinity'
+WITH CHECK OPTION;
+`
+
 // language=mustache
 const dropInsertTriggerTemplate = String.raw`
 DROP TRIGGER IF EXISTS trig_{{name}}_insert ON vw_{{name}};
@@ -128,12 +169,13 @@ END;
 $body$ LANGUAGE 'plpgsql';
 `
 
-export const CreateViewSQLTemplate = ({ name, type, unscoped = false }: CreateViewSQLProps): string => {
+export const CreateViewSQLTemplate = ({ name, type, unscoped = false, scopePredicates = 'function' }: CreateViewSQLProps): string => {
     const context = {
         name,
         NAME: name.toUpperCase(),
         unscoped,
     }
+    const inline = scopePredicates === 'inline'
 
     switch (type) {
         case 'generic':
@@ -149,7 +191,7 @@ export const CreateViewSQLTemplate = ({ name, type, unscoped = false }: CreateVi
 
         case 'tenantScoped':
             return [
-                Mustache.render(tenantScopedViewTemplate, context),
+                Mustache.render(inline ? inlineTenantScopedViewTemplate : tenantScopedViewTemplate, context),
                 Mustache.render(insertTriggerFnTenantTemplate, context),
                 Mustache.render(dropInsertTriggerTemplate, context),
                 Mustache.render(createInsertTriggerTemplate, context),
@@ -158,7 +200,7 @@ export const CreateViewSQLTemplate = ({ name, type, unscoped = false }: CreateVi
 
         case 'businessUnitScoped':
             return [
-                Mustache.render(businessUnitScopedViewTemplate, context),
+                Mustache.render(inline ? inlineBusinessUnitScopedViewTemplate : businessUnitScopedViewTemplate, context),
                 Mustache.render(insertTriggerFnBusinessUnitTemplate, context),
                 Mustache.render(dropInsertTriggerTemplate, context),
                 Mustache.render(createInsertTriggerTemplate, context),
@@ -4,8 +4,10 @@ import { JdlEntity } from './models/JdlEntity.js'
 const { parseFromFiles } = requireCjs('jhipster-core')
 
 export function loadJdlEntities(jdlPath: string): JdlEntity[] {
-    const jdl = parseFromFiles([jdlPath])
+    return toJdlEntities(parseFromFiles([jdlPath]))
+}
 
+export function toJdlEntities(jdl: any): JdlEntity[] {
     if (!jdl.entities || Object.keys(jdl.entities).length === 0) {
         throw new Error('❌ No entities found in JDL.')
     }
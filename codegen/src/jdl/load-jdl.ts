@@ -0,0 +1,25 @@
+import path from 'path'
+import { requireCjs } from '../utils/commonjs-loader.js'
+import { toJdlEntities } from './load-entities.js'
+import { toJdlModules } from './load-modules.js'
+import { JdlEntity } from './models/JdlEntity.js'
+import { JdlModule } from './models/JdlModule.js'
+
+const { parseFromFiles } = requireCjs('jhipster-core')
+
+export interface LoadedJdl {
+    entities: JdlEntity[]
+    modules: JdlModule[]
+}
+
+/**
+ * Parses a JDL file once and returns both its entities and its modules.
+ */
+export function loadJdl(jdlFilePath: string): LoadedJdl {
+    const jdl = parseFromFiles([path.resolve(jdlFilePath)])
+
+    return {
+        entities: toJdlEntities(jdl),
+        modules: toJdlModules(jdl),
+    }
+}
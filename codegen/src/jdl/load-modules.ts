@@ -5,8 +5,10 @@ import { JdlModule } from './models/JdlModule.js'
 
 export function loadJdlModules(jdlFilePath: string): JdlModule[] {
     const absPath = path.resolve(jdlFilePath)
-    const jdl = parseFromFiles([absPath])
+    return toJdlModules(parseFromFiles([absPath]))
+}
 
+export function toJdlModules(jdl: any): JdlModule[] {
     if (!jdl.applications || Object.keys(jdl.applications).length === 0) {
         throw new Error('❌ No applications found in JDL.')
     }
@@ -1,23 +1,12 @@
 #!/usr/bin/env node
-import { Command } from 'commander'
+import { Command, InvalidArgumentError, Option } from 'commander'
+import fs from 'fs'
+import os from 'os'
 import path from 'path'
 import { CodegenConfig } from './config/codegen-config.js'
-import {
-    generateCommonModuleFiles,
-    generateKotlinDbMigrationFiles,
-    generateKotlinEntityFile,
-    generateKotlinGenericCrudRepositoryFile,
-    generateKotlinMappingExtensionsFile,
-    generateKotlinMappingServiceFile,
-    generateKotlinResources,
-    generateKotlinServiceInterfaceFile,
-    generateKotlinStateServiceDbImplFile,
-} from './generators/kotlin/file-generators/index.js'
-import { KotlinModuleType } from './generators/kotlin/model/KotlinModule.js'
-import { loadJdlEntities } from './jdl/load-entities.js'
-import { loadJdlModules } from './jdl/load-modules.js'
-import { mapJdlEntityToCodegenEntity } from './mapper/index.js'
-import { mapJdlModuleToKotlinModule } from './mapper/JdlModuleToKotlinModule.js'
+import { generateFromJdl, GenerateOptions, GenerateResult } from './generate-from-jdl.js'
+
+const WATCH_DEBOUNCE_MS = 200
 
 const program = new Command()
 
@@ -26,94 +15,68 @@ program
     .description('🚀 Generate Kotlin backend modules from JDL files')
     .option('--jdl <path>', 'Path to JDL file', './jdl/core-organisation.jdl')
     .option('--out-dir <dir>', 'Base output directory')
+    .option('--concurrency <n>', 'Maximum number of modules and entities generated in parallel', parsePositiveInt, os.availableParallelism())
+    .option('--changed-only', 'Only regenerate modules and entities whose JDL changed since the last run', false)
+    .option('--watch', 'Watch the JDL file and regenerate the entities affected by each edit', false)
+    .addOption(
+        new Option('--scope-predicates <mode>', 'How scoped views filter rows: by expiry only, or also by the session scope through inlinable SQL accessors')
+            .choices(['function', 'inline'])
+            .default('function'),
+    )
     .action(async (options) => {
-        const jdlPath = path.resolve(process.cwd(), options.jdl)
-        const outputDir = options.outDir
-            ? path.resolve(process.cwd(), options.outDir)
-            : CodegenConfig.kotlin.defaultOutputDir
-
-        console.log(`📥 Loading JDL from: ${jdlPath}`)
-        const jdlEntities = loadJdlEntities(jdlPath)
-        const jdlModules = loadJdlModules(jdlPath)
-        console.log(`✅ Successfully loaded ${jdlEntities.length} entities and ${jdlModules.length} modules.`)
-
-        for (const module of jdlModules) {
-            console.log(`\n🔄 Processing Module: ${module.name}`)
-            const basePackage = module.config.packageName
-
-            const entitiesInModule = jdlEntities.filter(entity =>
-                module.entities?.entityList?.includes(entity.name),
-            )
-
-            console.log(`🗂️ Found ${entitiesInModule.length} entities in module: ${module.name}`)
-
-            const codegenEntities = entitiesInModule.map(entity =>
-                mapJdlEntityToCodegenEntity(entity, 'net.blugrid.api.core'),
-            )
-
-            // === Generate API MODEL MODULE ===
-            const kotlinModelModule = mapJdlModuleToKotlinModule({
-                jdlModule: module,
-                moduleType: KotlinModuleType.Model,
-            })
-
-            const modelModuleOutputPath = `${outputDir}/core-${module.name}-api/${kotlinModelModule.baseName}-${kotlinModelModule.moduleType}`
-
-            console.log(`\n📦 Generating API Model Module: ${kotlinModelModule.baseName}`)
-            await generateCommonModuleFiles(kotlinModelModule, modelModuleOutputPath)
-
-            for (const entity of codegenEntities) {
-                const resourceOutputPath = path.join(modelModuleOutputPath, 'src/main/kotlin', entity.packageName.replace(/\./g, '/'))
-                console.log(`🧱 Generating Resource Models and Interfaces for: ${entity.name}`)
-                await generateKotlinResources(entity, resourceOutputPath)
-                await generateKotlinServiceInterfaceFile(entity.name, kotlinModelModule.packageName, resourceOutputPath)
-            }
-
-            // === Generate DB MODULE ===
-            const kotlinDbModule = mapJdlModuleToKotlinModule({
-                jdlModule: module,
-                moduleType: KotlinModuleType.Db,
-                coreDependencies: [{ name: module.name, type: KotlinModuleType.Model }],
-                includeDb: true,
-                includeTest: true,
-            })
-
-            const dbModuleOutputPath = `${outputDir}/core-${module.name}-api/${kotlinDbModule.baseName}-${kotlinDbModule.moduleType}`
+        const generateOptions: GenerateOptions = {
+            jdlPath: path.resolve(process.cwd(), options.jdl),
+            outputDir: options.outDir
+                ? path.resolve(process.cwd(), options.outDir)
+                : CodegenConfig.kotlin.defaultOutputDir,
+            concurrency: options.concurrency,
+            changedOnly: options.changedOnly || options.watch,
+            scopePredicates: options.scopePredicates,
+        }
 
-            console.log(`\n🗄️  Generating DB Module: ${kotlinDbModule.baseName}`)
-            await generateCommonModuleFiles(kotlinDbModule, dbModuleOutputPath)
+        logResult(await generateFromJdl(generateOptions))
 
-            for (const entity of codegenEntities) {
-                const dbPackageOutputPath = path.join(dbModuleOutputPath, 'src/main/kotlin', entity.packageName.replace(/\./g, '/'))
-                console.log(`📄 Generating DB Entity, Migration, Repository, and Service implementation for: ${entity.name}`)
-                await generateKotlinDbMigrationFiles(entity, dbPackageOutputPath)
-                await generateKotlinEntityFile(entity, dbPackageOutputPath)
-                await generateKotlinMappingExtensionsFile(entity, dbPackageOutputPath)
-                await generateKotlinMappingServiceFile(entity, dbPackageOutputPath)
-                await generateKotlinGenericCrudRepositoryFile(entity, dbPackageOutputPath)
-                await generateKotlinStateServiceDbImplFile(entity, dbPackageOutputPath)
-            }
+        if (options.watch) {
+            watchJdl(generateOptions)
+        }
+    })
 
-            // === Generate API REST SERVER MODULE ===
-            const kotlinApiServerModule = mapJdlModuleToKotlinModule({
-                jdlModule: module,
-                moduleType: KotlinModuleType.Api,
-                coreDependencies: [{ name: module.name, type: KotlinModuleType.Model }],
-                includeDb: true,
-                includeTest: true,
-            })
+program.parse()
 
-            const apiServerModuleOutputPath = `${outputDir}/core-${module.name}-api/${kotlinApiServerModule.baseName}`
+function watchJdl(options: GenerateOptions) {
+    let timer: NodeJS.Timeout | undefined
+    let running: Promise<void> = Promise.resolve()
 
-            console.log(`\n🌐 Generating API REST Server Module: ${kotlinApiServerModule.baseName}`)
-            await generateCommonModuleFiles(kotlinApiServerModule, apiServerModuleOutputPath)
+    console.log(`\n👀 Watching ${options.jdlPath} for changes...`)
 
-            for (const entity of entitiesInModule) {
-                console.log(`📌 Entity processed: ${entity.name}`)
-            }
+    // Watch the directory rather than the file, since editors often save by replacing the file.
+    // Regenerate once the file has settled and never run two generations against the same
+    // output directory at once
+    fs.watch(path.dirname(options.jdlPath), (_event, fileName) => {
+        if (fileName !== path.basename(options.jdlPath)) {
+            return
         }
-
-        console.log('\n✅ Code generation complete! 🎉')
+        clearTimeout(timer)
+        timer = setTimeout(() => {
+            running = running
+                .then(async () => logResult(await generateFromJdl(options)))
+                .catch(error => console.error(`❌ Code generation failed: ${error.message ?? error}`))
+        }, WATCH_DEBOUNCE_MS)
     })
-
-program.parse()
+}
+
+function logResult(result: GenerateResult) {
+    console.log(
+        `\n✅ Code generation complete! 🎉 ` +
+        `${result.regeneratedModules}/${result.modules} modules and ${result.regeneratedEntities}/${result.entities} entities generated, ` +
+        `${result.written} files written, ${result.unchanged} unchanged in ${Math.round(result.elapsedMs)} ms`,
+    )
+}
+
+function parsePositiveInt(value: string): number {
+    const parsed = Number.parseInt(value, 10)
+    if (!Number.isInteger(parsed) || parsed < 1) {
+        throw new InvalidArgumentError('Must be a positive integer.')
+    }
+    return parsed
+}
@@ -0,0 +1,125 @@
+import { createHash } from 'crypto'
+import fs from 'fs-extra'
+import path from 'path'
+
+export const MANIFEST_FILE_NAME = '.codegen-manifest.json'
+const MANIFEST_VERSION = 1
+
+/**
+ * Content hashes of every generated file, relative to the output directory, plus a fingerprint
+ * of the JDL inputs each module and entity was last generated from.
+ */
+export interface GenerationManifest {
+    version: number
+    units: Record<string, string>
+    files: Record<string, string>
+}
+
+export interface GeneratedFileStats {
+    written: number
+    unchanged: number
+}
+
+export function sha256(content: string): string {
+    return createHash('sha256').update(content).digest('hex')
+}
+
+/**
+ * Writes generated files through a manifest of content hashes, so a file whose rendered content
+ * has not changed since the last run is left untouched on disk and keeps its timestamp.
+ *
+ * Full runs compare against the content on disk, so they always restore hand edited or
+ * corrupted generated files. Incremental runs trust the manifest without reading files back,
+ * so there a hand edit is only replaced once its rendered content changes.
+ */
+export class GeneratedFileWriter {
+    private outputDir: string | undefined
+    private incremental = false
+    private previous: GenerationManifest = emptyManifest()
+    private current: GenerationManifest = emptyManifest()
+    private stats: GeneratedFileStats = { written: 0, unchanged: 0 }
+
+    /**
+     * Starts a run against `outputDir`. With `incremental` the entries of units that are not
+     * regenerated in this run are carried over, otherwise the manifest is rebuilt from scratch.
+     */
+    async begin(outputDir: string, incremental: boolean): Promise<GenerationManifest> {
+        this.outputDir = outputDir
+        this.incremental = incremental
+        this.previous = await readManifest(outputDir)
+        this.current = incremental
+            ? { version: MANIFEST_VERSION, units: { ...this.previous.units }, files: { ...this.previous.files } }
+            : emptyManifest()
+        this.stats = { written: 0, unchanged: 0 }
+        return this.previous
+    }
+
+    recordUnit(unit: string, fingerprint: string): void {
+        this.current.units[unit] = fingerprint
+    }
+
+    async write(file: string, content: string): Promise<boolean> {
+        const hash = sha256(content)
+        const key = this.outputDir ? path.relative(this.outputDir, file) : file
+        this.current.files[key] = hash
+
+        const unchanged = this.incremental
+            ? this.previous.files[key] === hash && await fs.pathExists(file)
+            : await diskHash(file) === hash
+        if (unchanged) {
+            this.stats.unchanged++
+            return false
+        }
+
+        await fs.outputFile(file, content, 'utf-8')
+        this.stats.written++
+        return true
+    }
+
+    /**
+     * Persists the manifest of this run and returns the write counts.
+     */
+    async commit(liveUnits?: Set<string>): Promise<GeneratedFileStats> {
+        if (liveUnits) {
+            for (const unit of Object.keys(this.current.units)) {
+                if (!liveUnits.has(unit)) {
+                    delete this.current.units[unit]
+                }
+            }
+        }
+
+        if (this.outputDir) {
+            await fs.outputJson(path.join(this.outputDir, MANIFEST_FILE_NAME), this.current, { spaces: 2 })
+        }
+        this.outputDir = undefined
+        this.incremental = false
+        return { ...this.stats }
+    }
+}
+
+async function readManifest(outputDir: string): Promise<GenerationManifest> {
+    const manifestPath = path.join(outputDir, MANIFEST_FILE_NAME)
+    try {
+        const manifest = await fs.readJson(manifestPath)
+        return manifest?.version === MANIFEST_VERSION ? manifest : emptyManifest()
+    } catch {
+        return emptyManifest()
+    }
+}
+
+async function diskHash(file: string): Promise<string | undefined> {
+    try {
+        return sha256(await fs.readFile(file, 'utf-8'))
+    } catch {
+        return undefined
+    }
+}
+
+function emptyManifest(): GenerationManifest {
+    return { version: MANIFEST_VERSION, units: {}, files: {} }
+}
+
+/**
+ * Shared writer used by all file generators; writes outside a run go straight to disk.
+ */
+export const generatedFiles = new GeneratedFileWriter()
@@ -2,3 +2,5 @@ export * from './commonjs-loader.js'
 export * from './resolve-template.js'
 export * from './to-mustache-list.js'
 export * from './resolveFromProjectRoot.js'
+export * from './generated-file-writer.js'
+export * from './run-with-concurrency.js'
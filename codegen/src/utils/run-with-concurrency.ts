@@ -0,0 +1,24 @@
+/**
+ * Runs tasks with at most `limit` of them in flight and returns their results in task order.
+ * The first failure rejects the returned promise once the in-flight tasks have settled.
+ */
+export async function runWithConcurrency<T>(tasks: (() => Promise<T>)[], limit: number): Promise<T[]> {
+    const results: T[] = new Array(tasks.length)
+    let next = 0
+
+    async function worker(): Promise<void> {
+        while (next < tasks.length) {
+            const index = next++
+            results[index] = await tasks[index]()
+        }
+    }
+
+    const workers = Array.from({ length: Math.max(1, Math.min(limit, tasks.length)) }, () => worker())
+    const settled = await Promise.allSettled(workers)
+    const failure = settled.find((s): s is PromiseRejectedResult => s.status === 'rejected')
+    if (failure) {
+        throw failure.reason
+    }
+
+    return results
+}
@@ -14,6 +14,7 @@ import net.blugrid.common.model.resource.ResourceType
 import net.blugrid.common.model.resource.UnscopedResource
 import net.blugrid.platform.serialization.objectToJson
 import net.blugrid.platform.logging.logger
+import net.blugrid.platform.logging.trace
 import net.blugrid.common.domain.IdentityID
 
 @Singleton
@@ -31,7 +32,7 @@ class AuditInterceptor(
         val resourceType = getResourceType(resource)
         val tenantId = getTenantId(resource)
 
-        log.trace("Intercepted audit $eventType event for $resourceType resource:  ${objectToJson(resource)}")
+        log.trace { "Intercepted audit $eventType event for $resourceType resource:  ${objectToJson(resource)}" }
 
         if (resource is BaseAuditedResource<*>) {
             val audit = resource.audit ?: run {
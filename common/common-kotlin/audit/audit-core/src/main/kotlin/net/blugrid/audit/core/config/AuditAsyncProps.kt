@@ -0,0 +1,39 @@
+package net.blugrid.audit.core.config
+
+import io.micronaut.context.annotation.ConfigurationProperties
+import io.micronaut.core.bind.annotation.Bindable
+import java.time.Duration
+
+@ConfigurationProperties("audit.async")
+interface AuditAsyncProps {
+
+    /**
+     * Write audit events from a background queue instead of inside the caller's request
+     */
+    @get:Bindable(defaultValue = "false")
+    val enabled: Boolean
+
+    @get:Bindable(defaultValue = "10000")
+    val queueCapacity: Int
+
+    /**
+     * Maximum number of events written per batch
+     */
+    @get:Bindable(defaultValue = "500")
+    val flushSize: Int
+
+    /**
+     * Maximum time an event waits for a batch to fill before it is written
+     */
+    @get:Bindable(defaultValue = "200ms")
+    val flushInterval: Duration
+
+    @get:Bindable(defaultValue = "BLOCK")
+    val overflowPolicy: AuditQueueOverflowPolicy
+
+    /**
+     * Maximum time to wait for queued events to be written on shutdown
+     */
+    @get:Bindable(defaultValue = "30s")
+    val shutdownTimeout: Duration
+}
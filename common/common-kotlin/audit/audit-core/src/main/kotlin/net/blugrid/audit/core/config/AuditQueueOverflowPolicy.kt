@@ -0,0 +1,16 @@
+package net.blugrid.audit.core.config
+
+/**
+ * Behaviour when the async audit queue is full
+ */
+enum class AuditQueueOverflowPolicy {
+    /**
+     * Block the publishing thread until the writer frees space
+     */
+    BLOCK,
+
+    /**
+     * Discard the event and count it as dropped
+     */
+    DROP,
+}
@@ -2,14 +2,19 @@ package net.blugrid.audit.core.event
 
 import io.micronaut.runtime.event.annotation.EventListener
 import jakarta.inject.Singleton
+import net.blugrid.audit.core.config.AuditAsyncProps
 import net.blugrid.audit.core.service.AuditEventLogService
+import net.blugrid.audit.core.service.AuditEventQueue
 import net.blugrid.platform.logging.logger
+import net.blugrid.platform.logging.trace
 import net.blugrid.common.model.audit.AuditEvent
 import net.blugrid.platform.serialization.objectToJson
 
 @Singleton
 open class UpdateAuditLogAuditEventHandler(
-    private val auditEventLogService: AuditEventLogService
+    private val auditEventLogService: AuditEventLogService,
+    private val auditEventQueue: AuditEventQueue,
+    private val auditAsyncProps: AuditAsyncProps,
 ) {
 
     private val log = logger()
@@ -17,7 +22,11 @@ open class UpdateAuditLogAuditEventHandler(
     @EventListener
     open fun handle(event: AuditEvent) {
         log.debug("received audit ${event.auditEventType} event for ${event.resourceType}")
-        log.trace("received audit ${event.auditEventType} event for ${event.resourceType}:  ${objectToJson(event)}")
-        auditEventLogService.createAuditEventLog(event)
+        log.trace { "received audit ${event.auditEventType} event for ${event.resourceType}:  ${objectToJson(event)}" }
+        if (auditAsyncProps.enabled) {
+            auditEventQueue.enqueue(event)
+        } else {
+            auditEventLogService.createAuditEventLog(event)
+        }
     }
 }
@@ -0,0 +1,56 @@
+package net.blugrid.audit.core.repository
+
+import io.hypersistence.utils.hibernate.type.util.Configuration
+import jakarta.inject.Singleton
+import jakarta.persistence.EntityManager
+import net.blugrid.audit.core.repository.model.AuditEventLogInsertEntity
+import org.hibernate.Session
+
+/**
+ * Writes audit rows with multi-row INSERT statements into vw_audit_event_log_insert
+ * The view's INSTEAD OF trigger still assigns versions and routes each row to its yearly partition
+ *
+ * Resources are serialized with the same mapper as [JsonBinaryType][io.hypersistence.utils.hibernate.type.json.JsonBinaryType]
+ * on AuditEventLogInsertEntity, so batched and single-row inserts store identical JSON.
+ */
+@Singleton
+class AuditEventLogBatchInsertRepository(
+    private val entityManager: EntityManager,
+) {
+
+    fun insertAll(entities: List<AuditEventLogInsertEntity>) {
+        if (entities.isEmpty()) return
+
+        val objectMapperWrapper = Configuration.INSTANCE.objectMapperWrapper
+
+        entityManager.unwrap(Session::class.java).doWork { connection ->
+            entities.chunked(MAX_ROWS_PER_STATEMENT).forEach { chunk ->
+                connection.prepareStatement(insertSql(chunk.size)).use { statement ->
+                    var index = 1
+                    chunk.forEach { entity ->
+                        statement.setObject(index++, entity.id)
+                        statement.setLong(index++, entity.resourceId)
+                        statement.setString(index++, entity.resourceType.name)
+                        statement.setString(index++, entity.auditEventType.name)
+                        statement.setString(index++, objectMapperWrapper.toString(entity.resource))
+                        statement.setLong(index++, entity.tenantId)
+                        statement.setLong(index++, entity.sessionId)
+                        statement.setObject(index++, entity.auditEventTimestamp)
+                    }
+                    statement.executeUpdate()
+                }
+            }
+        }
+    }
+
+    private fun insertSql(rows: Int): String =
+        "INSERT INTO vw_audit_event_log_insert " +
+            "(uuid, resource_id, resource_type, audit_event_type, resource, tenant_id, session_id, timestamp) VALUES " +
+            List(rows) { ROW_PLACEHOLDERS }.joinToString(", ")
+
+    companion object {
+        // 8 parameters per row keeps each statement well below the 32767 bind parameter limit
+        private const val MAX_ROWS_PER_STATEMENT = 1000
+        private const val ROW_PLACEHOLDERS = "(?, ?, ?, ?, CAST(? AS jsonb), ?, ?, ?)"
+    }
+}
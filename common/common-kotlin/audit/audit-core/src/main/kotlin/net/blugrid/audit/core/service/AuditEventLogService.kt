@@ -7,6 +7,7 @@ import jakarta.inject.Singleton
 import net.blugrid.audit.core.mapping.toAuditEventLog
 import net.blugrid.audit.core.mapping.toAuditEventLogUpdateEntity
 import net.blugrid.audit.core.model.AuditEventLogQuery
+import net.blugrid.audit.core.repository.AuditEventLogBatchInsertRepository
 import net.blugrid.audit.core.repository.AuditEventLogInsertRepository
 import net.blugrid.audit.core.repository.AuditEventLogReadRepository
 import net.blugrid.audit.core.repository.AuditEventLogReadSpecifications.auditLogEventQueryToSpecification
@@ -19,6 +20,7 @@ import jakarta.transaction.Transactional.TxType.REQUIRES_NEW
 
 interface AuditEventLogService {
     fun createAuditEventLog(auditEventLog: AuditEvent)
+    fun createAuditEventLogs(auditEventLogs: List<AuditEvent>)
     fun findAllByResourceId(resourceType: ResourceType, resourceId: Long): List<AuditEventLog>
     fun searchAuditEventLogs(query: AuditEventLogQuery, pageRequest: Pageable): Page<AuditEventLog?>
     fun isEmpty(resourceType: ResourceType): Boolean
@@ -28,6 +30,7 @@ interface AuditEventLogService {
 open class AuditEventLogServiceImpl(
     private val auditEventLogInsertRepository: AuditEventLogInsertRepository,
     private val auditEventLogReadRepository: AuditEventLogReadRepository,
+    private val auditEventLogBatchInsertRepository: AuditEventLogBatchInsertRepository,
 ) : AuditEventLogService {
 
 
@@ -36,6 +39,18 @@ open class AuditEventLogServiceImpl(
         auditEventLogInsertRepository.save(auditEventLog.toAuditEventLogUpdateEntity())
     }
 
+    /**
+     * Write events in publish order, grouped by yearly partition (resource type, year)
+     * The sort is stable and a resource's events never move back a year, so per-resource order is kept
+     */
+    @Transactional(value = REQUIRES_NEW)
+    override fun createAuditEventLogs(auditEventLogs: List<AuditEvent>) {
+        auditEventLogs
+            .sortedWith(compareBy({ it.resourceType }, { it.auditEventTimestamp.year }))
+            .map { it.toAuditEventLogUpdateEntity() }
+            .let { auditEventLogBatchInsertRepository.insertAll(it) }
+    }
+
     @ReadOnly
     override fun findAllByResourceId(resourceType: ResourceType, resourceId: Long): List<AuditEventLog> {
         return auditEventLogReadRepository.findAll(hasResourceTypeAndResourceId(resourceType, resourceId))
@@ -0,0 +1,192 @@
+package net.blugrid.audit.core.service
+
+import jakarta.annotation.PreDestroy
+import jakarta.inject.Singleton
+import net.blugrid.audit.core.config.AuditAsyncProps
+import net.blugrid.audit.core.config.AuditQueueOverflowPolicy
+import net.blugrid.common.model.audit.AuditEvent
+import net.blugrid.platform.logging.logger
+import java.util.concurrent.ArrayBlockingQueue
+import java.util.concurrent.TimeUnit
+import java.util.concurrent.atomic.AtomicInteger
+import java.util.concurrent.atomic.AtomicLong
+import java.util.concurrent.locks.ReentrantReadWriteLock
+import kotlin.concurrent.read
+import kotlin.concurrent.write
+
+/**
+ * Bounded in-memory queue that writes audit events in batches from a single background writer
+ *
+ * A single writer draining a FIFO queue keeps events for the same resource in publish order.
+ * Events published after shutdown has started are written synchronously on the caller's thread.
+ */
+@Singleton
+open class AuditEventQueue(
+    private val auditEventLogService: AuditEventLogService,
+    private val props: AuditAsyncProps,
+) {
+
+    private val log = logger()
+
+    private val queue = ArrayBlockingQueue<AuditEvent>(props.queueCapacity)
+    private val lifecycleLock = ReentrantReadWriteLock()
+
+    @Volatile
+    private var writer: Thread? = null
+
+    @Volatile
+    private var closed = false
+
+    private val enqueued = AtomicLong()
+    private val dropped = AtomicLong()
+    private val written = AtomicLong()
+    private val failed = AtomicLong()
+    private val batches = AtomicLong()
+    private val lastBatchSize = AtomicInteger()
+    private val maxBatchSize = AtomicInteger()
+    private val lastFlushNanos = AtomicLong()
+    private val totalFlushNanos = AtomicLong()
+
+    open fun enqueue(event: AuditEvent) {
+        lifecycleLock.read {
+            if (closed) {
+                log.debug("Audit queue closed, writing ${event.resourceType} event synchronously")
+                auditEventLogService.createAuditEventLog(event)
+                return
+            }
+
+            ensureWriterStarted()
+
+            when (props.overflowPolicy) {
+                AuditQueueOverflowPolicy.BLOCK -> queue.put(event)
+                AuditQueueOverflowPolicy.DROP -> if (!queue.offer(event)) {
+                    dropped.incrementAndGet()
+                    log.warn("Audit queue full, dropped ${event.auditEventType} event for ${event.resourceType} id: ${event.resourceId.value}")
+                    return
+                }
+            }
+            enqueued.incrementAndGet()
+        }
+    }
+
+    open val stats: AuditEventQueueStats
+        get() = AuditEventQueueStats(
+            queueDepth = queue.size,
+            enqueued = enqueued.get(),
+            dropped = dropped.get(),
+            written = written.get(),
+            failed = failed.get(),
+            batches = batches.get(),
+            lastBatchSize = lastBatchSize.get(),
+            maxBatchSize = maxBatchSize.get(),
+            lastFlushMillis = lastFlushNanos.get() / NANOS_PER_MILLI,
+            totalFlushMillis = totalFlushNanos.get() / NANOS_PER_MILLI,
+        )
+
+    /**
+     * Stop accepting events and wait for the writer to drain the queue
+     */
+    @PreDestroy
+    open fun close() {
+        lifecycleLock.write {
+            if (closed) return
+            closed = true
+        }
+
+        writer?.let { thread ->
+            thread.join(props.shutdownTimeout.toMillis())
+            if (thread.isAlive) {
+                log.warn("Audit writer did not finish within ${props.shutdownTimeout}, ${queue.size} events still queued")
+                return
+            }
+        }
+
+        // Picks up events the writer never saw, e.g. when it was never started
+        val remaining = ArrayList<AuditEvent>()
+        queue.drainTo(remaining)
+        if (remaining.isNotEmpty()) {
+            flush(remaining)
+        }
+        log.info("Audit queue closed: {}", stats)
+    }
+
+    private fun ensureWriterStarted() {
+        if (writer != null) return
+        synchronized(this) {
+            if (writer == null) {
+                writer = Thread(::runWriter, "audit-event-writer").apply {
+                    isDaemon = true
+                    start()
+                }
+            }
+        }
+    }
+
+    private fun runWriter() {
+        val flushSize = props.flushSize.coerceAtLeast(1)
+        val flushIntervalNanos = props.flushInterval.toNanos()
+        val batch = ArrayList<AuditEvent>(flushSize)
+
+        try {
+            while (true) {
+                val first = queue.poll(flushIntervalNanos, TimeUnit.NANOSECONDS)
+                if (first == null) {
+                    if (closed) break
+                    continue
+                }
+
+                batch.add(first)
+                fillBatch(batch, flushSize, System.nanoTime() + flushIntervalNanos)
+                flush(batch)
+                batch.clear()
+            }
+        } catch (e: InterruptedException) {
+            Thread.currentThread().interrupt()
+            queue.drainTo(batch)
+            if (batch.isNotEmpty()) flush(batch)
+        }
+    }
+
+    private fun fillBatch(batch: MutableList<AuditEvent>, flushSize: Int, deadlineNanos: Long) {
+        while (batch.size < flushSize) {
+            queue.drainTo(batch, flushSize - batch.size)
+            if (batch.size >= flushSize || closed) return
+
+            val waitNanos = deadlineNanos - System.nanoTime()
+            if (waitNanos <= 0) return
+            batch.add(queue.poll(waitNanos, TimeUnit.NANOSECONDS) ?: return)
+        }
+    }
+
+    private fun flush(batch: List<AuditEvent>) {
+        val started = System.nanoTime()
+        try {
+            auditEventLogService.createAuditEventLogs(batch)
+            written.addAndGet(batch.size.toLong())
+        } catch (e: Exception) {
+            // The batch is written in its own transaction, so nothing from it was persisted
+            log.error("Failed to write audit batch of ${batch.size} events, retrying individually", e)
+            batch.forEach { event ->
+                try {
+                    auditEventLogService.createAuditEventLog(event)
+                    written.incrementAndGet()
+                } catch (e: Exception) {
+                    failed.incrementAndGet()
+                    log.error("Failed to write ${event.auditEventType} audit event for ${event.resourceType} id: ${event.resourceId.value}", e)
+                }
+            }
+        } finally {
+            val elapsed = System.nanoTime() - started
+            batches.incrementAndGet()
+            lastBatchSize.set(batch.size)
+            maxBatchSize.accumulateAndGet(batch.size) { current, size -> maxOf(current, size) }
+            lastFlushNanos.set(elapsed)
+            totalFlushNanos.addAndGet(elapsed)
+            log.debug("Wrote audit batch of {} events in {} ms", batch.size, elapsed / NANOS_PER_MILLI)
+        }
+    }
+
+    companion object {
+        private const val NANOS_PER_MILLI = 1_000_000.0
+    }
+}
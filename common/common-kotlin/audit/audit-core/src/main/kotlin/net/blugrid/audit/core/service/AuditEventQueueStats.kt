@@ -0,0 +1,23 @@
+package net.blugrid.audit.core.service
+
+/**
+ * Snapshot of async audit queue metrics
+ */
+data class AuditEventQueueStats(
+    val queueDepth: Int,
+    val enqueued: Long,
+    val dropped: Long,
+    val written: Long,
+    val failed: Long,
+    val batches: Long,
+    val lastBatchSize: Int,
+    val maxBatchSize: Int,
+    val lastFlushMillis: Double,
+    val totalFlushMillis: Double,
+) {
+    val averageBatchSize: Double
+        get() = if (batches == 0L) 0.0 else (written + failed).toDouble() / batches
+
+    val averageFlushMillis: Double
+        get() = if (batches == 0L) 0.0 else totalFlushMillis / batches
+}
@@ -0,0 +1,136 @@
+package net.blugrid.audit.core.service
+
+import io.micronaut.data.model.Page
+import io.micronaut.data.model.Pageable
+import net.blugrid.audit.core.config.AuditAsyncProps
+import net.blugrid.audit.core.config.AuditQueueOverflowPolicy
+import net.blugrid.audit.core.model.AuditEventLogQuery
+import net.blugrid.common.domain.IdentityID
+import net.blugrid.common.domain.IdentityUUID
+import net.blugrid.common.model.audit.AuditEvent
+import net.blugrid.common.model.audit.AuditEventLog
+import net.blugrid.common.model.audit.AuditEventType
+import net.blugrid.common.model.audit.ResourceAudit
+import net.blugrid.common.model.resource.BaseAuditedResource
+import net.blugrid.common.model.resource.ResourceType
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+import java.time.Duration
+import java.time.LocalDateTime
+import java.util.Collections
+import java.util.UUID
+import java.util.concurrent.CountDownLatch
+import java.util.concurrent.Executors
+import java.util.concurrent.TimeUnit
+
+class AuditEventQueueTest {
+
+    @Test
+    fun `No events are lost or reordered per resource under concurrent publishers`() {
+        val auditEventLogService = RecordingAuditEventLogService()
+        val queue = AuditEventQueue(auditEventLogService, props(queueCapacity = 64, overflowPolicy = AuditQueueOverflowPolicy.BLOCK))
+
+        val executor = Executors.newFixedThreadPool(PUBLISHERS)
+        repeat(PUBLISHERS) { publisher ->
+            executor.execute {
+                repeat(EVENTS_PER_PUBLISHER) { index ->
+                    val resourceId = publisher * RESOURCES_PER_PUBLISHER + (index % RESOURCES_PER_PUBLISHER).toLong()
+                    queue.enqueue(auditEvent(resourceId, version = index / RESOURCES_PER_PUBLISHER + 1))
+                }
+            }
+        }
+        executor.shutdown()
+        executor.awaitTermination(1, TimeUnit.MINUTES)
+        queue.close()
+
+        val written = auditEventLogService.written
+        assertEquals(PUBLISHERS * EVENTS_PER_PUBLISHER, written.size)
+        assertEquals(PUBLISHERS * EVENTS_PER_PUBLISHER, written.map { it.resource.uuid }.toSet().size)
+
+        written.groupBy { it.resourceId.value }.forEach { (resourceId, events) ->
+            assertEquals((1..events.size).toList(), events.map { it.version }, "versions out of order for resource $resourceId")
+        }
+
+        val stats = queue.stats
+        assertEquals(PUBLISHERS * EVENTS_PER_PUBLISHER.toLong(), stats.written)
+        assertEquals(0, stats.dropped)
+        assertEquals(0, stats.queueDepth)
+        assertTrue(stats.maxBatchSize <= FLUSH_SIZE)
+    }
+
+    @Test
+    fun `Drop policy discards events only while the queue is full`() {
+        val writerBlocked = CountDownLatch(1)
+        val auditEventLogService = RecordingAuditEventLogService(writerBlocked)
+        val queue = AuditEventQueue(auditEventLogService, props(queueCapacity = 10, overflowPolicy = AuditQueueOverflowPolicy.DROP))
+
+        repeat(100) { queue.enqueue(auditEvent(resourceId = 1, version = it + 1)) }
+        writerBlocked.countDown()
+        queue.close()
+
+        val stats = queue.stats
+        assertTrue(stats.dropped > 0)
+        assertEquals(100L, stats.enqueued + stats.dropped)
+        assertEquals(stats.enqueued, stats.written)
+        assertEquals(stats.enqueued.toInt(), auditEventLogService.written.size)
+    }
+
+    private fun props(queueCapacity: Int, overflowPolicy: AuditQueueOverflowPolicy) = object : AuditAsyncProps {
+        override val enabled = true
+        override val queueCapacity = queueCapacity
+        override val flushSize = FLUSH_SIZE
+        override val flushInterval: Duration = Duration.ofMillis(5)
+        override val overflowPolicy = overflowPolicy
+        override val shutdownTimeout: Duration = Duration.ofSeconds(30)
+    }
+
+    private fun auditEvent(resourceId: Long, version: Int) = AuditEvent(
+        auditEventType = if (version == 1) AuditEventType.CREATE else AuditEventType.UPDATE,
+        auditEventTimestamp = LocalDateTime.now(),
+        resourceType = ResourceType.ORGANISATION,
+        resourceId = IdentityID(resourceId),
+        resource = TestResource(IdentityID(resourceId), IdentityUUID(UUID.randomUUID()), ResourceAudit(version = version)),
+        tenantId = IdentityID(1),
+        sessionId = IdentityID(1),
+        version = version,
+    )
+
+    private data class TestResource(
+        override var id: IdentityID,
+        override var uuid: IdentityUUID,
+        override val audit: ResourceAudit?,
+    ) : BaseAuditedResource<TestResource> {
+        override val resourceType = ResourceType.ORGANISATION
+    }
+
+    /**
+     * Records written events in write order, optionally holding the first write until released
+     */
+    private class RecordingAuditEventLogService(
+        private val release: CountDownLatch? = null,
+    ) : AuditEventLogService {
+
+        val written: MutableList<AuditEvent> = Collections.synchronizedList(ArrayList())
+
+        override fun createAuditEventLog(auditEventLog: AuditEvent) {
+            createAuditEventLogs(listOf(auditEventLog))
+        }
+
+        override fun createAuditEventLogs(auditEventLogs: List<AuditEvent>) {
+            release?.await(1, TimeUnit.MINUTES)
+            written.addAll(auditEventLogs)
+        }
+
+        override fun findAllByResourceId(resourceType: ResourceType, resourceId: Long): List<AuditEventLog> = emptyList()
+        override fun searchAuditEventLogs(query: AuditEventLogQuery, pageRequest: Pageable): Page<AuditEventLog?> = Page.empty()
+        override fun isEmpty(resourceType: ResourceType): Boolean = written.none { it.resourceType == resourceType }
+    }
+
+    companion object {
+        private const val PUBLISHERS = 8
+        private const val RESOURCES_PER_PUBLISHER = 10
+        private const val EVENTS_PER_PUBLISHER = 500
+        private const val FLUSH_SIZE = 50
+    }
+}
@@ -5,6 +5,7 @@ import io.micronaut.http.annotation.Body
 import io.micronaut.http.annotation.Get
 import io.micronaut.http.annotation.PathVariable
 import io.micronaut.http.annotation.Post
+import net.blugrid.common.model.pagination.CursorPage
 import net.blugrid.common.model.pagination.Page
 import net.blugrid.common.model.pagination.PageableQuery
 import java.util.Optional
@@ -21,6 +22,9 @@ interface GenericQueryResource<F, T> {
     @Get(uri = "/page", produces = [MediaType.APPLICATION_JSON])
     fun getPage(number: Int, size: Int, sort: List<String>): Page<T>
 
+    @Get(uri = "/cursor", produces = [MediaType.APPLICATION_JSON])
+    fun getCursorPage(cursor: String?, size: Int, sort: List<String>): CursorPage<T, String>
+
     @Get(uri = "/{id}", produces = [MediaType.APPLICATION_JSON])
     fun getById(@PathVariable id: Long): T
 
@@ -3,6 +3,8 @@ package net.blugrid.common.model.pagination
 /**
  * Cursor-based pagination request for large datasets
  * Alternative to offset-based pagination
+ *
+ * Requests built from client parameters are capped at [MAX_PAGE_SIZE] rows per page.
  */
 data class CursorPageRequest<T : Comparable<T>>(
     val cursor: T? = null,
@@ -14,10 +16,26 @@ data class CursorPageRequest<T : Comparable<T>>(
     }
 
     companion object {
+        /**
+         * Matches the default `micronaut.data.pageable.max-page-size`
+         */
+        const val MAX_PAGE_SIZE = 100
+
         fun <T : Comparable<T>> of(size: Int): CursorPageRequest<T> =
             CursorPageRequest(null, size)
 
         fun <T : Comparable<T>> of(cursor: T, size: Int): CursorPageRequest<T> =
             CursorPageRequest(cursor, size)
+
+        fun fromQueryParams(
+            cursor: String? = null,
+            size: Int = 20,
+            sort: List<String> = emptyList()
+        ): CursorPageRequest<String> =
+            CursorPageRequest(
+                cursor = cursor?.takeIf { it.isNotBlank() },
+                size = size.coerceAtMost(MAX_PAGE_SIZE),
+                sort = Pageable.fromQueryParams(size = size, sort = sort).sort.orders
+            )
     }
 }
@@ -30,6 +30,8 @@ dependencies {
     testImplementation(libs.bundles.testing) {
         exclude(group = "org.slf4j", module = "slf4j-api")
     }
+    testImplementation(project(":common:common-kotlin:platform:platform-testing"))
+    testImplementation(libs.postgresql)
 }
 
 kapt {
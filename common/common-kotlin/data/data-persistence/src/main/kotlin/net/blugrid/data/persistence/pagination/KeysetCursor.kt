@@ -0,0 +1,68 @@
+package net.blugrid.data.persistence.pagination
+
+import net.blugrid.common.domain.exception.FieldValidationException
+import java.io.ByteArrayInputStream
+import java.io.ByteArrayOutputStream
+import java.io.DataInputStream
+import java.io.DataOutputStream
+import java.io.IOException
+import java.util.Base64
+
+/**
+ * Position of the last row on a keyset page
+ *
+ * Holds the sort key values of that row, in sort order, ending with its id. The sort
+ * the cursor was produced for is kept alongside so it cannot be replayed against another sort.
+ * Clients only ever see the encoded form, which is opaque and URL safe.
+ */
+internal data class KeysetCursor(
+    val sort: String,
+    val values: List<String?>,
+) {
+
+    fun encode(): String {
+        val bytes = ByteArrayOutputStream()
+        DataOutputStream(bytes).use { out ->
+            out.writeByte(VERSION)
+            out.writeUTF(sort)
+            out.writeShort(values.size)
+            values.forEach { value ->
+                out.writeBoolean(value != null)
+                value?.let(out::writeUTF)
+            }
+        }
+        return ENCODER.encodeToString(bytes.toByteArray())
+    }
+
+    companion object {
+        private const val VERSION = 1
+
+        private val ENCODER = Base64.getUrlEncoder().withoutPadding()
+        private val DECODER = Base64.getUrlDecoder()
+
+        fun decode(cursor: String, expectedSort: String, expectedSize: Int): KeysetCursor {
+            val decoded = try {
+                DataInputStream(ByteArrayInputStream(DECODER.decode(cursor))).use { input ->
+                    if (input.readByte().toInt() != VERSION) throw invalid(cursor)
+                    val sort = input.readUTF()
+                    val values = List(input.readUnsignedShort()) {
+                        if (input.readBoolean()) input.readUTF() else null
+                    }
+                    KeysetCursor(sort, values)
+                }
+            } catch (e: IllegalArgumentException) {
+                throw invalid(cursor, e)
+            } catch (e: IOException) {
+                throw invalid(cursor, e)
+            }
+
+            if (decoded.sort != expectedSort || decoded.values.size != expectedSize) {
+                throw FieldValidationException("cursor", "Cursor does not match the requested sort", cursor)
+            }
+            return decoded
+        }
+
+        private fun invalid(cursor: String, cause: Throwable? = null) =
+            FieldValidationException("cursor", "Malformed cursor", cursor, cause = cause)
+    }
+}
@@ -0,0 +1,192 @@
+package net.blugrid.data.persistence.pagination
+
+import io.micronaut.data.jpa.repository.criteria.Specification
+import jakarta.persistence.EntityManager
+import jakarta.persistence.Tuple
+import jakarta.persistence.criteria.CriteriaBuilder
+import jakarta.persistence.criteria.Expression
+import jakarta.persistence.criteria.Path
+import jakarta.persistence.criteria.Predicate
+import jakarta.persistence.criteria.Root
+import net.blugrid.common.domain.exception.FieldValidationException
+import net.blugrid.common.model.pagination.CursorPage
+import net.blugrid.common.model.pagination.CursorPageRequest
+import net.blugrid.common.model.pagination.SortDirection
+import net.blugrid.common.model.pagination.SortOrder
+import net.blugrid.data.persistence.model.PersistableResource
+import net.blugrid.data.persistence.repository.and
+import net.blugrid.platform.logging.logger
+import java.math.BigDecimal
+import java.math.BigInteger
+import java.time.Instant
+import java.time.LocalDate
+import java.time.LocalDateTime
+import java.time.LocalTime
+import java.time.OffsetDateTime
+import java.time.ZonedDateTime
+import java.util.UUID
+
+/**
+ * Keyset (seek) pagination over an entity
+ *
+ * Pages continue from the sort key values of the previous page's last row instead of an
+ * OFFSET, and fetch one extra row to detect a next page instead of running a COUNT, so the
+ * cost of a page does not grow with its depth. `id` is always appended as the final sort key
+ * so rows with equal sort values are never skipped or repeated across pages.
+ *
+ * Null ordering follows the PostgreSQL defaults: NULLS LAST for ASC and NULLS FIRST for DESC.
+ */
+class KeysetQuery<E : PersistableResource<E>>(
+    private val entityManager: EntityManager,
+    private val entityClass: Class<E>,
+) {
+
+    private val log = logger()
+
+    fun findPage(spec: Specification<E>?, pageable: CursorPageRequest<String>): CursorPage<E, String> {
+        val orders = keysetOrders(pageable.sort)
+        val sortKey = orders.toSortKey()
+        val cursor = pageable.cursor?.let { KeysetCursor.decode(it, sortKey, orders.size) }
+
+        val builder = entityManager.criteriaBuilder
+        val query = builder.createTupleQuery()
+        val root = query.from(entityClass)
+        val keys = orders.map { root.path(it.property) }
+
+        val filter = listOfNotNull(spec, cursor?.let { afterCursor(orders, it) }).reduceOrNull { left, right -> left and right }
+        filter?.toPredicate(root, query, builder)?.let { query.where(it) }
+
+        query.multiselect(listOf(root) + keys)
+        query.orderBy(orders.mapIndexed { index, order ->
+            val key = builder.sortExpression(keys[index], order)
+            if (order.direction == SortDirection.DESC) builder.desc(key) else builder.asc(key)
+        })
+
+        val rows: List<Tuple> = entityManager.createQuery(query)
+            .setMaxResults(pageable.size + 1)
+            .resultList
+
+        val hasNext = rows.size > pageable.size
+        val page = rows.take(pageable.size)
+        val nextCursor = if (hasNext) {
+            val last = page.last()
+            KeysetCursor(sortKey, List(orders.size) { last.get(it + 1)?.toCursorValue() }).encode()
+        } else {
+            null
+        }
+
+        log.debug("Keyset page of {} rows for {} by {}, hasNext: {}", page.size, entityClass.simpleName, sortKey, hasNext)
+
+        return CursorPage(
+            content = page.map { entityClass.cast(it.get(0)) },
+            pageable = pageable,
+            nextCursor = nextCursor,
+            hasNext = hasNext,
+        )
+    }
+
+    /**
+     * Rows strictly after the cursor: (k1 after v1) OR (k1 = v1 AND k2 after v2) OR ...
+     */
+    private fun afterCursor(orders: List<SortOrder>, cursor: KeysetCursor): Specification<E> =
+        Specification { root, _, builder ->
+            val keys = orders.mapIndexed { index, order ->
+                val path = root.path(order.property)
+                val value = cursor.values[index]?.toKeyValue(path.javaType, order)
+                Triple(builder.sortExpression(path, order), order, value)
+            }
+
+            val alternatives = keys.indices.map { index ->
+                val equalPrefix = keys.take(index).map { (key, _, value) -> builder.equalTo(key, value) }
+                val (key, order, value) = keys[index]
+                builder.and(*(equalPrefix + builder.isAfter(key, order.direction, value)).toTypedArray())
+            }
+            builder.or(*alternatives.toTypedArray())
+        }
+
+    private fun Root<E>.path(property: String): Path<Any> =
+        try {
+            property.split('.').fold(this as Path<*>) { path, attribute -> path.get<Any>(attribute) }.let {
+                @Suppress("UNCHECKED_CAST")
+                it as Path<Any>
+            }
+        } catch (e: IllegalArgumentException) {
+            throw FieldValidationException("sort", "Unknown sort property for ${entityClass.simpleName}", property, cause = e)
+        }
+
+    private fun CriteriaBuilder.sortExpression(path: Path<Any>, order: SortOrder): Expression<*> =
+        if (order.ignoreCase && path.javaType == String::class.java) {
+            @Suppress("UNCHECKED_CAST")
+            lower(path as Expression<String>)
+        } else {
+            path
+        }
+
+    private fun CriteriaBuilder.equalTo(key: Expression<*>, value: Any?): Predicate =
+        if (value == null) isNull(key) else equal(key, value)
+
+    @Suppress("UNCHECKED_CAST")
+    private fun CriteriaBuilder.isAfter(key: Expression<*>, direction: SortDirection, value: Any?): Predicate {
+        val comparable = key as Expression<Comparable<Any>>
+        return when (direction) {
+            // NULLS LAST: nulls follow every value, and nothing follows a null
+            SortDirection.ASC -> if (value == null) disjunction() else or(greaterThan(comparable, value as Comparable<Any>), isNull(key))
+            // NULLS FIRST: every value follows a null
+            SortDirection.DESC -> if (value == null) isNotNull(key) else lessThan(comparable, value as Comparable<Any>)
+        }
+    }
+
+    private fun String.toKeyValue(type: Class<*>, order: SortOrder): Any =
+        try {
+            when (type.kotlin.javaObjectType) {
+                String::class.java -> if (order.ignoreCase) lowercase() else this
+                Long::class.javaObjectType -> toLong()
+                Int::class.javaObjectType -> toInt()
+                Short::class.javaObjectType -> toShort()
+                Double::class.javaObjectType -> toDouble()
+                Float::class.javaObjectType -> toFloat()
+                Boolean::class.javaObjectType -> toBooleanStrict()
+                BigDecimal::class.java -> BigDecimal(this)
+                BigInteger::class.java -> BigInteger(this)
+                UUID::class.java -> UUID.fromString(this)
+                LocalDate::class.java -> LocalDate.parse(this)
+                LocalDateTime::class.java -> LocalDateTime.parse(this)
+                LocalTime::class.java -> LocalTime.parse(this)
+                OffsetDateTime::class.java -> OffsetDateTime.parse(this)
+                ZonedDateTime::class.java -> ZonedDateTime.parse(this)
+                Instant::class.java -> Instant.parse(this)
+                else -> if (type.isEnum) {
+                    type.enumConstants.first { (it as Enum<*>).name == this }
+                } else {
+                    throw FieldValidationException("sort", "Property ${order.property} of type ${type.simpleName} cannot be used as a keyset sort key")
+                }
+            }
+        } catch (e: FieldValidationException) {
+            throw e
+        } catch (e: RuntimeException) {
+            throw FieldValidationException("cursor", "Malformed cursor value for ${order.property}", this, cause = e)
+        }
+
+    private fun Any.toCursorValue(): String = if (this is Enum<*>) name else toString()
+
+    companion object {
+        const val TIEBREAKER = "id"
+
+        /**
+         * Requested sort with the unique `id` tiebreaker; keys after an explicit `id` can never apply
+         */
+        fun keysetOrders(sort: List<SortOrder>): List<SortOrder> {
+            val idIndex = sort.indexOfFirst { it.property == TIEBREAKER }
+            return if (idIndex >= 0) sort.subList(0, idIndex + 1) else sort + SortOrder.asc(TIEBREAKER)
+        }
+
+        internal fun List<SortOrder>.toSortKey(): String =
+            joinToString(",") { order ->
+                buildString {
+                    if (order.direction == SortDirection.DESC) append('-')
+                    append(order.property)
+                    if (order.ignoreCase) append('~')
+                }
+            }
+    }
+}
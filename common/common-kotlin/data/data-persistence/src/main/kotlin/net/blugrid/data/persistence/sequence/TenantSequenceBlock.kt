@@ -0,0 +1,31 @@
+package net.blugrid.data.persistence.sequence
+
+/**
+ * Block of pre-fetched sequence values for a single physical sequence
+ * Values are handed out in order; the block is refilled by the caller when exhausted
+ */
+internal class TenantSequenceBlock(
+    val sequenceName: String,
+) {
+    private var values: LongArray = LongArray(0)
+    private var position: Int = 0
+
+    /**
+     * Take the next value, refilling from the database via [refill] when the block is empty
+     */
+    @Synchronized
+    fun next(refill: () -> LongArray): Long {
+        if (position >= values.size) {
+            values = refill()
+            position = 0
+            check(values.isNotEmpty()) { "Sequence $sequenceName returned an empty block" }
+        }
+        return values[position++]
+    }
+
+    /**
+     * Number of values still available without a database round trip
+     */
+    val remaining: Int
+        @Synchronized get() = values.size - position
+}
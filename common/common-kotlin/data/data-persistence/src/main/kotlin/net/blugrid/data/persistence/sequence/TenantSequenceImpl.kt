@@ -7,10 +7,18 @@ import net.blugrid.platform.logging.logger
 import org.hibernate.engine.jdbc.spi.JdbcCoordinator
 import org.hibernate.engine.spi.SharedSessionContractImplementor
 import java.sql.SQLException
+import java.util.concurrent.ConcurrentHashMap
 
 /**
  * Implementation of tenant-aware sequence generation
  * Uses PostgreSQL functions for tenant isolation and sequence management
+ *
+ * When `env.db.sequence-pooling-enabled` is set, sequence resolution is cached per
+ * (schema, table, tenant) and IDs are reserved in blocks of `env.db.sequence-block-size`
+ * with a single batched `nextval` call, so most IDs are handed out without a round trip.
+ * Sequences missing on the pooled path are created and committed in their own transaction
+ * before any block is cached, so a rolled back caller can never drop a sequence whose values
+ * other transactions have already used.
  */
 @Singleton
 class TenantSequenceImpl(
@@ -20,6 +28,10 @@ class TenantSequenceImpl(
 
     private val log = logger()
 
+    private val resolvedSequences = ConcurrentHashMap<TenantSequenceKey, TenantSequenceBlock>()
+    private val sequenceBlocks = ConcurrentHashMap<String, TenantSequenceBlock>()
+    private val tenantSequenceDetails = ConcurrentHashMap<Long, TenantSequenceDetails>()
+
     override fun tenantNextVal(session: SharedSessionContractImplementor, inputName: String, tenantId: Long): Long {
         val jdbcCoordinator = session.jdbcCoordinator
         val defaultSchemaName = dbProps.schema
@@ -27,6 +39,10 @@ class TenantSequenceImpl(
 
         log.debug("Generating tenant sequence value for table: {}, tenant: {}", tableName, tenantId)
 
+        if (dbProps.sequencePoolingEnabled) {
+            return pooledNextVal(session, TenantSequenceKey(schemaName, tableName, tenantId))
+        }
+
         if (sequenceExists(jdbcCoordinator, schemaName, tableName)) {
             return executeNextVal(jdbcCoordinator, inputName)
                 .also {
@@ -38,7 +54,7 @@ class TenantSequenceImpl(
             val seqName = generateSequenceName(tableName, tenantId, isTenantTable)
 
             if (!sequenceExists(jdbcCoordinator, schemaName, seqName)) {
-                createSequence(jdbcCoordinator, seqName, tenantId, isTenantTable)
+                createSequence(jdbcCoordinator, schemaName, seqName, tenantId, isTenantTable)
                 log.debug("Created new sequence: {}", seqName)
             }
 
@@ -50,6 +66,56 @@ class TenantSequenceImpl(
         }
     }
 
+    /**
+     * Drop all cached sequence resolutions and unused ID blocks
+     * Required after sequences are dropped or recreated outside this process
+     */
+    fun evictAll() {
+        resolvedSequences.clear()
+        sequenceBlocks.clear()
+    }
+
+    private fun pooledNextVal(session: SharedSessionContractImplementor, key: TenantSequenceKey): Long {
+        val jdbcCoordinator = session.jdbcCoordinator
+        val block = resolvedSequences[key]
+            ?: resolveSequenceBlock(session, key).also { resolvedSequences.putIfAbsent(key, it) }
+
+        val id = try {
+            block.next { fetchBlock(jdbcCoordinator, block.sequenceName, dbProps.sequenceBlockSize) }
+        } catch (e: SQLException) {
+            // The sequence may have been dropped outside this process
+            resolvedSequences.remove(key)
+            sequenceBlocks.remove(block.sequenceName, block)
+            throw e
+        }
+
+        log.debug("Used pooled sequence: {} -> {}", block.sequenceName, id)
+        return id
+    }
+
+    private fun resolveSequenceBlock(session: SharedSessionContractImplementor, key: TenantSequenceKey): TenantSequenceBlock {
+        val jdbcCoordinator = session.jdbcCoordinator
+        val (schemaName, tableName, tenantId) = key
+
+        if (sequenceExists(jdbcCoordinator, schemaName, tableName)) {
+            return sequenceBlocks.computeIfAbsent("$schemaName.$tableName") { TenantSequenceBlock(it) }
+        }
+
+        val isTenantTable = isTenantTable(jdbcCoordinator, tableName)
+        val seqName = generateSequenceName(tableName, tenantId, isTenantTable)
+        val qualifiedName = "$schemaName.$seqName"
+
+        sequenceBlocks[qualifiedName]?.let { return it }
+
+        if (!sequenceExists(jdbcCoordinator, schemaName, seqName)) {
+            val sql = createSequenceSql(jdbcCoordinator, schemaName, seqName, tenantId, isTenantTable)
+            databaseService.executeIsolatedUpdate(session, sql)
+            log.debug("Created new sequence: {}", seqName)
+        }
+
+        return sequenceBlocks.computeIfAbsent(qualifiedName) { TenantSequenceBlock(it) }
+    }
+
     private fun sequenceExists(jdbcCoordinator: JdbcCoordinator, schemaName: String, sequenceName: String): Boolean {
         val sql = "SELECT EXISTS(SELECT 1 FROM pg_sequences WHERE schemaname = ? AND sequencename = ?)"
         val params = listOf(schemaName, sequenceName)
@@ -74,24 +140,29 @@ class TenantSequenceImpl(
         }
     }
 
-    private fun createSequence(jdbcCoordinator: JdbcCoordinator, seqName: String, tenantId: Long?, isTenantTable: Boolean) {
-        val sql: String
-        val params: List<Any>
+    private fun createSequence(jdbcCoordinator: JdbcCoordinator, schemaName: String, seqName: String, tenantId: Long?, isTenantTable: Boolean) {
+        val sql = createSequenceSql(jdbcCoordinator, schemaName, seqName, tenantId, isTenantTable)
+        return databaseService.executeUpdate(jdbcCoordinator, sql, emptyList())
+    }
+
+    private fun createSequenceSql(jdbcCoordinator: JdbcCoordinator, schemaName: String, seqName: String, tenantId: Long?, isTenantTable: Boolean): String {
+        val qualifiedName = validateSequenceName("$schemaName.$seqName")
 
-        if (isTenantTable && tenantId != null) {
+        // DDL does not accept bind parameters; all values below are numeric
+        return if (isTenantTable && tenantId != null) {
             val tenantDetails = getTenantSequenceDetails(jdbcCoordinator, tenantId)
-            sql = "CREATE SEQUENCE $seqName START WITH ? MINVALUE ? MAXVALUE ?"
-            params = listOf(tenantDetails.minId + 1, tenantDetails.minId, tenantDetails.maxId)
+            "CREATE SEQUENCE IF NOT EXISTS $qualifiedName " +
+                "START WITH ${tenantDetails.startingId} MINVALUE ${tenantDetails.startingId} MAXVALUE ${tenantDetails.maxId}"
         } else {
-            sql = "CREATE SEQUENCE $seqName START WITH 1"
-            params = emptyList()
+            "CREATE SEQUENCE IF NOT EXISTS $qualifiedName START WITH 1"
         }
-
-        return databaseService.executeUpdate(jdbcCoordinator, sql, params)
     }
 
     private fun getTenantSequenceDetails(jdbcCoordinator: JdbcCoordinator, tenantId: Long): TenantSequenceDetails {
-        val sql = "SELECT min_id + 1 AS min_id, max_id FROM tenant_sequence_details(?)"
+        tenantSequenceDetails[tenantId]?.let { return it }
+
+        // tenant_sequence_details is IMMUTABLE, so the range can be cached for the process lifetime
+        val sql = "SELECT min_id, max_id FROM tenant_sequence_details(?)"
         val params = listOf(tenantId)
         return databaseService.executeQuery(jdbcCoordinator, sql, params).use { rs ->
             if (rs?.next() == true) {
@@ -99,15 +170,12 @@ class TenantSequenceImpl(
             } else {
                 throw SQLException("Failed to fetch tenant sequence details for tenantId: $tenantId")
             }
-        }
+        }.also { tenantSequenceDetails[tenantId] = it }
     }
 
     private fun executeNextVal(jdbcCoordinator: JdbcCoordinator, sequenceName: String): Long {
         // PostgreSQL nextval() requires literal sequence name, not parameterized
-        // Validate sequence name to prevent SQL injection
-        require(sequenceName.matches(Regex("^[a-zA-Z_][a-zA-Z0-9_]*\\.[a-zA-Z_][a-zA-Z0-9_]*$|^[a-zA-Z_][a-zA-Z0-9_]*$"))) {
-            "Invalid sequence name format: $sequenceName"
-        }
+        validateSequenceName(sequenceName)
 
         val sql = "SELECT nextval('$sequenceName')"
         val params = emptyList<Any>()
@@ -121,6 +189,36 @@ class TenantSequenceImpl(
         }
     }
 
+    private fun fetchBlock(jdbcCoordinator: JdbcCoordinator, sequenceName: String, blockSize: Int): LongArray {
+        validateSequenceName(sequenceName)
+
+        // Batched nextval keeps INCREMENT BY 1, so the sequence stays compatible with tenant_nextval()
+        val sql = "SELECT nextval('$sequenceName') FROM generate_series(1, ?)"
+        val params = listOf(blockSize.coerceAtLeast(1))
+
+        return databaseService.executeQuery(jdbcCoordinator, sql, params).use { rs ->
+            val values = ArrayList<Long>(blockSize)
+            while (rs?.next() == true) {
+                values.add(rs.getLong(1))
+            }
+            if (values.isEmpty()) {
+                throw SQLException("Failed to get next values from sequence: $sequenceName")
+            }
+            values.toLongArray()
+        }.also {
+            jdbcCoordinator.afterStatementExecution()
+            log.debug("Reserved {} values from sequence: {}", it.size, sequenceName)
+        }
+    }
+
+    private fun validateSequenceName(sequenceName: String): String {
+        // Validate sequence name to prevent SQL injection
+        require(sequenceName.matches(SEQUENCE_NAME_PATTERN)) {
+            "Invalid sequence name format: $sequenceName"
+        }
+        return sequenceName
+    }
+
     private fun parseInputName(inputName: String, defaultSchemaName: String): Pair<String, String> {
         return if (inputName.contains('.')) {
             // Schema.table format provided
@@ -132,4 +230,9 @@ class TenantSequenceImpl(
             defaultSchemaName to inputName
         }
     }
+
+    companion object {
+        private val SEQUENCE_NAME_PATTERN =
+            Regex("^[a-zA-Z_][a-zA-Z0-9_]*\\.[a-zA-Z_][a-zA-Z0-9_]*$|^[a-zA-Z_][a-zA-Z0-9_]*$")
+    }
 }
@@ -0,0 +1,11 @@
+package net.blugrid.data.persistence.sequence
+
+/**
+ * Cache key for a resolved tenant sequence
+ * Non-tenant tables resolve to the same physical sequence for every tenant
+ */
+internal data class TenantSequenceKey(
+    val schemaName: String,
+    val tableName: String,
+    val tenantId: Long,
+)
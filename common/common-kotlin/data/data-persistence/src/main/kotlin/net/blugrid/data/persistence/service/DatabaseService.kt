@@ -2,6 +2,9 @@ package net.blugrid.data.persistence.service
 
 import jakarta.inject.Singleton
 import org.hibernate.engine.jdbc.spi.JdbcCoordinator
+import org.hibernate.engine.spi.SharedSessionContractImplementor
+import org.hibernate.jdbc.AbstractWork
+import java.sql.Connection
 import java.sql.PreparedStatement
 import java.sql.ResultSet
 import java.sql.SQLException
@@ -10,6 +13,12 @@ interface DatabaseService {
     fun executeQuery(jdbcCoordinator: JdbcCoordinator, sql: String, params: List<Any>? = null): ResultSet?
     fun releaseResources(jdbcCoordinator: JdbcCoordinator, resultSet: ResultSet?, preparedStatement: PreparedStatement?)
     fun executeUpdate(jdbcCoordinator: JdbcCoordinator, sql: String, params: List<Any>)
+
+    /**
+     * Execute [sql] in its own transaction on a separate connection, committed before this returns
+     * regardless of the outcome of the session's current transaction
+     */
+    fun executeIsolatedUpdate(session: SharedSessionContractImplementor, sql: String)
 }
 
 @Singleton
@@ -49,6 +58,16 @@ class DatabaseServiceImpl : DatabaseService {
         }
     }
 
+    override fun executeIsolatedUpdate(session: SharedSessionContractImplementor, sql: String) {
+        session.transactionCoordinator.createIsolationDelegate().delegateWork(
+            object : AbstractWork() {
+                override fun execute(connection: Connection) {
+                    connection.createStatement().use { it.execute(sql) }
+                }
+            },
+            true
+        )
+    }
 
     override fun releaseResources(jdbcCoordinator: JdbcCoordinator, resultSet: ResultSet?, preparedStatement: PreparedStatement?) {
         try {
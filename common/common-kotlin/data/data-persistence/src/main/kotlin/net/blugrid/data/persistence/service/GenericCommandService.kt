@@ -9,5 +9,6 @@ import net.blugrid.data.persistence.model.PersistableResource
 interface GenericCommandService<T : BaseResource<T>, U : BaseCreateResource<U>, V : BaseUpdateResource<V>, X : PersistableResource<X>, Y : ResourceEntityMapper<T, U, V, X>> {
     fun update(id: Long, update: V): T
     fun create(newResource: U): T
+    fun createAll(newResources: List<U>): List<T>
     fun delete(id: Long)
 }
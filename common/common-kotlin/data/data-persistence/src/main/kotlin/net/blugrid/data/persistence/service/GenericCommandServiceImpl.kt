@@ -33,6 +33,17 @@ open class GenericCommandServiceImpl<T : BaseResource<T>, U : BaseCreateResource
             .toResponse()
     }
 
+    /**
+     * Creates all resources in one transaction, flushed as JDBC batched inserts when
+     * `app.persistence.jdbc-batch-size` is set
+     */
+    @Transactional
+    override fun createAll(newResources: List<U>): List<T> {
+        val saved = repository.saveAll(newResources.map { it.toEntity() })
+        repository.flush()
+        return saved.map { it.toResponse() }
+    }
+
     @Transactional
     override fun delete(id: Long) {
         repository.findById(id)
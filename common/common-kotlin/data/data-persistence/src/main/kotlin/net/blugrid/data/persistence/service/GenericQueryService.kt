@@ -1,5 +1,7 @@
 package net.blugrid.data.persistence.service
 
+import net.blugrid.common.model.pagination.CursorPage
+import net.blugrid.common.model.pagination.CursorPageRequest
 import net.blugrid.common.model.pagination.Page
 import net.blugrid.common.model.pagination.Pageable
 import java.util.Optional
@@ -7,10 +9,12 @@ import java.util.UUID
 
 interface GenericQueryService<F, T> {
     fun getPage(pageable: Pageable): Page<T>
+    fun getCursorPage(pageable: CursorPageRequest<String>): CursorPage<T, String>
     fun getById(id: Long): T
     fun getByIdOptional(id: Long): Optional<T>
     fun getAll(): List<T>
     fun getByUuid(uuid: UUID): T
     fun getByUuidOptional(uuid: UUID): Optional<T>
     fun findByFilter(filter: F, pageable: Pageable): Page<T>
+    fun findByFilter(filter: F, pageable: CursorPageRequest<String>): CursorPage<T, String>
 }
@@ -3,12 +3,15 @@ package net.blugrid.data.persistence.service
 import io.micronaut.data.jpa.repository.criteria.Specification
 import io.micronaut.transaction.annotation.ReadOnly
 import net.blugrid.common.domain.exception.NotFoundException
+import net.blugrid.common.model.pagination.CursorPage
+import net.blugrid.common.model.pagination.CursorPageRequest
 import net.blugrid.common.model.pagination.Page
 import net.blugrid.common.model.pagination.Pageable
 import net.blugrid.common.model.resource.BaseResource
 import net.blugrid.data.persistence.mapping.toFrameworkAgnosticPage
 import net.blugrid.data.persistence.mapping.toMicronautPageable
 import net.blugrid.data.persistence.model.PersistableResource
+import net.blugrid.data.persistence.pagination.KeysetQuery
 import net.blugrid.data.persistence.repository.GenericEntityRepository
 import java.util.Optional
 import java.util.UUID
@@ -20,7 +23,8 @@ open class GenericQueryServiceImpl<
         >(
     private val repository: GenericEntityRepository<E>,
     private val mapper: (E) -> T,
-    private val specBuilder: (F) -> Specification<E>
+    private val specBuilder: (F) -> Specification<E>,
+    private val keysetQuery: KeysetQuery<E>,
 ) : GenericQueryService<F, T> {
 
     @ReadOnly
@@ -33,6 +37,12 @@ open class GenericQueryServiceImpl<
         }
     }
 
+    @ReadOnly
+    override fun getCursorPage(pageable: CursorPageRequest<String>): CursorPage<T, String> {
+        return keysetQuery.findPage(null, pageable)
+            .map(mapper)
+    }
+
     @ReadOnly
     override fun getAll(): List<T> {
         return repository.findAll()
@@ -73,6 +83,12 @@ open class GenericQueryServiceImpl<
         return micronautPage.toFrameworkAgnosticPage(mapper)
     }
 
+    @ReadOnly
+    override fun findByFilter(filter: F, pageable: CursorPageRequest<String>): CursorPage<T, String> {
+        return keysetQuery.findPage(specBuilder(filter), pageable)
+            .map(mapper)
+    }
+
     fun E.toResponse(): T {
         return mapper(this)
     }
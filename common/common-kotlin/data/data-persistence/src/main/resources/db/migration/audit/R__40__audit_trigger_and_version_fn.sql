@@ -5,15 +5,20 @@ CREATE TABLE IF NOT EXISTS _common_audit_columns
     last_changed_timestamp     TIMESTAMP   NOT NULL DEFAULT NOW(),
     last_changed_by_session_id bigint    NOT NULL,
     version                    t_line_number NOT NULL DEFAULT 0,
-    expiry_timestamp           TIMESTAMP   NOT NULL DEFAULT 'infinity'
+    expiry_timestamp           TIMESTAMP   NOT NULL DEFAULT 'infinity',
+    last_changed_xid           bigint    NOT NULL DEFAULT 0
 )
     WITHOUT OIDS;
 
+-- Id of the transaction that last wrote the row, stamped by the audit triggers for the data-sync change feed
+ALTER TABLE _common_audit_columns ADD COLUMN IF NOT EXISTS last_changed_xid bigint NOT NULL DEFAULT 0;
+
 CREATE OR REPLACE FUNCTION proc_trig_insert_audit_columns() RETURNS TRIGGER AS
 $body$
 DECLARE
 BEGIN
     IF (TO_JSONB(new) ? 'version') THEN new.version := 1; END IF;
+    IF (TO_JSONB(new) ? 'last_changed_xid') THEN new.last_changed_xid := pg_current_xact_id()::text::bigint; END IF;
 
     RETURN new;
 END;
@@ -26,6 +31,8 @@ $body$
 DECLARE
 BEGIN
     IF (TO_JSONB(new) ? 'version') THEN new.version := new.version + 1; END IF;
+    -- Stamped on every update, including soft deletes that only set expiry_timestamp
+    IF (TO_JSONB(new) ? 'last_changed_xid') THEN new.last_changed_xid := pg_current_xact_id()::text::bigint; END IF;
 
     RETURN new;
 END;
@@ -0,0 +1,38 @@
+-- -----------------------------------------------------------------------------
+-- Functions: current_tenant_scope, current_business_unit_scope
+-- Description: Inlinable equivalents of get_tenant_scope and get_business_unit_scope for view predicates.
+--              Single-statement STABLE SQL functions are inlined by the planner, so a predicate such as
+--              tenant_id = current_tenant_scope() becomes an index condition instead of a per-row function
+--              call with an EXCEPTION block (subtransaction) and text_to_bigint parsing.
+--              Both return 0 when the setting is undefined and NULL when it is not a number in the BIGINT range.
+-- -----------------------------------------------------------------------------
+-- Examples:
+--   SELECT current_tenant_scope();         -- returns the configured tenant_id or 0 if undefined
+--   SELECT current_business_unit_scope();  -- returns the configured business_unit_id or 0 if undefined
+CREATE OR REPLACE FUNCTION current_tenant_scope(
+) RETURNS BIGINT AS
+$body$
+SELECT CASE
+           WHEN current_setting('tenant.id', TRUE) IS NULL THEN 0
+           WHEN REPLACE(current_setting('tenant.id', TRUE), '"', '') ~ '^-?[0-9]{1,19}$'
+               THEN CASE
+                        WHEN REPLACE(current_setting('tenant.id', TRUE), '"', '') :: NUMERIC
+                            BETWEEN -9223372036854775808 AND 9223372036854775807
+                            THEN REPLACE(current_setting('tenant.id', TRUE), '"', '') :: BIGINT
+                    END
+       END
+$body$ LANGUAGE sql STABLE PARALLEL SAFE;
+
+CREATE OR REPLACE FUNCTION current_business_unit_scope(
+) RETURNS BIGINT AS
+$body$
+SELECT CASE
+           WHEN current_setting('business_unit.id', TRUE) IS NULL THEN 0
+           WHEN REPLACE(current_setting('business_unit.id', TRUE), '"', '') ~ '^-?[0-9]{1,19}$'
+               THEN CASE
+                        WHEN REPLACE(current_setting('business_unit.id', TRUE), '"', '') :: NUMERIC
+                            BETWEEN -9223372036854775808 AND 9223372036854775807
+                            THEN REPLACE(current_setting('business_unit.id', TRUE), '"', '') :: BIGINT
+                    END
+       END
+$body$ LANGUAGE sql STABLE PARALLEL SAFE;
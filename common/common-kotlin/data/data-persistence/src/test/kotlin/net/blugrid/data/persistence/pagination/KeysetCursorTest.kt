@@ -0,0 +1,51 @@
+package net.blugrid.data.persistence.pagination
+
+import net.blugrid.common.domain.exception.FieldValidationException
+import net.blugrid.common.model.pagination.SortOrder
+import net.blugrid.data.persistence.pagination.KeysetQuery.Companion.toSortKey
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertFalse
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.assertThrows
+
+class KeysetCursorTest {
+
+    private val orders = KeysetQuery.keysetOrders(listOf(SortOrder.desc("effectiveTimestamp"), SortOrder.asc("name", true)))
+
+    @Test
+    fun `Cursor round trips values including nulls through an opaque URL safe token`() {
+        val cursor = KeysetCursor(orders.toSortKey(), listOf("2024-03-01T10:15:30.123456", null, "42"))
+
+        val encoded = cursor.encode()
+
+        assertFalse(encoded.any { it in "+/=" })
+        assertEquals(cursor, KeysetCursor.decode(encoded, orders.toSortKey(), orders.size))
+    }
+
+    @Test
+    fun `Id is appended as tiebreaker and ends the sort when given explicitly`() {
+        assertEquals("-effectiveTimestamp,name~,id", orders.toSortKey())
+        assertEquals(
+            listOf(SortOrder.desc("id")),
+            KeysetQuery.keysetOrders(listOf(SortOrder.desc("id"), SortOrder.asc("name")))
+        )
+    }
+
+    @Test
+    fun `Cursor is rejected for a different sort`() {
+        val encoded = KeysetCursor(orders.toSortKey(), listOf("2024-03-01T10:15:30", "acme", "42")).encode()
+        val otherOrders = KeysetQuery.keysetOrders(listOf(SortOrder.asc("effectiveTimestamp")))
+
+        val exception = assertThrows<FieldValidationException> {
+            KeysetCursor.decode(encoded, otherOrders.toSortKey(), otherOrders.size)
+        }
+        assertEquals("cursor", exception.violations.single().field)
+    }
+
+    @Test
+    fun `Malformed cursor is rejected as a validation error`() {
+        listOf("not a cursor", "AAAA", "").forEach { cursor ->
+            assertThrows<FieldValidationException> { KeysetCursor.decode(cursor, orders.toSortKey(), orders.size) }
+        }
+    }
+}
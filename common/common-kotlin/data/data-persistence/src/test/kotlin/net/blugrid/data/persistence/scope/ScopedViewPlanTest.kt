@@ -0,0 +1,270 @@
+package net.blugrid.data.persistence.scope
+
+import net.blugrid.platform.testing.support.PostgresTestSupport
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertFalse
+import org.junit.jupiter.api.Assertions.assertNull
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.BeforeEach
+import org.junit.jupiter.api.Test
+import org.postgresql.ds.PGSimpleDataSource
+import java.sql.Connection
+import javax.sql.DataSource
+
+/**
+ * Checks the query plans of scoped views against Postgres: the inline scope predicates must be
+ * inlined into index conditions on the tenant leading partial indexes, so only the current
+ * scope's active rows are read, while the function mode views filter every tenant's rows
+ */
+class ScopedViewPlanTest {
+
+    private val dataSource: DataSource = PGSimpleDataSource().apply {
+        setUrl(PostgresTestSupport.postgresContainer.jdbcUrl)
+        user = PostgresTestSupport.USERNAME
+        password = PostgresTestSupport.PASSWORD
+        currentSchema = SCHEMA
+    }
+
+    private val activeRowsPerTenant = ROWS_PER_TENANT - ROWS_PER_TENANT / 10L
+
+    @BeforeEach
+    fun setup() {
+        execute(
+            "DROP SCHEMA IF EXISTS $SCHEMA CASCADE",
+            "CREATE SCHEMA $SCHEMA",
+            migration("util/R__80__text_to_bigint.sql"),
+            migration("util/R__113__table_exists.sql"),
+            migration("scope/R__60__get_business_unit_tenant_scope.sql"),
+            migration("scope/R__61__get_business_unit_scope.sql"),
+            migration("scope/R__62__get_tenant_scope.sql"),
+            migration("scope/R__67__current_scope.sql"),
+            """
+            CREATE TABLE invoice (
+                id bigint PRIMARY KEY,
+                tenant_id bigint NOT NULL,
+                name varchar(255) NOT NULL,
+                version smallint NOT NULL,
+                last_changed_xid bigint NOT NULL DEFAULT 0,
+                expiry_timestamp timestamp NOT NULL DEFAULT 'infinity'
+            )
+            """,
+            """
+            CREATE TABLE expense (
+                id bigint PRIMARY KEY,
+                tenant_id bigint NOT NULL,
+                business_unit_id bigint NOT NULL,
+                name varchar(255) NOT NULL,
+                version smallint NOT NULL,
+                last_changed_xid bigint NOT NULL DEFAULT 0,
+                expiry_timestamp timestamp NOT NULL DEFAULT 'infinity'
+            )
+            """,
+            // Indexes as generated by CreateTableSQLTemplate for tenant and business unit scoped tables
+            "CREATE INDEX IF NOT EXISTS idx_invoice_tenant_id ON invoice USING btree (tenant_id)",
+            "CREATE INDEX IF NOT EXISTS idx_invoice_tenant_id_expiry ON invoice USING btree (tenant_id, expiry_timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_invoice_tenant_id_last_changed_xid ON invoice USING btree (tenant_id, last_changed_xid, id)",
+            "CREATE INDEX IF NOT EXISTS idx_invoice_tenant_id_active ON invoice USING btree (tenant_id, id) WHERE expiry_timestamp = 'infinity'",
+            "CREATE INDEX IF NOT EXISTS idx_expense_tenant_id ON expense USING btree (tenant_id)",
+            "CREATE INDEX IF NOT EXISTS idx_expense_business_unit_id ON expense USING btree (business_unit_id)",
+            "CREATE INDEX IF NOT EXISTS idx_expense_tenant_id_expiry ON expense USING btree (tenant_id, expiry_timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_expense_tenant_id_last_changed_xid ON expense USING btree (tenant_id, last_changed_xid, id)",
+            "CREATE INDEX IF NOT EXISTS idx_expense_tenant_id_active ON expense USING btree (tenant_id, id) WHERE expiry_timestamp = 'infinity'",
+            "CREATE INDEX IF NOT EXISTS idx_expense_tenant_id_business_unit_id_active ON expense USING btree (tenant_id, business_unit_id, id) WHERE expiry_timestamp = 'infinity'",
+            """
+            INSERT INTO invoice (id, tenant_id, name, version, expiry_timestamp)
+            SELECT g, g % $TENANTS + 1, 'invoice ' || g, 1,
+                   CASE WHEN g / $TENANTS % 10 = 0 THEN now() - INTERVAL '1 day' ELSE 'infinity' END
+            FROM generate_series(1, $TENANTS * $ROWS_PER_TENANT) g
+            """,
+            """
+            INSERT INTO expense (id, tenant_id, business_unit_id, name, version, expiry_timestamp)
+            SELECT g, g % $TENANTS + 1, g / $TENANTS % $BUSINESS_UNITS + 1, 'expense ' || g, 1,
+                   CASE WHEN g / $TENANTS % 10 = 0 THEN now() - INTERVAL '1 day' ELSE 'infinity' END
+            FROM generate_series(1, $TENANTS * $ROWS_PER_TENANT) g
+            """,
+            "VACUUM ANALYZE invoice",
+            "VACUUM ANALYZE expense",
+        )
+    }
+
+    @Test
+    fun `inline tenant view reads only the current tenant's active rows through the partial index`() {
+        execute(INLINE_TENANT_VIEW)
+        dataSource.connection.use { connection ->
+            connection.setScope("tenant.id", TENANT_ID)
+
+            val countPlan = connection.explain("SELECT count(*) FROM vw_invoice")
+            val pagePlan = connection.explain("SELECT id, name FROM vw_invoice WHERE id > 100 ORDER BY id LIMIT 50")
+
+            assertTrue(pagePlan.contains("idx_invoice_tenant_id_active"), pagePlan)
+            listOf(countPlan, pagePlan).forEach { plan ->
+                assertTrue(Regex("Index (Only )?Scan using idx_invoice_tenant_id_").containsMatchIn(plan), plan)
+                assertFalse(plan.contains("Seq Scan"), plan)
+                assertFalse(plan.contains("Rows Removed by Filter"), plan)
+                assertFalse(plan.contains("current_tenant_scope"), "scope accessor was not inlined:\n$plan")
+            }
+            assertEquals(activeRowsPerTenant, connection.count("SELECT count(*) FROM vw_invoice"))
+        }
+    }
+
+    @Test
+    fun `inline business unit view filters on the business unit through the partial index`() {
+        execute(INLINE_BUSINESS_UNIT_VIEW)
+        dataSource.connection.use { connection ->
+            connection.setScope("tenant.id", TENANT_ID)
+            connection.setScope("business_unit.id", BUSINESS_UNIT_ID)
+
+            val plan = connection.explain("SELECT count(*) FROM vw_expense")
+            val expected = connection.count(
+                "SELECT count(*) FROM expense " +
+                    "WHERE tenant_id = $TENANT_ID AND business_unit_id = $BUSINESS_UNIT_ID AND expiry_timestamp = 'infinity'"
+            )
+
+            assertTrue(plan.contains("idx_expense_tenant_id_business_unit_id_active"), plan)
+            assertFalse(plan.contains("Seq Scan"), plan)
+            assertFalse(plan.contains("Rows Removed by Filter"), plan)
+            assertFalse(plan.contains("current_business_unit_scope"), "scope accessor was not inlined:\n$plan")
+            assertTrue(expected in 1 until activeRowsPerTenant, "expected rows of one business unit, got $expected")
+            assertEquals(expected, connection.count("SELECT count(*) FROM vw_expense"))
+        }
+    }
+
+    @Test
+    fun `function tenant view scans and filters every tenant's rows`() {
+        execute(FUNCTION_TENANT_VIEW)
+        dataSource.connection.use { connection ->
+            connection.setScope("tenant.id", TENANT_ID)
+
+            val plan = connection.explain("SELECT count(*) FROM vw_invoice")
+
+            assertTrue(plan.contains("Seq Scan on invoice"), plan)
+            assertTrue(plan.contains("Rows Removed by Filter"), plan)
+            assertEquals(TENANTS * activeRowsPerTenant, connection.count("SELECT count(*) FROM vw_invoice"))
+        }
+    }
+
+    @Test
+    fun `inline tenant view returns no rows without a tenant scope, unlike the function view`() {
+        dataSource.connection.use { connection ->
+            execute(FUNCTION_TENANT_VIEW)
+            assertEquals(TENANTS * activeRowsPerTenant, connection.count("SELECT count(*) FROM vw_invoice"))
+
+            execute(INLINE_TENANT_VIEW)
+            assertEquals(0L, connection.count("SELECT count(*) FROM vw_invoice"))
+        }
+    }
+
+    @Test
+    fun `inline scope accessors match the plpgsql scope functions`() {
+        dataSource.connection.use { connection ->
+            assertEquals(0L, connection.count("SELECT current_tenant_scope()"))
+            assertEquals(0L, connection.count("SELECT current_business_unit_scope()"))
+
+            connection.setScope("tenant.id", TENANT_ID)
+            connection.setScope("business_unit.id", BUSINESS_UNIT_ID)
+            assertEquals(connection.count("SELECT get_tenant_scope()"), connection.count("SELECT current_tenant_scope()"))
+            assertEquals(connection.count("SELECT get_business_unit_scope()"), connection.count("SELECT current_business_unit_scope()"))
+        }
+    }
+
+    @Test
+    fun `inline scope accessors accept the full bigint range and reject values outside it`() {
+        dataSource.connection.use { connection ->
+            listOf(Long.MAX_VALUE, Long.MIN_VALUE).forEach { id ->
+                connection.setScope("tenant.id", id.toString())
+                connection.setScope("business_unit.id", id.toString())
+                assertEquals(id, connection.nullableLong("SELECT current_tenant_scope()"))
+                assertEquals(id, connection.nullableLong("SELECT current_business_unit_scope()"))
+                assertEquals(connection.nullableLong("SELECT get_tenant_scope()"), connection.nullableLong("SELECT current_tenant_scope()"))
+            }
+
+            listOf("9223372036854775808", "-9223372036854775809", "12345678901234567890", "abc").forEach { id ->
+                connection.setScope("tenant.id", id)
+                connection.setScope("business_unit.id", id)
+                assertNull(connection.nullableLong("SELECT current_tenant_scope()"), id)
+                assertNull(connection.nullableLong("SELECT current_business_unit_scope()"), id)
+                assertNull(connection.nullableLong("SELECT get_tenant_scope()"), id)
+            }
+        }
+    }
+
+    private fun Connection.setScope(setting: String, id: Long) = setScope(setting, id.toString())
+
+    // Same format as set_tenant_scope and set_business_unit_scope, which store QUOTE_IDENT(id)
+    private fun Connection.setScope(setting: String, id: String) {
+        createStatement().use { it.execute("SELECT set_config('$setting', '\"$id\"', false)") }
+    }
+
+    private fun Connection.explain(sql: String): String =
+        createStatement().use { statement ->
+            statement.executeQuery("EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF, SUMMARY OFF) $sql").use { rows ->
+                buildString {
+                    while (rows.next()) appendLine(rows.getString(1))
+                }
+            }
+        }
+
+    private fun Connection.count(sql: String): Long = nullableLong(sql)!!
+
+    private fun Connection.nullableLong(sql: String): Long? =
+        createStatement().use { statement ->
+            statement.executeQuery(sql).use { rows ->
+                rows.next()
+                rows.getObject(1) as Long?
+            }
+        }
+
+    private fun migration(path: String): String =
+        javaClass.getResource("/db/migration/$path")!!.readText().replace("\$\$\$schema\$\$\$", SCHEMA)
+
+    private fun execute(vararg statements: String) {
+        dataSource.connection.use { connection ->
+            connection.createStatement().use { statement ->
+                statements.forEach { statement.execute(it.trimIndent()) }
+            }
+        }
+    }
+
+    companion object {
+        private const val SCHEMA = "scope_plan"
+        private const val TENANTS = 100
+        private const val ROWS_PER_TENANT = 1_000
+        private const val BUSINESS_UNITS = 4
+        private const val TENANT_ID = 42L
+        private const val BUSINESS_UNIT_ID = 3L
+
+        // Views exactly as generated by CreateViewSQLTemplate, function mode first, then inline mode
+        private val FUNCTION_TENANT_VIEW = """
+            DROP VIEW IF EXISTS vw_invoice CASCADE;
+            CREATE OR REPLACE VIEW vw_invoice WITH (security_barrier)
+            AS
+            SELECT *
+            FROM invoice
+            WHERE
+              expiry_timestamp > now()
+            WITH CHECK OPTION;
+        """
+
+        private val INLINE_TENANT_VIEW = """
+            DROP VIEW IF EXISTS vw_invoice CASCADE;
+            CREATE OR REPLACE VIEW vw_invoice WITH (security_barrier)
+            AS
+            SELECT *
+            FROM invoice
+            WHERE
+              tenant_id = current_tenant_scope() AND expiry_timestamp = 'infinity'
+            WITH CHECK OPTION;
+        """
+
+        private val INLINE_BUSINESS_UNIT_VIEW = """
+            DROP VIEW IF EXISTS vw_expense CASCADE;
+            CREATE OR REPLACE VIEW vw_expense WITH (security_barrier)
+            AS
+            SELECT *
+            FROM expense
+            WHERE
+              tenant_id = current_tenant_scope() AND business_unit_id = current_business_unit_scope() AND expiry_timestamp = 'infinity'
+            WITH CHECK OPTION;
+        """
+    }
+}
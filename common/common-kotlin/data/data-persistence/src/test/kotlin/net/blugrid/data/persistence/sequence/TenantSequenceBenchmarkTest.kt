@@ -0,0 +1,175 @@
+package net.blugrid.data.persistence.sequence
+
+import net.blugrid.data.persistence.service.DatabaseService
+import net.blugrid.platform.config.DbProps
+import org.hibernate.engine.jdbc.spi.JdbcCoordinator
+import org.hibernate.engine.spi.SharedSessionContractImplementor
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+import java.lang.reflect.Proxy
+import java.sql.PreparedStatement
+import java.sql.ResultSet
+import java.util.concurrent.ConcurrentHashMap
+import java.util.concurrent.Executors
+import java.util.concurrent.TimeUnit
+import java.util.concurrent.atomic.AtomicLong
+import java.util.concurrent.locks.LockSupport
+
+/**
+ * Compares database round trips and throughput of the per-call and pooled sequence paths
+ * against an in-memory sequence store with a simulated network latency per statement
+ */
+class TenantSequenceBenchmarkTest {
+
+    private val tenantId = 7L
+    private val tenantMinId = tenantId * 100_000_000L
+    private val tenantMaxId = (tenantId + 1) * 100_000_000L - 1
+
+    @Test
+    fun `Pooled sequence path issues fewer round trips and hands out unique in-range IDs`() {
+        val legacy = run(pooled = false)
+        val pooled = run(pooled = true)
+
+        println(
+            "tenantNextVal x$IDS_PER_RUN: " +
+                "legacy ${legacy.roundTrips} round trips, ${legacy.idsPerSecond} ids/sec | " +
+                "pooled ${pooled.roundTrips} round trips, ${pooled.idsPerSecond} ids/sec"
+        )
+
+        assertEquals(IDS_PER_RUN, legacy.ids.size)
+        assertEquals(IDS_PER_RUN, pooled.ids.size)
+        assertTrue(pooled.ids.all { it in (tenantMinId + 1)..tenantMaxId })
+        assertTrue(pooled.roundTrips * 10 < legacy.roundTrips)
+        assertEquals(0L, pooled.transactionalCreates)
+    }
+
+    private fun run(pooled: Boolean): RunResult {
+        val databaseService = InMemorySequenceDatabaseService(tenantMinId, tenantMaxId)
+        val tenantSequence = TenantSequenceImpl(dbProps(pooled), databaseService)
+        val session = sessionProxy()
+        val ids = ConcurrentHashMap.newKeySet<Long>()
+
+        val executor = Executors.newFixedThreadPool(THREADS)
+        val started = System.nanoTime()
+        repeat(THREADS) {
+            executor.execute {
+                repeat(IDS_PER_RUN / THREADS) {
+                    ids.add(tenantSequence.tenantNextVal(session, "invoice", tenantId))
+                }
+            }
+        }
+        executor.shutdown()
+        executor.awaitTermination(1, TimeUnit.MINUTES)
+        val elapsedNanos = System.nanoTime() - started
+
+        return RunResult(
+            ids,
+            databaseService.roundTrips.get(),
+            IDS_PER_RUN * 1_000_000_000L / elapsedNanos,
+            databaseService.transactionalCreates.get(),
+        )
+    }
+
+    private data class RunResult(val ids: Set<Long>, val roundTrips: Long, val idsPerSecond: Long, val transactionalCreates: Long)
+
+    private fun dbProps(pooled: Boolean) = object : DbProps {
+        override val dbname = "benchmark"
+        override val schema = "public"
+        override val sequencePoolingEnabled = pooled
+        override val sequenceBlockSize = 100
+        override val connectionScopeCachingEnabled = false
+    }
+
+    private fun sessionProxy(): SharedSessionContractImplementor {
+        val jdbcCoordinator = proxy<JdbcCoordinator> { _, _ -> null }
+        return proxy { name, _ -> if (name == "getJdbcCoordinator") jdbcCoordinator else null }
+    }
+
+    /**
+     * Emulates pg_sequences, table_column_exists, tenant_sequence_details and nextval
+     */
+    private class InMemorySequenceDatabaseService(
+        private val tenantMinId: Long,
+        private val tenantMaxId: Long,
+    ) : DatabaseService {
+
+        val roundTrips = AtomicLong()
+
+        // Sequences created inside the caller's transaction, which a rollback would drop again
+        val transactionalCreates = AtomicLong()
+        private val sequences = ConcurrentHashMap<String, AtomicLong>()
+
+        override fun executeQuery(jdbcCoordinator: JdbcCoordinator, sql: String, params: List<Any>?): ResultSet? {
+            roundTrip()
+            val rows: List<List<Any>> = when {
+                sql.contains("pg_sequences") -> listOf(listOf(sequences.containsKey("${params!![0]}.${params[1]}")))
+                sql.contains("table_column_exists") -> listOf(listOf(true))
+                sql.contains("tenant_sequence_details") -> listOf(listOf(tenantMinId, tenantMaxId))
+                sql.contains("generate_series") -> List(params!![0] as Int) { listOf(nextVal(sql)) }
+                sql.contains("nextval") -> listOf(listOf(nextVal(sql)))
+                else -> error("Unexpected query: $sql")
+            }
+            return resultSet(rows)
+        }
+
+        override fun executeUpdate(jdbcCoordinator: JdbcCoordinator, sql: String, params: List<Any>) {
+            transactionalCreates.incrementAndGet()
+            createSequence(sql)
+        }
+
+        override fun executeIsolatedUpdate(session: SharedSessionContractImplementor, sql: String) = createSequence(sql)
+
+        private fun createSequence(sql: String) {
+            roundTrip()
+            val name = sql.removePrefix("CREATE SEQUENCE IF NOT EXISTS ").substringBefore(' ')
+            val start = sql.substringAfter("START WITH ").substringBefore(' ').toLong()
+            sequences.putIfAbsent(name, AtomicLong(start - 1))
+        }
+
+        override fun releaseResources(jdbcCoordinator: JdbcCoordinator, resultSet: ResultSet?, preparedStatement: PreparedStatement?) = Unit
+
+        private fun nextVal(sql: String): Long {
+            val name = sql.substringAfter("nextval('").substringBefore("')")
+            return sequences.getValue(name).incrementAndGet()
+        }
+
+        private fun roundTrip() {
+            roundTrips.incrementAndGet()
+            LockSupport.parkNanos(SIMULATED_LATENCY_NANOS)
+        }
+
+        private fun resultSet(rows: List<List<Any>>): ResultSet {
+            var index = -1
+            return proxy { name, args ->
+                when (name) {
+                    "next" -> ++index < rows.size
+                    "getBoolean" -> rows[index][(args!![0] as Int) - 1] as Boolean
+                    "getLong" -> when (val column = args!![0]) {
+                        is Int -> rows[index][column - 1] as Long
+                        "min_id" -> rows[index][0] as Long
+                        else -> rows[index][1] as Long
+                    }
+                    "close" -> Unit
+                    else -> null
+                }
+            }
+        }
+    }
+
+    companion object {
+        private const val THREADS = 4
+        private const val IDS_PER_RUN = 2_000
+        private const val SIMULATED_LATENCY_NANOS = 20_000L
+    }
+}
+
+private inline fun <reified T> proxy(crossinline handler: (String, Array<out Any?>?) -> Any?): T =
+    Proxy.newProxyInstance(T::class.java.classLoader, arrayOf(T::class.java)) { self, method, args ->
+        when (method.name) {
+            "hashCode" -> System.identityHashCode(self)
+            "equals" -> self === args?.get(0)
+            "toString" -> T::class.java.simpleName
+            else -> handler(method.name, args)
+        }
+    } as T
@@ -17,6 +17,9 @@ dependencies {
     kapt(libs.micronaut.inject.java)
 
     testImplementation(libs.bundles.testing)
+    testImplementation(project(":common:common-kotlin:platform:platform-testing"))
+    testImplementation(project(":common:common-kotlin:data:data-persistence"))
+    testImplementation(libs.postgresql)
 }
 
 tasks.test {
@@ -0,0 +1,84 @@
+package net.blugrid.data.sync
+
+import java.sql.Connection
+import java.sql.PreparedStatement
+import java.sql.Statement
+import java.sql.Timestamp
+
+/**
+ * Applies change batches to a replica table with version checked bulk writes
+ *
+ * Upserts are sent as one JDBC batch of `INSERT ... ON CONFLICT (id) DO UPDATE` statements that
+ * only overwrite a row holding an older version, and tombstones as one batch of deletes that
+ * only remove a row holding the same or an older version. Re-applying a batch is a no-op, so a
+ * sync can resume from its last checkpoint after a failure without corrupting the replica.
+ *
+ * The replica table needs an `id` primary key, the resource's payload columns, `version`,
+ * `last_changed_timestamp` and `expiry_timestamp`. Readers of the replica filter on
+ * `expiry_timestamp` to drop rows whose expiry has passed since they were copied. Statements
+ * run on the caller's connection and transaction.
+ */
+class ChangeApplier {
+
+    fun apply(connection: Connection, resource: SyncResource, changes: List<SyncChange>): ApplyResult {
+        val upserts = changes.filterIsInstance<SyncChange.Upsert>()
+        val tombstones = changes.filterIsInstance<SyncChange.Tombstone>()
+
+        val upserted = if (upserts.isEmpty()) 0 else connection.prepareStatement(upsertSql(resource)).use { statement ->
+            upserts.forEach { change ->
+                var index = 0
+                statement.setLong(++index, change.id)
+                resource.columns.forEach { statement.setObject(++index, change.values[it]) }
+                statement.setInt(++index, change.version)
+                statement.setTimestamp(++index, Timestamp.valueOf(change.changedAt))
+                statement.setObject(++index, change.expiresAt)
+                statement.addBatch()
+            }
+            statement.executeBatchCountingApplied()
+        }
+
+        val deleted = if (tombstones.isEmpty()) 0 else connection.prepareStatement(deleteSql(resource)).use { statement ->
+            tombstones.forEach { change ->
+                statement.setLong(1, change.id)
+                statement.setInt(2, change.version)
+                statement.addBatch()
+            }
+            statement.executeBatchCountingApplied()
+        }
+
+        return ApplyResult(
+            upserted = upserted,
+            deleted = deleted,
+            skipped = changes.size - upserted - deleted,
+        )
+    }
+
+    /**
+     * Rows written by the batch; a driver that cannot report per statement counts (for example
+     * with `reWriteBatchedInserts`) is assumed to have applied every statement
+     */
+    private fun PreparedStatement.executeBatchCountingApplied(): Int =
+        executeBatch().count { it > 0 || it == Statement.SUCCESS_NO_INFO }
+
+    private fun upsertSql(resource: SyncResource): String {
+        val columns = listOf("id") + resource.columns + listOf("version", "last_changed_timestamp", "expiry_timestamp")
+        return buildString {
+            append("INSERT INTO ").append(resource.table).append(" AS target (")
+            append(columns.joinToString(", "))
+            append(") VALUES (")
+            append(columns.joinToString(", ") { "?" })
+            append(") ON CONFLICT (id) DO UPDATE SET ")
+            append(columns.drop(1).joinToString(", ") { "$it = EXCLUDED.$it" })
+            append(" WHERE target.version < EXCLUDED.version")
+        }
+    }
+
+    private fun deleteSql(resource: SyncResource): String =
+        "DELETE FROM ${resource.table} WHERE id = ? AND version <= ?"
+
+    data class ApplyResult(
+        val upserted: Int,
+        val deleted: Int,
+        val skipped: Int,
+    )
+}
@@ -0,0 +1,112 @@
+package net.blugrid.data.sync
+
+import net.blugrid.platform.logging.logger
+import java.sql.Connection
+import java.sql.ResultSet
+import java.time.LocalDateTime
+import javax.sql.DataSource
+
+/**
+ * Incremental change feed over the `_common_audit_columns` of resource tables
+ *
+ * Every insert, update and soft delete stamps `last_changed_xid` with the writing transaction's
+ * id and bumps `version` (see the audit triggers), so the rows changed since a watermark are
+ * the rows after it in `(last_changed_xid, id)` order.
+ *
+ * Transaction ids are assigned when a transaction first writes, not when it commits, so a
+ * reader only reads up to the `xmin` of its snapshot: every transaction below it has finished,
+ * and no change can later appear behind the watermark however long its transaction ran. The
+ * feed therefore lags behind the oldest transaction still running on the server.
+ *
+ * Rows whose `expiry_timestamp` has passed when they are read are returned as tombstones. Rows
+ * soft deleted with a future expiry are returned as upserts carrying it, as the feed cannot see
+ * the expiry passing; replicas must filter on `expiry_timestamp` like the source's views do.
+ */
+class ChangeFeed(
+    private val dataSource: DataSource,
+) {
+
+    private val log = logger()
+
+    /**
+     * Reads up to [limit] changes after [after] in a single query
+     */
+    fun fetch(resource: SyncResource, tenantId: Long?, after: SyncWatermark, limit: Int): ChangeBatch {
+        require(limit > 0) { "Batch size must be positive, was $limit" }
+        require(!resource.tenantScoped || tenantId != null) { "Tenant id is required for tenant scoped resource ${resource.type}" }
+
+        return dataSource.connection.use { connection ->
+            connection.isReadOnly = true
+            fetch(connection, resource, tenantId, after, limit)
+        }
+    }
+
+    /**
+     * Lazily streams every change after [from], one query per batch
+     *
+     * Only one batch is held in memory at a time, and the next batch is not read until the
+     * previous one has been consumed.
+     */
+    fun changes(resource: SyncResource, tenantId: Long?, from: SyncWatermark, batchSize: Int): Sequence<ChangeBatch> =
+        sequence {
+            var watermark = from
+            do {
+                val batch = fetch(resource, tenantId, watermark, batchSize)
+                if (batch.changes.isNotEmpty()) yield(batch)
+                watermark = batch.watermark
+            } while (batch.changes.size == batchSize)
+        }
+
+    private fun fetch(connection: Connection, resource: SyncResource, tenantId: Long?, after: SyncWatermark, limit: Int): ChangeBatch {
+        val sql = selectSql(resource)
+        val changes = ArrayList<SyncChange>(limit)
+
+        connection.prepareStatement(sql).use { statement ->
+            var index = 0
+            if (resource.tenantScoped) statement.setLong(++index, tenantId!!)
+            statement.setLong(++index, after.xid)
+            statement.setLong(++index, after.id)
+            statement.setInt(++index, limit)
+
+            statement.executeQuery().use { rows ->
+                while (rows.next()) changes.add(rows.toChange(resource))
+            }
+        }
+
+        val watermark = changes.lastOrNull()?.let { SyncWatermark(it.xid, it.id) } ?: after
+        log.debug("Read {} changes of {} (tenant {}) after {}", changes.size, resource.type, tenantId, after)
+        return ChangeBatch(changes, watermark)
+    }
+
+    private fun ResultSet.toChange(resource: SyncResource): SyncChange {
+        val id = getLong("id")
+        val version = getInt("version")
+        val xid = getLong("last_changed_xid")
+        val changedAt = getObject("last_changed_timestamp", LocalDateTime::class.java)
+
+        return if (getBoolean(DELETED_COLUMN)) {
+            SyncChange.Tombstone(id, version, xid, changedAt)
+        } else {
+            val expiresAt = getObject("expiry_timestamp", LocalDateTime::class.java)
+            SyncChange.Upsert(id, version, xid, changedAt, expiresAt, resource.columns.associateWith { getObject(it) })
+        }
+    }
+
+    private fun selectSql(resource: SyncResource): String =
+        buildString {
+            append("SELECT id, version, last_changed_xid, last_changed_timestamp, expiry_timestamp")
+            append(", expiry_timestamp <= now() AS ").append(DELETED_COLUMN)
+            resource.columns.forEach { append(", ").append(it) }
+            append(" FROM ").append(resource.table)
+            append(" WHERE ")
+            if (resource.tenantScoped) append("tenant_id = ? AND ")
+            append("(last_changed_xid, id) > (?, ?)")
+            append(" AND last_changed_xid < pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+            append(" ORDER BY last_changed_xid, id")
+            append(" LIMIT ?")
+        }
+
+    companion object {
+        private const val DELETED_COLUMN = "_sync_deleted"
+    }
+}
@@ -1,3 +1,122 @@
 package net.blugrid.data.sync
 
-// Placeholder for data sync utilities
\ No newline at end of file
+import java.time.LocalDateTime
+
+/**
+ * A resource table that can be synced
+ *
+ * @param type Resource type, used as the checkpoint key
+ * @param table Table the changes are read from, or applied to on the receiving side.
+ *   Changes are read from the base table rather than its view, so soft deleted rows are seen.
+ * @param columns Payload columns copied to the receiving side, excluding `id` and the audit columns
+ * @param tenantScoped Whether the table has a `tenant_id` column changes must be filtered on
+ */
+data class SyncResource(
+    val type: String,
+    val table: String,
+    val columns: List<String>,
+    val tenantScoped: Boolean,
+) {
+    init {
+        (listOf(table) + columns).forEach {
+            require(IDENTIFIER.matches(it)) { "Invalid SQL identifier for sync resource $type: $it" }
+        }
+    }
+
+    fun forTable(table: String): SyncResource = copy(table = table)
+
+    companion object {
+        private val IDENTIFIER = Regex("[A-Za-z_][A-Za-z0-9_]*(\\.[A-Za-z_][A-Za-z0-9_]*)?")
+    }
+}
+
+/**
+ * Identifies one sync stream: a consumer following one resource type of one tenant
+ *
+ * @param tenantId Tenant the changes belong to, `null` for unscoped resources
+ */
+data class SyncKey(
+    val consumer: String,
+    val resourceType: String,
+    val tenantId: Long?,
+)
+
+/**
+ * Position in a change feed: the transaction id and row id of the last change seen
+ *
+ * Changes are ordered by `(last_changed_xid, id)`, so the row id breaks ties between rows
+ * written by the same transaction and no change is skipped or repeated between batches.
+ */
+data class SyncWatermark(
+    val xid: Long,
+    val id: Long,
+) {
+    companion object {
+        val INITIAL = SyncWatermark(Long.MIN_VALUE, Long.MIN_VALUE)
+    }
+}
+
+/**
+ * A single row change read from a change feed
+ *
+ * @param xid Id of the transaction that made the change
+ */
+sealed interface SyncChange {
+    val id: Long
+    val version: Int
+    val xid: Long
+    val changedAt: LocalDateTime
+
+    /**
+     * The row was created or updated and has not expired yet
+     *
+     * @param expiresAt The row's `expiry_timestamp`, [LocalDateTime.MAX] for `infinity`. A future
+     *   expiry is applied by the receiving side, see [ChangeFeed].
+     * @param values Payload column values keyed by column name
+     */
+    data class Upsert(
+        override val id: Long,
+        override val version: Int,
+        override val xid: Long,
+        override val changedAt: LocalDateTime,
+        val expiresAt: LocalDateTime,
+        val values: Map<String, Any?>,
+    ) : SyncChange
+
+    /**
+     * The row was soft deleted: its `expiry_timestamp` had passed when the change was read
+     */
+    data class Tombstone(
+        override val id: Long,
+        override val version: Int,
+        override val xid: Long,
+        override val changedAt: LocalDateTime,
+    ) : SyncChange
+}
+
+/**
+ * A batch of changes in feed order, with the watermark to resume from after it
+ */
+data class ChangeBatch(
+    val changes: List<SyncChange>,
+    val watermark: SyncWatermark,
+)
+
+/**
+ * Outcome of one sync run
+ *
+ * @param skipped Changes not applied because the receiving side already had the same or a newer version
+ */
+data class SyncStats(
+    val batches: Long,
+    val upserted: Long,
+    val deleted: Long,
+    val skipped: Long,
+    val elapsedNanos: Long,
+) {
+    val rows: Long
+        get() = upserted + deleted + skipped
+
+    val rowsPerSecond: Long
+        get() = if (elapsedNanos > 0) rows * 1_000_000_000L / elapsedNanos else 0
+}
@@ -0,0 +1,68 @@
+package net.blugrid.data.sync
+
+import java.sql.Connection
+import java.sql.PreparedStatement
+
+/**
+ * Persists the watermark of each sync stream on the receiving side
+ *
+ * Checkpoints are read and written on the connection the changes are applied on, so a
+ * checkpoint commits atomically with the batch it follows.
+ */
+interface SyncCheckpointStore {
+    fun load(connection: Connection, key: SyncKey): SyncWatermark?
+    fun save(connection: Connection, key: SyncKey, watermark: SyncWatermark)
+}
+
+/**
+ * Checkpoints kept in the `_sync_checkpoint` table, see `R__70__sync_checkpoint.sql`
+ */
+class JdbcSyncCheckpointStore(
+    private val table: String = DEFAULT_TABLE,
+) : SyncCheckpointStore {
+
+    override fun load(connection: Connection, key: SyncKey): SyncWatermark? =
+        connection.prepareStatement(
+            "SELECT last_xid, last_id FROM $table WHERE consumer = ? AND resource_type = ? AND tenant_id = ?"
+        ).use { statement ->
+            statement.bind(key)
+            statement.executeQuery().use { rows ->
+                if (rows.next()) {
+                    SyncWatermark(rows.getLong("last_xid"), rows.getLong("last_id"))
+                } else {
+                    null
+                }
+            }
+        }
+
+    override fun save(connection: Connection, key: SyncKey, watermark: SyncWatermark) {
+        connection.prepareStatement(
+            """
+            INSERT INTO $table (consumer, resource_type, tenant_id, last_xid, last_id, updated_timestamp)
+            VALUES (?, ?, ?, ?, ?, now())
+            ON CONFLICT (consumer, resource_type, tenant_id)
+            DO UPDATE SET last_xid = EXCLUDED.last_xid, last_id = EXCLUDED.last_id, updated_timestamp = now()
+            """.trimIndent()
+        ).use { statement ->
+            statement.bind(key)
+            statement.setLong(4, watermark.xid)
+            statement.setLong(5, watermark.id)
+            statement.executeUpdate()
+        }
+    }
+
+    private fun PreparedStatement.bind(key: SyncKey) {
+        setString(1, key.consumer)
+        setString(2, key.resourceType)
+        setLong(3, key.tenantId ?: UNSCOPED_TENANT_ID)
+    }
+
+    companion object {
+        const val DEFAULT_TABLE = "_sync_checkpoint"
+
+        /**
+         * Stored in place of a null tenant id for unscoped resources, as it is part of the primary key
+         */
+        const val UNSCOPED_TENANT_ID = 0L
+    }
+}
@@ -0,0 +1,77 @@
+package net.blugrid.data.sync
+
+import net.blugrid.platform.logging.logger
+import javax.sql.DataSource
+
+/**
+ * Replicates a resource table incrementally from a source database to a target database
+ *
+ * Each run resumes from the consumer's checkpoint, streams the changes after it from the
+ * [ChangeFeed] and applies each batch in its own target transaction together with the
+ * checkpoint that follows it. A run that fails part way leaves the target at the last
+ * committed batch, and the next run continues from there.
+ */
+class SyncEngine(
+    private val feed: ChangeFeed,
+    private val target: DataSource,
+    private val applier: ChangeApplier = ChangeApplier(),
+    private val checkpoints: SyncCheckpointStore = JdbcSyncCheckpointStore(),
+) {
+
+    private val log = logger()
+
+    /**
+     * Applies every change of [resource] since the last checkpoint of [key]
+     *
+     * @param targetTable Replica table on the target, defaults to the source table name
+     */
+    fun sync(
+        key: SyncKey,
+        resource: SyncResource,
+        targetTable: String = resource.table,
+        batchSize: Int = DEFAULT_BATCH_SIZE,
+    ): SyncStats {
+        require(key.resourceType == resource.type) { "Sync key ${key.resourceType} does not match resource ${resource.type}" }
+
+        val started = System.nanoTime()
+        val replica = resource.forTable(targetTable)
+        val from = target.connection.use { checkpoints.load(it, key) } ?: SyncWatermark.INITIAL
+
+        var batches = 0L
+        var upserted = 0L
+        var deleted = 0L
+        var skipped = 0L
+
+        log.debug("Syncing {} for {} from {}", resource.type, key, from)
+
+        feed.changes(resource, key.tenantId, from, batchSize).forEach { batch ->
+            target.connection.use { connection ->
+                connection.autoCommit = false
+                try {
+                    val result = applier.apply(connection, replica, batch.changes)
+                    checkpoints.save(connection, key, batch.watermark)
+                    connection.commit()
+
+                    batches++
+                    upserted += result.upserted
+                    deleted += result.deleted
+                    skipped += result.skipped
+                } catch (e: Exception) {
+                    connection.rollback()
+                    throw e
+                }
+            }
+        }
+
+        return SyncStats(batches, upserted, deleted, skipped, System.nanoTime() - started).also {
+            log.info(
+                "Synced {} for {}: {} upserted, {} deleted, {} skipped in {} batches ({} rows/sec)",
+                resource.type, key, it.upserted, it.deleted, it.skipped, it.batches, it.rowsPerSecond
+            )
+        }
+    }
+
+    companion object {
+        const val DEFAULT_BATCH_SIZE = 5_000
+    }
+}
@@ -0,0 +1,17 @@
+-- -----------------------------------------------------------------------------
+-- Table: _sync_checkpoint
+-- Description: Change feed watermark per consumer, resource type and tenant,
+--              written in the same transaction as the batch it follows.
+--              tenant_id is 0 for unscoped resources.
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS _sync_checkpoint
+(
+    consumer          VARCHAR(255) NOT NULL,
+    resource_type     VARCHAR(255) NOT NULL,
+    tenant_id         bigint       NOT NULL,
+    last_xid          bigint       NOT NULL,
+    last_id           bigint       NOT NULL,
+    updated_timestamp TIMESTAMP    NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_sync_checkpoint PRIMARY KEY (consumer, resource_type, tenant_id)
+)
+    WITHOUT OIDS;
@@ -0,0 +1,161 @@
+package net.blugrid.data.sync
+
+import net.blugrid.platform.testing.support.PostgresTestSupport
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.BeforeEach
+import org.junit.jupiter.api.Test
+import org.postgresql.ds.PGSimpleDataSource
+import javax.sql.DataSource
+
+/**
+ * Measures sync throughput for an initial load and for steady state deltas against Postgres,
+ * and checks that the replica converges, resumes from its checkpoint and ignores replays
+ */
+class SyncThroughputBenchmarkTest {
+
+    private val dataSource: DataSource = PGSimpleDataSource().apply {
+        setUrl(PostgresTestSupport.postgresContainer.jdbcUrl)
+        user = PostgresTestSupport.USERNAME
+        password = PostgresTestSupport.PASSWORD
+        currentSchema = SCHEMA
+    }
+
+    private val resource = SyncResource(
+        type = "invoice",
+        table = "invoice",
+        columns = listOf("uuid", "name", "amount"),
+        tenantScoped = true,
+    )
+
+    private val key = SyncKey(consumer = "benchmark", resourceType = "invoice", tenantId = TENANT_ID)
+
+    private val engine = SyncEngine(ChangeFeed(dataSource), dataSource)
+
+    @BeforeEach
+    fun setup() {
+        val auditDdl = javaClass.getResource("/db/migration/audit/R__40__audit_trigger_and_version_fn.sql")!!.readText()
+        val checkpointDdl = javaClass.getResource("/db/migration/sync/R__70__sync_checkpoint.sql")!!.readText()
+        execute(
+            "DROP SCHEMA IF EXISTS $SCHEMA CASCADE",
+            "CREATE SCHEMA $SCHEMA",
+            "CREATE DOMAIN t_line_number AS SMALLINT",
+            auditDdl,
+            """
+            CREATE TABLE invoice (
+                id bigint PRIMARY KEY,
+                tenant_id bigint NOT NULL,
+                uuid uuid NOT NULL,
+                name varchar(255) NOT NULL,
+                amount numeric(12, 2) NOT NULL
+            )
+            INHERITS (_common_audit_columns)
+            """,
+            "CREATE INDEX idx_invoice_tenant_id_last_changed_xid ON invoice USING btree (tenant_id, last_changed_xid, id)",
+            "CREATE TRIGGER trig_invoice_insert_audit BEFORE INSERT ON invoice FOR EACH ROW EXECUTE PROCEDURE proc_trig_insert_audit_columns()",
+            "CREATE TRIGGER trig_invoice_update_audit BEFORE UPDATE ON invoice FOR EACH ROW EXECUTE PROCEDURE proc_trig_update_audit_columns()",
+            """
+            CREATE TABLE invoice_replica (
+                id bigint PRIMARY KEY,
+                uuid uuid NOT NULL,
+                name varchar(255) NOT NULL,
+                amount numeric(12, 2) NOT NULL,
+                version smallint NOT NULL,
+                last_changed_timestamp timestamp NOT NULL,
+                expiry_timestamp timestamp NOT NULL
+            )
+            """,
+            checkpointDdl,
+            insertInvoices(1, ROWS),
+        )
+    }
+
+    @Test
+    fun `initial load and deltas converge and resume from the checkpoint`() {
+        val tenantRows = ROWS - ROWS / 10
+
+        val initial = engine.sync(key, resource, targetTable = "invoice_replica")
+        assertEquals(tenantRows.toLong(), initial.upserted)
+        assertEquals(tenantRows.toLong(), count("SELECT count(*) FROM invoice_replica"))
+
+        // Plain application writes: the audit triggers bump version and last_changed_xid
+        execute(
+            "UPDATE invoice SET name = name || ' v2' WHERE id % 20 = 1",
+            "UPDATE invoice SET expiry_timestamp = now() WHERE id % 50 = 3",
+            "UPDATE invoice SET expiry_timestamp = now() + INTERVAL '1 hour' WHERE id % 50 = 7",
+        )
+        val updated = count("SELECT count(*) FROM invoice WHERE tenant_id = $TENANT_ID AND id % 20 = 1")
+        val deleted = count("SELECT count(*) FROM invoice WHERE tenant_id = $TENANT_ID AND id % 50 = 3")
+        val expiring = count("SELECT count(*) FROM invoice WHERE tenant_id = $TENANT_ID AND id % 50 = 7")
+
+        val delta = engine.sync(key, resource, targetTable = "invoice_replica")
+        assertEquals(updated + expiring, delta.upserted)
+        assertEquals(deleted, delta.deleted)
+        assertEquals(tenantRows - deleted, count("SELECT count(*) FROM invoice_replica"))
+        assertEquals(updated, count("SELECT count(*) FROM invoice_replica WHERE name LIKE '% v2'"))
+        assertEquals(expiring, count("SELECT count(*) FROM invoice_replica WHERE expiry_timestamp <> 'infinity'"))
+
+        assertEquals(0L, engine.sync(key, resource, targetTable = "invoice_replica").rows)
+
+        execute("DELETE FROM _sync_checkpoint")
+        val replay = engine.sync(key, resource, targetTable = "invoice_replica")
+        assertEquals(0L, replay.upserted + replay.deleted)
+        assertEquals(tenantRows - deleted, count("SELECT count(*) FROM invoice_replica"))
+
+        println(
+            "sync of $tenantRows rows: initial load ${initial.rowsPerSecond} rows/sec | " +
+                "delta of ${delta.rows} rows ${delta.rowsPerSecond} rows/sec | " +
+                "replay of ${replay.rows} rows ${replay.rowsPerSecond} rows/sec"
+        )
+    }
+
+    @Test
+    fun `a long transaction that commits after a later one is not skipped`() {
+        engine.sync(key, resource, targetTable = "invoice_replica")
+
+        dataSource.connection.use { longRunning ->
+            longRunning.autoCommit = false
+            longRunning.createStatement().use { it.execute(insertInvoices(ROWS + 1, ROWS + 1)) }
+
+            execute(insertInvoices(ROWS + 11, ROWS + 11))
+            assertEquals(0L, engine.sync(key, resource, targetTable = "invoice_replica").rows)
+
+            longRunning.commit()
+        }
+
+        assertEquals(2L, engine.sync(key, resource, targetTable = "invoice_replica").upserted)
+        assertEquals(2L, count("SELECT count(*) FROM invoice_replica WHERE id > $ROWS"))
+    }
+
+    private fun insertInvoices(firstId: Int, lastId: Int): String =
+        """
+        INSERT INTO invoice (id, tenant_id, uuid, name, amount, created_by_session_id, last_changed_by_session_id)
+        SELECT g, CASE WHEN g % 10 = 0 THEN $OTHER_TENANT_ID ELSE $TENANT_ID END, gen_random_uuid(),
+               'invoice ' || g, g % 1000, 0, 0
+        FROM generate_series($firstId, $lastId) g
+        """
+
+    private fun execute(vararg statements: String) {
+        dataSource.connection.use { connection ->
+            connection.createStatement().use { statement ->
+                statements.forEach { statement.execute(it.trimIndent()) }
+            }
+        }
+    }
+
+    private fun count(sql: String): Long =
+        dataSource.connection.use { connection ->
+            connection.createStatement().use { statement ->
+                statement.executeQuery(sql).use { rows ->
+                    rows.next()
+                    rows.getLong(1)
+                }
+            }
+        }
+
+    companion object {
+        private const val SCHEMA = "sync_benchmark"
+        private const val ROWS = 200_000
+        private const val TENANT_ID = 1L
+        private const val OTHER_TENANT_ID = 2L
+    }
+}
@@ -21,6 +21,8 @@ import net.blugrid.security.core.model.DecoratedAuthentication
 import net.blugrid.security.core.session.BusinessUnitSession
 import net.blugrid.security.core.session.GuestSession
 import net.blugrid.security.core.session.TenantSession
+import java.util.concurrent.ConcurrentHashMap
+import java.util.concurrent.atomic.AtomicLong
 
 /**
  * AuthServerInterceptor - Fixed Version
@@ -43,10 +45,41 @@ class AuthServerInterceptor : ServerInterceptor, Ordered {
         const val BUSINESS_UNIT_ID = "x-business-unit-id"
         const val OPERATOR_ID = "x-operator-id"
         const val WEB_APP_ID = "x-web-app-id"
+
+        /**
+         * Maximum number of distinct header sets whose authentication is kept for reuse
+         */
+        const val AUTHENTICATION_CACHE_SIZE = 10_000
+
+        /**
+         * Size a full authentication cache is trimmed back to, so trimming runs once per tenth of the cache
+         */
+        private const val AUTHENTICATION_CACHE_TRIM_SIZE = AUTHENTICATION_CACHE_SIZE * 9 / 10
+
+        private val SESSION_ID_KEY = asciiKey(SESSION_ID)
+        private val SESSION_TYPE_KEY = asciiKey(SESSION_TYPE)
+        private val USER_ID_KEY = asciiKey(USER_ID)
+        private val TENANT_ID_KEY = asciiKey(TENANT_ID)
+        private val BUSINESS_UNIT_ID_KEY = asciiKey(BUSINESS_UNIT_ID)
+        private val OPERATOR_ID_KEY = asciiKey(OPERATOR_ID)
+        private val WEB_APP_ID_KEY = asciiKey(WEB_APP_ID)
+
+        private fun asciiKey(name: String): Metadata.Key<String> = Metadata.Key.of(name, Metadata.ASCII_STRING_MARSHALLER)
     }
 
     private val log = logger()
 
+    /**
+     * Authentications are immutable and fully determined by the context headers, so calls
+     * within the same session reuse the instance built for the first call. Lookups take no lock.
+     */
+    private val authentications = ConcurrentHashMap<AuthHeaders, DecoratedAuthentication<out BaseAuthenticatedSession>>()
+    private val hits = AtomicLong()
+    private val misses = AtomicLong()
+
+    val authenticationCacheStats: AuthenticationCacheStats
+        get() = AuthenticationCacheStats(hits.get(), misses.get(), authentications.size)
+
     /**
      * Set high priority (low number) to ensure auth context is set early
      * in the interceptor chain, before other interceptors that might need it
@@ -60,7 +93,7 @@ class AuthServerInterceptor : ServerInterceptor, Ordered {
     ): ServerCall.Listener<ReqT> {
 
         // Extract authentication from gRPC headers
-        val authentication = reconstructAuthenticationFromHeaders(headers)
+        val authentication = authenticationFromHeaders(headers)
 
         if (authentication != null) {
             val tenantId = getTenantIdFromAuth(authentication)
@@ -98,29 +131,61 @@ class AuthServerInterceptor : ServerInterceptor, Ordered {
         }
     }
 
+    /**
+     * Authentication for the context headers, reusing the one built for the same headers before
+     */
+    internal fun authenticationFromHeaders(headers: Metadata): DecoratedAuthentication<out BaseAuthenticatedSession>? {
+        val authHeaders = AuthHeaders(
+            sessionId = headers.get(SESSION_ID_KEY) ?: return null,
+            sessionType = headers.get(SESSION_TYPE_KEY) ?: return null,
+            userId = headers.get(USER_ID_KEY) ?: return null,
+            webAppId = headers.get(WEB_APP_ID_KEY) ?: return null,
+            tenantId = headers.get(TENANT_ID_KEY),
+            businessUnitId = headers.get(BUSINESS_UNIT_ID_KEY),
+            operatorId = headers.get(OPERATOR_ID_KEY),
+        )
+
+        authentications[authHeaders]?.let {
+            hits.incrementAndGet()
+            return it
+        }
+
+        misses.incrementAndGet()
+        val authentication = reconstructAuthentication(authHeaders) ?: return null
+        if (authentications.size >= AUTHENTICATION_CACHE_SIZE) trimAuthentications()
+        return authentications.putIfAbsent(authHeaders, authentication) ?: authentication
+    }
+
+    /**
+     * Evicts arbitrary entries until the cache is back to [AUTHENTICATION_CACHE_TRIM_SIZE]
+     */
+    private fun trimAuthentications() {
+        val keys = authentications.keys.iterator()
+        while (authentications.size > AUTHENTICATION_CACHE_TRIM_SIZE && keys.hasNext()) {
+            authentications.remove(keys.next())
+        }
+    }
+
     /**
      * Reconstruct authentication from headers - simple and fast
      * Returns null if insufficient context (let service layer handle it)
      */
-    private fun reconstructAuthenticationFromHeaders(headers: Metadata): DecoratedAuthentication<out BaseAuthenticatedSession>? {
-        val sessionId = getHeader(headers, SESSION_ID) ?: return null
-        val sessionType = getHeader(headers, SESSION_TYPE) ?: return null
-        val userId = getHeader(headers, USER_ID) ?: return null
-        val webAppId = getHeader(headers, WEB_APP_ID) ?: return null
+    private fun reconstructAuthentication(headers: AuthHeaders): DecoratedAuthentication<out BaseAuthenticatedSession>? {
+        val (sessionId, sessionType, userId, webAppId) = headers
 
         return when (sessionType) {
             "GUEST" -> createGuestAuthentication(sessionId, userId, webAppId)
 
             "TENANT" -> {
-                val tenantId = getHeader(headers, TENANT_ID) ?: return null
-                val operatorId = getHeader(headers, OPERATOR_ID) ?: return null
+                val tenantId = headers.tenantId ?: return null
+                val operatorId = headers.operatorId ?: return null
                 createTenantAuthentication(sessionId, userId, webAppId, tenantId, operatorId)
             }
 
             "BUSINESS_UNIT" -> {
-                val tenantId = getHeader(headers, TENANT_ID) ?: return null
-                val businessUnitId = getHeader(headers, BUSINESS_UNIT_ID) ?: return null
-                val operatorId = getHeader(headers, OPERATOR_ID) ?: return null
+                val tenantId = headers.tenantId ?: return null
+                val businessUnitId = headers.businessUnitId ?: return null
+                val operatorId = headers.operatorId ?: return null
                 createBusinessUnitAuthentication(sessionId, userId, webAppId, tenantId, businessUnitId, operatorId)
             }
 
@@ -128,10 +193,6 @@ class AuthServerInterceptor : ServerInterceptor, Ordered {
         }
     }
 
-    private fun getHeader(headers: Metadata, key: String): String? {
-        return headers.get(Metadata.Key.of(key, Metadata.ASCII_STRING_MARSHALLER))
-    }
-
     // Simple authentication object creation - minimal data for context
     private fun createGuestAuthentication(sessionId: String, userId: String, webAppId: String): GuestAuthentication {
         return GuestAuthentication(
@@ -202,6 +263,28 @@ class AuthServerInterceptor : ServerInterceptor, Ordered {
     }
 }
 
+/**
+ * Context headers an authentication is reconstructed from
+ */
+private data class AuthHeaders(
+    val sessionId: String,
+    val sessionType: String,
+    val userId: String,
+    val webAppId: String,
+    val tenantId: String?,
+    val businessUnitId: String?,
+    val operatorId: String?,
+)
+
+/**
+ * Snapshot of the interceptor's authentication cache metrics
+ */
+data class AuthenticationCacheStats(
+    val hits: Long,
+    val misses: Long,
+    val size: Int,
+)
+
 /**
  * Context-aware listener for cleanup
  *
@@ -1,6 +1,6 @@
 package net.blugrid.integration.grpc.service
 
-import jakarta.inject.Inject
+import kotlinx.coroutines.flow.Flow
 
 /**
  * Abstract base class for gRPC services that need to extend a specific base.
@@ -18,6 +18,38 @@ interface GrpcService {
         block: suspend () -> T
     ): T = grpcExecutor.executeCall(methodName, correlationId, block)
 
+    /**
+     * Execute a server-streaming gRPC operation with error handling
+     */
+    fun <T> grpcStream(
+        methodName: String,
+        correlationId: String? = null,
+        block: () -> Flow<T>
+    ): Flow<T> = grpcExecutor.executeStream(methodName, correlationId, block)
+
+    /**
+     * Execute a client-streaming gRPC operation in batches with error handling
+     */
+    suspend fun <T> grpcBulkCall(
+        methodName: String,
+        requests: Flow<T>,
+        batchSize: Int,
+        correlationId: String? = null,
+        handleBatch: (List<T>) -> Int
+    ): Long = grpcExecutor.executeBulkCall(methodName, requests, batchSize, correlationId, handleBatch)
+
+    /**
+     * Execute a bidirectional-streaming gRPC operation in batches with error handling,
+     * streaming back the results of each batch as it is written
+     */
+    fun <T, R> grpcBulkStream(
+        methodName: String,
+        requests: Flow<T>,
+        batchSize: Int,
+        correlationId: String? = null,
+        handleBatch: (List<T>) -> List<R>
+    ): Flow<R> = grpcExecutor.executeBulkStream(methodName, requests, batchSize, correlationId, handleBatch)
+
     /**
      * Execute a blocking gRPC operation with error handling
      */
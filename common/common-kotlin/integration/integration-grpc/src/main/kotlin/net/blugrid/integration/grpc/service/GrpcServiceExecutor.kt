@@ -4,7 +4,12 @@ import io.grpc.StatusException
 import jakarta.inject.Inject
 import jakarta.inject.Named
 import jakarta.inject.Singleton
+import kotlinx.coroutines.CancellationException
 import kotlinx.coroutines.CoroutineDispatcher
+import kotlinx.coroutines.flow.Flow
+import kotlinx.coroutines.flow.catch
+import kotlinx.coroutines.flow.flow
+import kotlinx.coroutines.flow.flowOn
 import kotlinx.coroutines.withContext
 import net.blugrid.integration.grpc.mapper.GrpcErrorMapper
 import net.blugrid.platform.logging.logger
@@ -41,7 +46,7 @@ class GrpcServiceExecutor(
             )
 
             // CRITICAL FIX: Execute business logic on context-aware dispatcher
-            val result = withContext(grpcDispatcher) {
+            val result = withContext(grpcDispatcher + PropagatedContextCoroutineElement.current()) {
                 log.debug("📌 Executing {} on context thread: {}", methodName, Thread.currentThread().name)
 
                 // Debug: Verify context is available
@@ -67,6 +72,97 @@ class GrpcServiceExecutor(
         }
     }
 
+    /**
+     * Executes a server-streaming gRPC call
+     *
+     * The flow returned by [block] is produced on the gRPC dispatcher with the caller's
+     * propagated context re-applied on every resumption, so tenant and security context
+     * survive across the chunks of a long stream. Elements are only produced as fast as
+     * the transport accepts them: grpc-kotlin suspends emission while the client is not ready.
+     */
+    fun <T> executeStream(
+        methodName: String,
+        correlationId: String? = null,
+        block: () -> Flow<T>
+    ): Flow<T> {
+        val effectiveCorrelationId = correlationId ?: generateCorrelationId()
+        val context = grpcDispatcher + PropagatedContextCoroutineElement.current()
+
+        return flow {
+            val startTime = System.currentTimeMillis()
+            var count = 0L
+            log.debug("Starting gRPC stream: {} (correlationId: {})", methodName, effectiveCorrelationId)
+
+            block().flowOn(context).collect { element ->
+                emit(element)
+                count++
+            }
+
+            val duration = System.currentTimeMillis() - startTime
+            log.debug("Completed gRPC stream: {} with {} messages in {}ms", methodName, count, duration)
+        }.catch { e ->
+            when (e) {
+                is CancellationException, is StatusException -> throw e
+                is Exception -> {
+                    log.error("Exception in gRPC stream {}: {}", methodName, e.message, e)
+                    throw grpcErrorMapper.mapToGrpcException(
+                        exception = e,
+                        grpcMethod = methodName,
+                        correlationId = effectiveCorrelationId
+                    )
+                }
+                else -> throw e
+            }
+        }
+    }
+
+    /**
+     * Executes a client-streaming gRPC call that consumes its requests in batches
+     *
+     * Requests are pulled from the transport one batch at a time and handed to [handleBatch],
+     * which is expected to write the batch in a single transaction and return the number of
+     * resources it wrote. At most one batch is held in memory, and further requests are only
+     * requested from the client once the current batch has been handled.
+     */
+    suspend fun <T> executeBulkCall(
+        methodName: String,
+        requests: Flow<T>,
+        batchSize: Int,
+        correlationId: String? = null,
+        handleBatch: (List<T>) -> Int
+    ): Long = executeCall(methodName, correlationId) {
+        var total = 0L
+        requests.chunked(batchSize).collect { batch ->
+            total += handleBatch(batch)
+            log.debug("{}: wrote batch of {} ({} total)", methodName, batch.size, total)
+        }
+        total
+    }
+
+    /**
+     * Executes a bidirectional-streaming gRPC call that writes its requests in batches and
+     * streams back what each batch wrote
+     *
+     * Like [executeBulkCall], requests are pulled one batch at a time and handed to [handleBatch],
+     * and the results of a batch are sent as soon as it has been written. The next batch is only
+     * pulled once those results have been handed to the transport, so memory use is bounded by
+     * the batch size however many requests are streamed.
+     */
+    fun <T, R> executeBulkStream(
+        methodName: String,
+        requests: Flow<T>,
+        batchSize: Int,
+        correlationId: String? = null,
+        handleBatch: (List<T>) -> List<R>
+    ): Flow<R> = executeStream(methodName, correlationId) {
+        flow {
+            requests.chunked(batchSize).collect { batch ->
+                handleBatch(batch).forEach { emit(it) }
+                log.debug("{}: wrote batch of {}", methodName, batch.size)
+            }
+        }
+    }
+
     /**
      * Debug helper to verify context availability
      */
@@ -0,0 +1,36 @@
+package net.blugrid.integration.grpc.service
+
+import io.micronaut.core.propagation.PropagatedContext
+import kotlinx.coroutines.ThreadContextElement
+import kotlin.coroutines.CoroutineContext
+import kotlin.coroutines.EmptyCoroutineContext
+
+/**
+ * Re-applies a captured [PropagatedContext] every time a coroutine resumes on a thread
+ *
+ * Dispatchers only propagate the context that is current when a task is submitted, which is
+ * lost once a coroutine suspends and is resumed from a gRPC transport thread. Streams resume
+ * once per message, so the tenant context has to travel with the coroutine itself.
+ */
+internal class PropagatedContextCoroutineElement(
+    private val propagatedContext: PropagatedContext,
+) : ThreadContextElement<PropagatedContext.Scope> {
+
+    companion object Key : CoroutineContext.Key<PropagatedContextCoroutineElement> {
+
+        /**
+         * Captures the caller's propagated context, if there is one
+         */
+        fun current(): CoroutineContext =
+            if (PropagatedContext.exists()) PropagatedContextCoroutineElement(PropagatedContext.get()) else EmptyCoroutineContext
+    }
+
+    override val key: CoroutineContext.Key<PropagatedContextCoroutineElement>
+        get() = Key
+
+    override fun updateThreadContext(context: CoroutineContext): PropagatedContext.Scope =
+        propagatedContext.propagate()
+
+    override fun restoreThreadContext(context: CoroutineContext, oldState: PropagatedContext.Scope) =
+        oldState.close()
+}
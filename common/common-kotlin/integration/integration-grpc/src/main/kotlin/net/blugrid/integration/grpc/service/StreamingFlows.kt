@@ -0,0 +1,43 @@
+package net.blugrid.integration.grpc.service
+
+import kotlinx.coroutines.flow.Flow
+import kotlinx.coroutines.flow.flow
+import net.blugrid.common.model.pagination.CursorPage
+
+/**
+ * Streams every resource of a keyset paginated result, one page at a time
+ *
+ * Each page is fetched by its own call to [fetchPage], so no transaction or connection is
+ * held open between pages, and the next page is only fetched once the collector has taken
+ * every element of the current one. Memory use is bounded by the page size regardless of
+ * how many resources are streamed.
+ */
+fun <T> cursorPageFlow(fetchPage: (cursor: String?) -> CursorPage<T, String>): Flow<T> = flow {
+    var cursor: String? = null
+    do {
+        val page = fetchPage(cursor)
+        page.content.forEach { emit(it) }
+        cursor = page.nextCursor
+    } while (page.hasNext && cursor != null)
+}
+
+/**
+ * Groups the elements of a flow into lists of at most [size] elements
+ *
+ * The last list holds whatever remains and may be smaller. Upstream is only collected
+ * while a list is being filled, so at most one list is held in memory at a time.
+ */
+fun <T> Flow<T>.chunked(size: Int): Flow<List<T>> {
+    require(size > 0) { "Chunk size must be positive, was $size" }
+    return flow {
+        var chunk = ArrayList<T>(size)
+        collect { element ->
+            chunk.add(element)
+            if (chunk.size == size) {
+                emit(chunk)
+                chunk = ArrayList(size)
+            }
+        }
+        if (chunk.isNotEmpty()) emit(chunk)
+    }
+}
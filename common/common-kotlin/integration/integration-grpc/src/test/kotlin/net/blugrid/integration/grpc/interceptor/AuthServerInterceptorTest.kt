@@ -0,0 +1,61 @@
+package net.blugrid.integration.grpc.interceptor
+
+import io.grpc.Metadata
+import net.blugrid.security.core.session.TenantSession
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertNotSame
+import org.junit.jupiter.api.Assertions.assertNull
+import org.junit.jupiter.api.Assertions.assertSame
+import org.junit.jupiter.api.Test
+
+class AuthServerInterceptorTest {
+
+    @Test
+    fun `the same context headers reuse the same authentication`() {
+        val interceptor = AuthServerInterceptor()
+
+        val first = interceptor.authenticationFromHeaders(tenantHeaders(sessionId = "session-1", tenantId = "42"))
+        val second = interceptor.authenticationFromHeaders(tenantHeaders(sessionId = "session-1", tenantId = "42"))
+        val otherTenant = interceptor.authenticationFromHeaders(tenantHeaders(sessionId = "session-1", tenantId = "43"))
+
+        assertSame(first, second)
+        assertNotSame(first, otherTenant)
+        assertEquals("43", (otherTenant!!.session as TenantSession).tenantId)
+        assertEquals(AuthenticationCacheStats(hits = 1, misses = 2, size = 2), interceptor.authenticationCacheStats)
+    }
+
+    @Test
+    fun `incomplete context headers are not cached`() {
+        val interceptor = AuthServerInterceptor()
+        val headers = tenantHeaders(sessionId = "session-1", tenantId = "42").apply {
+            removeAll(key(AuthServerInterceptor.OPERATOR_ID))
+        }
+
+        repeat(2) { assertNull(interceptor.authenticationFromHeaders(headers)) }
+        assertEquals(AuthenticationCacheStats(hits = 0, misses = 2, size = 0), interceptor.authenticationCacheStats)
+    }
+
+    @Test
+    fun `a full cache is trimmed in bulk`() {
+        val interceptor = AuthServerInterceptor()
+
+        repeat(AuthServerInterceptor.AUTHENTICATION_CACHE_SIZE) {
+            interceptor.authenticationFromHeaders(tenantHeaders(sessionId = "session-$it", tenantId = "42"))
+        }
+        assertEquals(AuthServerInterceptor.AUTHENTICATION_CACHE_SIZE, interceptor.authenticationCacheStats.size)
+
+        interceptor.authenticationFromHeaders(tenantHeaders(sessionId = "overflow", tenantId = "42"))
+        assertEquals(AuthServerInterceptor.AUTHENTICATION_CACHE_SIZE * 9 / 10 + 1, interceptor.authenticationCacheStats.size)
+    }
+
+    private fun tenantHeaders(sessionId: String, tenantId: String) = Metadata().apply {
+        put(key(AuthServerInterceptor.SESSION_ID), sessionId)
+        put(key(AuthServerInterceptor.SESSION_TYPE), "TENANT")
+        put(key(AuthServerInterceptor.USER_ID), "user-1")
+        put(key(AuthServerInterceptor.WEB_APP_ID), "web-app-1")
+        put(key(AuthServerInterceptor.TENANT_ID), tenantId)
+        put(key(AuthServerInterceptor.OPERATOR_ID), "operator-1")
+    }
+
+    private fun key(name: String): Metadata.Key<String> = Metadata.Key.of(name, Metadata.ASCII_STRING_MARSHALLER)
+}
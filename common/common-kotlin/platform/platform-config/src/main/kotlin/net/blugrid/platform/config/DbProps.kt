@@ -11,4 +11,22 @@ interface DbProps {
 
     @get:Bindable(defaultValue = "public")
     val schema: String
+
+    /**
+     * Cache sequence resolution in-process and hand out IDs from pre-fetched blocks
+     */
+    @get:Bindable(defaultValue = "false")
+    val sequencePoolingEnabled: Boolean
+
+    /**
+     * Number of IDs reserved per sequence round trip when pooling is enabled
+     */
+    @get:Bindable(defaultValue = "50")
+    val sequenceBlockSize: Int
+
+    /**
+     * Skip re-applying the database scope on pooled connections that already carry it
+     */
+    @get:Bindable(defaultValue = "false")
+    val connectionScopeCachingEnabled: Boolean
 }
@@ -29,4 +29,17 @@ private fun <T : Any> unwrapCompanionClass(ofClass: Class<T>): Class<*> {
     } else {
         ofClass
     }
-}
\ No newline at end of file
+}
+/**
+ * Logs the message built by [message] at trace level, only building it when trace is enabled
+ */
+inline fun PlatformLogger.trace(message: () -> String) {
+    if (isTraceEnabled()) trace(message())
+}
+
+/**
+ * Logs the message built by [message] at debug level, only building it when debug is enabled
+ */
+inline fun PlatformLogger.debug(message: () -> String) {
+    if (isDebugEnabled()) debug(message())
+}
@@ -1,16 +1,37 @@
 plugins {
     alias(libs.plugins.jvm)
     alias(libs.plugins.allopen)
+    alias(libs.plugins.jmh)
 }
 
 dependencies {
     implementation(platform(libs.micronaut.bom))
     implementation(libs.bundles.jacksonLibs)
     implementation(libs.bundles.jsonLibs)
+    implementation(libs.jackson.blackbird)
 
     testImplementation(libs.bundles.testing)
+
+    jmhImplementation(project(":common:common-kotlin:common:common-model"))
+    jmhImplementation(project(":common:common-kotlin:platform:platform-logging"))
 }
 
 tasks.test {
     useJUnitPlatform()
 }
+
+// JMH generates subclasses of the benchmark state classes
+allOpen {
+    annotation("org.openjdk.jmh.annotations.State")
+}
+
+// ./gradlew :common:common-kotlin:platform:platform-serialization:jmh
+jmh {
+    jmhVersion = libs.versions.jmh.get()
+    fork = 1
+    warmupIterations = 3
+    iterations = 5
+    benchmarkMode = listOf("thrpt")
+    timeUnit = "s"
+    profilers = listOf("gc")
+}
@@ -0,0 +1,198 @@
+package net.blugrid.platform.serialization
+
+import com.fasterxml.jackson.core.type.TypeReference
+import com.fasterxml.jackson.databind.JsonNode
+import com.fasterxml.jackson.module.kotlin.jacksonTypeRef
+import net.blugrid.common.domain.IdentityID
+import net.blugrid.common.domain.IdentityUUID
+import net.blugrid.common.model.audit.AuditStamp
+import net.blugrid.common.model.audit.ResourceAudit
+import net.blugrid.common.model.resource.BaseAuditedResource
+import net.blugrid.common.model.resource.BaseTenantResource
+import net.blugrid.common.model.resource.ResourceType
+import net.blugrid.common.model.resource.UnscopedResource
+import net.blugrid.common.model.scope.TenantScope
+import net.blugrid.platform.logging.logger
+import net.blugrid.platform.logging.trace
+import net.blugrid.platform.serialization.config.CustomObjectMapperFactory
+import org.openjdk.jmh.annotations.Benchmark
+import org.openjdk.jmh.annotations.Param
+import org.openjdk.jmh.annotations.Scope
+import org.openjdk.jmh.annotations.Setup
+import org.openjdk.jmh.annotations.State
+import java.io.ByteArrayOutputStream
+import java.math.BigDecimal
+import java.time.LocalDateTime
+import java.util.UUID
+
+/**
+ * Compares the String round trips Json.kt used to make with the direct tree, token buffer,
+ * byte and stream paths, over audited resources shaped like the generated API models
+ *
+ * Run with the gc profiler (configured in build.gradle.kts) to report allocation per op as
+ * `gc.alloc.rate.norm` next to ops/sec. Each parameter combination runs in its own fork, so
+ * the mapper Json.kt captures is the one built in [setup].
+ */
+@State(Scope.Benchmark)
+class JsonBenchmark {
+
+    @Param("organisation", "invoice")
+    lateinit var payload: String
+
+    @Param("reflection", "blackbird")
+    lateinit var accessors: String
+
+    private val log = logger()
+
+    private lateinit var resource: BaseAuditedResource<*>
+    private lateinit var type: Class<Any>
+    private lateinit var typeRef: TypeReference<Any>
+    private lateinit var json: String
+    private lateinit var bytes: ByteArray
+    private lateinit var node: JsonNode
+    private val out = ByteArrayOutputStream(16 * 1024)
+
+    @Setup
+    @Suppress("UNCHECKED_CAST")
+    fun setup() {
+        val mapper = CustomObjectMapperFactory(bytecodeAccessors = accessors == "blackbird").objectMapper(null, null)
+        check(objectMapper === mapper) { "Json.kt was initialised before the benchmark mapper" }
+        check(!log.isTraceEnabled()) { "trace logging must be disabled to measure its cost" }
+
+        when (payload) {
+            "organisation" -> {
+                resource = organisation()
+                type = BenchmarkOrganisation::class.java as Class<Any>
+                typeRef = jacksonTypeRef<BenchmarkOrganisation>() as TypeReference<Any>
+            }
+            else -> {
+                resource = invoice()
+                type = BenchmarkInvoice::class.java as Class<Any>
+                typeRef = jacksonTypeRef<BenchmarkInvoice>() as TypeReference<Any>
+            }
+        }
+        json = objectToJson(resource)
+        bytes = toByteArray(resource)
+        node = nodeFromObject(resource)
+        check(objectToJson(fromObject(resource, typeRef)) == json)
+        check(objectToJson(fromNode(node, typeRef)) == json)
+        check(objectToJson(node) == json)
+    }
+
+    @Benchmark
+    fun convertViaString(): Any = fromJson(objectToJson(resource), typeRef)
+
+    @Benchmark
+    fun convertViaTokenBuffer(): Any = fromObject(resource, typeRef)
+
+    @Benchmark
+    fun treeViaString(): JsonNode = nodeFromJson(objectToJson(resource))
+
+    @Benchmark
+    fun treeDirect(): JsonNode = nodeFromObject(resource)
+
+    @Benchmark
+    fun treeToValueViaString(): Any = fromJson(node.toString(), typeRef)
+
+    @Benchmark
+    fun treeToValueDirect(): Any = fromNode(node, typeRef)
+
+    @Benchmark
+    fun readViaString(): Any = deserializeFromJson(String(bytes, Charsets.UTF_8), type)
+
+    @Benchmark
+    fun readBytes(): Any = deserializeFromJson(bytes, type)
+
+    @Benchmark
+    fun writeViaString(): Int {
+        out.reset()
+        out.write(objectToJson(resource).toByteArray(Charsets.UTF_8))
+        return out.size()
+    }
+
+    @Benchmark
+    fun writeStream(): Int {
+        out.reset()
+        writeJson(resource, out)
+        return out.size()
+    }
+
+    @Benchmark
+    fun disabledTraceEager() {
+        log.trace("Intercepted audit event for ${resource.resourceType} resource:  ${objectToJson(resource)}")
+    }
+
+    @Benchmark
+    fun disabledTraceLazy() {
+        log.trace { "Intercepted audit event for ${resource.resourceType} resource:  ${objectToJson(resource)}" }
+    }
+
+    private fun audit() = ResourceAudit(
+        version = 3,
+        created = AuditStamp(IdentityID(9001), mapOf("userId" to 42, "userName" to "jane.doe"), LocalDateTime.of(2024, 8, 25, 9, 30, 0)),
+        lastChanged = AuditStamp(IdentityID(9002), mapOf("userId" to 43, "userName" to "john.doe"), LocalDateTime.of(2024, 9, 1, 17, 5, 12)),
+    )
+
+    private fun organisation() = BenchmarkOrganisation(
+        id = IdentityID(1001),
+        uuid = IdentityUUID(UUID.fromString("0b6a8f3e-5a77-4f0e-9d1c-3f5b2c7a9e10")),
+        name = "Blugrid Holdings",
+        parentOrganisationId = 1000,
+        effectiveTimestamp = LocalDateTime.of(2024, 8, 25, 0, 0, 0),
+        audit = audit(),
+    )
+
+    private fun invoice() = BenchmarkInvoice(
+        id = IdentityID(200_001),
+        uuid = IdentityUUID(UUID.fromString("6f1d2c4b-8e3a-4b7f-a2d9-5c0e1b3f7a64")),
+        number = "INV-200001",
+        customerName = "Acme Trading Pty Ltd",
+        issuedTimestamp = LocalDateTime.of(2024, 9, 1, 10, 15, 0),
+        total = BigDecimal("12345.67"),
+        lines = List(INVOICE_LINES) {
+            BenchmarkInvoiceLine(it + 1, "Line item ${it + 1}", BigDecimal(it % 5 + 1), BigDecimal("19.95"))
+        },
+        scope = TenantScope(IdentityID(42)),
+        audit = audit(),
+    )
+
+    companion object {
+        private const val INVOICE_LINES = 20
+    }
+}
+
+data class BenchmarkOrganisation(
+    override var id: IdentityID,
+    override var uuid: IdentityUUID,
+    var name: String,
+    var parentOrganisationId: Long,
+    var effectiveTimestamp: LocalDateTime,
+    override val audit: ResourceAudit? = null
+) : UnscopedResource<BenchmarkOrganisation>(audit) {
+
+    override val resourceType: ResourceType
+        get() = ResourceType.ORGANISATION
+}
+
+data class BenchmarkInvoice(
+    override var id: IdentityID,
+    override var uuid: IdentityUUID,
+    var number: String,
+    var customerName: String,
+    var issuedTimestamp: LocalDateTime,
+    var total: BigDecimal,
+    var lines: List<BenchmarkInvoiceLine>,
+    override val scope: TenantScope? = null,
+    override val audit: ResourceAudit? = null
+) : BaseTenantResource<BenchmarkInvoice>(scope, audit) {
+
+    override val resourceType: ResourceType
+        get() = ResourceType.RESOURCE
+}
+
+data class BenchmarkInvoiceLine(
+    val lineNumber: Int,
+    val description: String,
+    val quantity: BigDecimal,
+    val unitPrice: BigDecimal
+)
@@ -1,20 +1,30 @@
 package net.blugrid.platform.serialization
 
+import com.fasterxml.jackson.core.JsonGenerator
+import com.fasterxml.jackson.core.JsonParser
 import com.fasterxml.jackson.core.JsonProcessingException
 import com.fasterxml.jackson.core.type.TypeReference
 import com.fasterxml.jackson.databind.JsonNode
 import com.fasterxml.jackson.databind.ObjectMapper
+import com.fasterxml.jackson.databind.ObjectWriter
+import com.fasterxml.jackson.databind.util.TokenBuffer
+import com.fasterxml.jackson.module.kotlin.jacksonTypeRef
 import com.fasterxml.jackson.module.kotlin.readValue
 import net.blugrid.platform.serialization.config.CustomObjectMapperFactory
 import net.blugrid.platform.serialization.exception.JsonException
 import java.io.IOException
 import java.io.InputStream
+import java.io.OutputStream
 
 
 val objectMapper: ObjectMapper = CustomObjectMapperFactory.objectMapper
 
 inline fun <reified T : Any> String.fromJson() = objectMapper.readValue<T>(this)
 
+inline fun <reified T : Any> ByteArray.fromJson(): T = fromJson(this, jacksonTypeRef<T>())
+
+inline fun <reified T : Any> InputStream.fromJson(): T = fromInputStream(this, jacksonTypeRef<T>())
+
 inline fun <reified R : Any> R.toJson() = objectToJson(this)
 
 fun <T> readValue(json: String?, valueType: Class<T>?): T =
@@ -39,14 +49,22 @@ fun <T> fromJson(json: String?, typeRef: TypeReference<T>?): T {
     }
 }
 
+/**
+ * Binds a tree straight to [T] by walking its nodes, without printing it to JSON text first
+ */
 fun <T> fromNode(node: JsonNode, typeRef: TypeReference<T>?): T = try {
-    objectMapper.readValue(node.toString(), typeRef)
+    objectMapper.readerFor(typeRef).readValue(node)
 } catch (e: IOException) {
     throw JsonException(e)
 }
 
+/**
+ * Converts [obj] to [T] through a token buffer instead of a JSON String, so the configured serializers,
+ * e.g. `Long` as string, still apply. Untyped targets get numbers as written, e.g. `BigDecimal`
+ * rather than a re-parsed `Double`
+ */
 fun <T> fromObject(obj: Any?, typeRef: TypeReference<T>?): T = try {
-    objectMapper.readValue(objectToJson(obj), typeRef)
+    objectMapper.readValue(bufferTokens(obj), objectMapper.typeFactory.constructType(typeRef))
 } catch (e: IOException) {
     throw JsonException(e)
 }
@@ -77,6 +95,15 @@ fun toByteArray(obj: Any?): ByteArray = try {
     throw JsonException(e)
 }
 
+/**
+ * Writes [obj] as UTF-8 JSON straight to [out], leaving the stream open for the caller to close
+ */
+fun writeJson(obj: Any?, out: OutputStream) = try {
+    streamWriter.writeValue(out, obj)
+} catch (e: IOException) {
+    throw JsonException(e)
+}
+
 fun mapFromJson(bytes: ByteArray?): Map<String, Any> = try {
     objectMapper.readValue(bytes, object : TypeReference<Map<String, Any>>() {})
 } catch (e: IOException) {
@@ -101,16 +128,27 @@ fun <T> deserializeFromJson(json: String?, type: Class<T>?): T = try {
     throw JsonException(e)
 }
 
+fun <T> deserializeFromJson(bytes: ByteArray?, type: Class<T>?): T = try {
+    objectMapper.readValue(bytes, type)
+} catch (e: IOException) {
+    throw JsonException(e)
+}
+
+fun <T> deserializeFromInputStream(`is`: InputStream?, type: Class<T>?): T = try {
+    objectMapper.readValue(`is`, type)
+} catch (e: IOException) {
+    throw JsonException(e)
+}
+
 fun <T> deserializeFromObject(`object`: Any?, type: Class<T>?): T = try {
-    val json = objectToJson(`object`)
-    objectMapper.readValue(json, objectMapper.typeFactory.constructType(type))
+    objectMapper.readValue(bufferTokens(`object`), objectMapper.typeFactory.constructType(type))
 } catch (e: IOException) {
     throw JsonException(e)
 }
 
 fun <T> deserializeFromObjectList(input: List<Any?>?, type: Class<T>?): List<T> {
-    val content: MutableList<T> = ArrayList()
-    input?.stream()?.forEach { item: Any? -> content.add(deserializeFromObject(item, type)) }
+    val content: MutableList<T> = ArrayList(input?.size ?: 0)
+    input?.forEach { item: Any? -> content.add(deserializeFromObject(item, type)) }
     return content
 }
 
@@ -120,8 +158,35 @@ fun nodeFromJson(json: String?): JsonNode = try {
     throw JsonException(e)
 }
 
-fun nodeFromObject(obj: Any?): JsonNode = try {
-    objectMapper.readTree(objectToJson(obj))
+fun nodeFromJson(bytes: ByteArray?): JsonNode = try {
+    objectMapper.readTree(bytes)
 } catch (e: IOException) {
     throw JsonException(e)
 }
+
+fun nodeFromInputStream(`is`: InputStream?): JsonNode = try {
+    objectMapper.readTree(`is`)
+} catch (e: IOException) {
+    throw JsonException(e)
+}
+
+/**
+ * Builds the tree for [obj] directly from its serializer, without an intermediate JSON String
+ */
+fun nodeFromObject(obj: Any?): JsonNode = try {
+    objectMapper.valueToTree<JsonNode>(obj) ?: objectMapper.nodeFactory.nullNode()
+} catch (e: IllegalArgumentException) {
+    throw JsonException(e)
+}
+
+private val streamWriter: ObjectWriter by lazy {
+    objectMapper.writer().without(JsonGenerator.Feature.AUTO_CLOSE_TARGET)
+}
+
+// Serializes into buffered tokens rather than text; unlike ObjectMapper.convertValue this never
+// hands back the same instance, so conversions always go through the configured (de)serializers
+private fun bufferTokens(obj: Any?): JsonParser {
+    val buffer = TokenBuffer(objectMapper, false)
+    objectMapper.writeValue(buffer, obj)
+    return buffer.asParserOnFirstToken()
+}
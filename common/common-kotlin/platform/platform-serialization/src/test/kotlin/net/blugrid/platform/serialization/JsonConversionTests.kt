@@ -0,0 +1,67 @@
+package net.blugrid.platform.serialization
+
+import com.fasterxml.jackson.module.kotlin.jacksonTypeRef
+import io.micronaut.test.extensions.junit5.annotation.MicronautTest
+import org.junit.jupiter.api.Assertions
+import org.junit.jupiter.api.Test
+import java.io.ByteArrayInputStream
+import java.io.ByteArrayOutputStream
+import java.math.BigDecimal
+import java.time.LocalDateTime
+
+@MicronautTest
+class JsonConversionTests {
+
+    data class TestLine(val lineId: Long, val amount: BigDecimal, val createdTimestamp: LocalDateTime)
+
+    data class TestDocument(val documentId: Long, val name: String, val lines: List<TestLine>)
+
+    data class TestLineView(val lineId: String, val amount: BigDecimal, val createdTimestamp: String)
+
+    data class TestDocumentView(val documentId: String, val name: String, val lines: List<TestLineView>)
+
+    private val document = TestDocument(
+        documentId = 1001,
+        name = "Invoice",
+        lines = listOf(
+            TestLine(1, BigDecimal("12.50"), LocalDateTime.of(2024, 8, 25, 9, 30, 0)),
+            TestLine(2, BigDecimal("7.25"), LocalDateTime.of(2024, 8, 25, 9, 31, 0)),
+        )
+    )
+
+    @Test
+    fun `Converting objects applies the configured serializers like a String round trip`() {
+        val expected = fromJson(objectToJson(document), jacksonTypeRef<TestDocumentView>())
+
+        Assertions.assertEquals(expected, fromObject(document, jacksonTypeRef<TestDocumentView>()))
+        Assertions.assertEquals(expected, deserializeFromObject(document, TestDocumentView::class.java))
+        Assertions.assertEquals("1001", fromObject(document, jacksonTypeRef<TestDocumentView>()).documentId)
+    }
+
+    @Test
+    fun `Trees convert to and from values without JSON text`() {
+        val node = nodeFromObject(document)
+
+        Assertions.assertEquals(objectToJson(document), objectToJson(node))
+        Assertions.assertEquals(document, fromNode(node, jacksonTypeRef<TestDocument>()))
+        Assertions.assertTrue(nodeFromObject(null).isNull)
+    }
+
+    @Test
+    fun `Byte and stream entry points match the String entry points`() {
+        val out = object : ByteArrayOutputStream() {
+            var closed = false
+            override fun close() {
+                closed = true
+            }
+        }
+        writeJson(document, out)
+
+        Assertions.assertFalse(out.closed)
+        Assertions.assertEquals(objectToJson(document), out.toString(Charsets.UTF_8))
+        Assertions.assertEquals(document, out.toByteArray().fromJson<TestDocument>())
+        Assertions.assertEquals(document, ByteArrayInputStream(out.toByteArray()).fromJson<TestDocument>())
+        Assertions.assertEquals(document, deserializeFromJson(out.toByteArray(), TestDocument::class.java))
+        Assertions.assertEquals(document, fromNode(nodeFromInputStream(ByteArrayInputStream(out.toByteArray())), jacksonTypeRef<TestDocument>()))
+    }
+}
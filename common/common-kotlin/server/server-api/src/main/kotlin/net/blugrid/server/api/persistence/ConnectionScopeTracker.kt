@@ -0,0 +1,14 @@
+package net.blugrid.server.api.persistence
+
+/**
+ * Tracks the database scope (search_path, tenant, business unit, session) applied to pooled connections
+ * Code that changes scope settings outside the connection provider must run the change through
+ * [outOfBandScopeChange]
+ */
+interface ConnectionScopeTracker {
+    /**
+     * Run [change], which alters scope settings on the calling thread's connections, so those
+     * connections re-apply their scope on their next checkout
+     */
+    fun <T> outOfBandScopeChange(change: () -> T): T
+}
@@ -0,0 +1,37 @@
+package net.blugrid.server.multitenancy.config
+
+import java.sql.Connection
+
+/**
+ * Database scope applied to a connection via PostgreSQL session settings
+ * Null identifiers are reset to '0', matching reset_request_scope()
+ */
+data class ConnectionScope(
+    val schema: String,
+    val tenantId: String? = null,
+    val businessUnitId: String? = null,
+    val sessionId: String? = null,
+)
+
+/**
+ * Apply every scope setting in a single statement, clearing any setting left over from a previous scope
+ * Values are quoted with quote_ident to match set_tenant_session/set_business_unit_session
+ */
+internal fun Connection.applyScope(scope: ConnectionScope) {
+    prepareStatement(APPLY_SCOPE_SQL)
+        .use { statement ->
+            statement.setString(1, scope.schema)
+            statement.setString(2, scope.tenantId)
+            statement.setString(3, scope.businessUnitId)
+            statement.setString(4, scope.sessionId)
+            statement.execute()
+        }
+}
+
+private const val APPLY_SCOPE_SQL = """
+SELECT pg_catalog.set_config('search_path', ?, false),
+       pg_catalog.set_config('tenant.id', COALESCE(QUOTE_IDENT(CAST(? AS TEXT)), '0'), false),
+       pg_catalog.set_config('business_unit.id', COALESCE(QUOTE_IDENT(CAST(? AS TEXT)), '0'), false),
+       pg_catalog.set_config('session.id', COALESCE(QUOTE_IDENT(CAST(? AS TEXT)), '0'), false),
+       pg_catalog.set_config('operator.party.id', '0', false)
+"""
@@ -0,0 +1,114 @@
+package net.blugrid.server.multitenancy.config
+
+import net.blugrid.platform.logging.logger
+import java.sql.Connection
+import java.util.Collections
+import java.util.WeakHashMap
+import java.util.concurrent.ConcurrentHashMap
+import java.util.concurrent.atomic.AtomicLong
+
+/**
+ * Remembers the scope applied to each physical pooled connection so it is only re-applied on change
+ *
+ * Entries are keyed by the unwrapped driver connection, which outlives the pool's per-checkout proxy,
+ * and are only recorded after the full scope has been applied successfully. A connection is therefore
+ * either skipped because it carries exactly the requested scope, or has every setting overwritten.
+ *
+ * set_config is transactional, so a scope applied while auto-commit is off is committed before it
+ * is recorded. Scope changes made outside [apply] must run through [outOfBandScopeChange], which
+ * forgets the connections checked out by the calling thread before the change runs, so they are
+ * never reported as carrying a scope they no longer have once they are back in the pool.
+ */
+class ConnectionScopeCache(
+    private val enabled: Boolean,
+) {
+
+    private val log = logger()
+
+    private val appliedScopes = Collections.synchronizedMap(WeakHashMap<Connection, ConnectionScope>())
+    private val checkedOut = ConcurrentHashMap<Connection, Thread>()
+    private val outOfBandDepth = ThreadLocal.withInitial { 0 }
+    private val hits = AtomicLong()
+    private val misses = AtomicLong()
+
+    /**
+     * Ensure [connection] carries [scope], skipping the database call when it already does
+     */
+    fun apply(connection: Connection, scope: ConnectionScope) {
+        val physicalConnection = connection.physicalConnection()
+        checkedOut[physicalConnection] = Thread.currentThread()
+
+        if (enabled && appliedScopes[physicalConnection] == scope) {
+            hits.incrementAndGet()
+            log.trace("Connection scope hit: {}", scope)
+            return
+        }
+
+        misses.incrementAndGet()
+        appliedScopes.remove(physicalConnection)
+        connection.applyScope(scope)
+        if (!connection.autoCommit) {
+            // A fresh checkout carries no other work, so this only commits the scope settings
+            connection.commit()
+        }
+
+        if (enabled && outOfBandDepth.get() == 0) {
+            appliedScopes[physicalConnection] = scope
+        }
+    }
+
+    /**
+     * Mark [connection] as returned to the pool
+     */
+    fun release(connection: Connection) {
+        checkedOut.remove(connection.physicalConnection())
+    }
+
+    /**
+     * Run [change], which alters scope settings outside [apply] on this thread's connections
+     *
+     * Connections checked out by this thread are forgotten before [change] runs, and connections
+     * checked out while it runs are not recorded.
+     */
+    fun <T> outOfBandScopeChange(change: () -> T): T {
+        val thread = Thread.currentThread()
+        checkedOut.forEach { (physicalConnection, owner) ->
+            if (owner === thread) appliedScopes.remove(physicalConnection)
+        }
+        outOfBandDepth.set(outOfBandDepth.get() + 1)
+        try {
+            return change()
+        } finally {
+            outOfBandDepth.set(outOfBandDepth.get() - 1)
+        }
+    }
+
+    /**
+     * Schema of the connection, taken from the tracked scope to avoid a current_schema() round trip
+     */
+    fun currentSchema(connection: Connection): String {
+        if (enabled) {
+            appliedScopes[connection.physicalConnection()]?.let { return it.schema }
+        }
+        return connection.schema
+    }
+
+    /**
+     * Forget the scope of a single connection, e.g. after a failed or out-of-band scope change
+     */
+    fun invalidate(connection: Connection) {
+        appliedScopes.remove(connection.physicalConnection())
+    }
+
+    val stats: ConnectionScopeStats
+        get() = ConnectionScopeStats(hits.get(), misses.get())
+
+    private fun Connection.physicalConnection(): Connection {
+        // Pool proxies unwrap to their delegate driver connection
+        return try {
+            if (isWrapperFor(Connection::class.java)) unwrap(Connection::class.java) else this
+        } catch (e: Exception) {
+            this
+        }
+    }
+}
@@ -0,0 +1,15 @@
+package net.blugrid.server.multitenancy.config
+
+/**
+ * Snapshot of connection scope cache counters
+ *
+ * @param hits Checkouts where the connection already carried the requested scope
+ * @param misses Checkouts where the scope had to be applied
+ */
+data class ConnectionScopeStats(
+    val hits: Long,
+    val misses: Long,
+) {
+    val hitRatio: Double
+        get() = if (hits + misses == 0L) 0.0 else hits.toDouble() / (hits + misses)
+}
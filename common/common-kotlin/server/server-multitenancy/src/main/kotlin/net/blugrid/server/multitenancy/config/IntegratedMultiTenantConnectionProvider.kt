@@ -1,12 +1,14 @@
 package net.blugrid.server.multitenancy.config
 
 import jakarta.inject.Singleton
+import net.blugrid.platform.config.DbProps
 import net.blugrid.platform.logging.logger
 import net.blugrid.security.core.context.RequestContext
 import net.blugrid.security.core.session.BusinessUnitSession
 import net.blugrid.security.core.session.TenantSession
 import net.blugrid.server.api.config.ServerMode
 import net.blugrid.server.api.persistence.ConnectionProvider
+import net.blugrid.server.api.persistence.ConnectionScopeTracker
 import net.blugrid.server.api.tenant.TenantContext
 import org.hibernate.HibernateException
 import org.hibernate.cfg.AvailableSettings
@@ -17,7 +19,6 @@ import org.hibernate.service.spi.ServiceRegistryImplementor
 import org.hibernate.service.spi.Stoppable
 import java.sql.Connection
 import java.sql.SQLException
-import java.sql.Types
 import java.util.concurrent.ConcurrentHashMap
 import javax.sql.DataSource
 
@@ -30,19 +31,23 @@ import javax.sql.DataSource
  * - Multi-level scoping (tenant, business unit, session)
  * - Production connection management
  * - Integration with both old and new APIs
+ * - Scope tracking per pooled connection, skipping the scope statement when it already matches
  */
 @Suppress("UNCHECKED_CAST")
 @Singleton
 open class IntegratedMultiTenantConnectionProvider(
-    private val securityContextService: RequestContext
+    private val securityContextService: RequestContext,
+    dbProps: DbProps,
 ) : AbstractDataSourceBasedMultiTenantConnectionProviderImpl<String>(),
     ConnectionProvider,
+    ConnectionScopeTracker,
     ServiceRegistryAwareService,
     Stoppable {
 
     private val log = logger()
     private var dataSourceMap: Map<String, DataSource>? = null
     private var tenantIdentifierForAny: String? = null
+    private val connectionScopeCache = ConnectionScopeCache(dbProps.connectionScopeCachingEnabled)
 
     companion object {
         const val DEFAULT_TENANT_ID = "default"
@@ -85,55 +90,74 @@ open class IntegratedMultiTenantConnectionProvider(
         val connection: Connection
         try {
             connection = selectAnyDataSource().connection
-            val schema = connection.schema
+            val schema = connectionScopeCache.currentSchema(connection)
             val unscoped = securityContextService.currentIsUnscoped
             val currentTenantId = securityContextService.currentTenantId
             val currentBusinessUnitId = securityContextService.currentBusinessUnitId
             val currentSession = securityContextService.currentSession
 
-            when {
+            val scope = when {
                 unscoped -> {
                     log.debug("Configuring connection - unscoped override found - no scoping needed")
-                    connection.configureUnscoped(schema)
+                    ConnectionScope(schema)
                 }
 
                 currentSession is TenantSession && currentTenantId != null -> {
                     log.debug("Configuring connection - WebApplication session found in SecurityContext - scoping to TenantId: $currentTenantId")
-                    connection.configureTenantSessionScope(schema, currentTenantId.toString(), currentSession.sessionId)
+                    ConnectionScope(schema, tenantId = currentTenantId.toString(), sessionId = currentSession.sessionId)
                 }
 
                 currentSession is BusinessUnitSession && currentTenantId != null && currentBusinessUnitId != null -> {
                     log.debug("Configuring connection - Business unit session found in SecurityContext - scoping to TenantId: $currentTenantId, BusinessUnitId: $currentBusinessUnitId")
-                    connection.configureBusinessUnitSessionScope(schema, currentTenantId.toString(), currentBusinessUnitId.toString(), currentSession.sessionId)
+                    ConnectionScope(schema, currentTenantId.toString(), currentBusinessUnitId.toString(), currentSession.sessionId)
                 }
 
                 currentTenantId != null && currentBusinessUnitId != null -> {
                     log.debug("Configuring connection - Business unit session found in SecurityContext - scoping to TenantId: $currentTenantId, BusinessUnitId: $currentBusinessUnitId")
-                    connection.configureBusinessUnitIdScope(schema, currentTenantId.toString(), currentBusinessUnitId.toString())
+                    ConnectionScope(schema, currentTenantId.toString(), currentBusinessUnitId.toString())
                 }
 
                 currentTenantId != null -> {
                     log.debug("Configuring connection - WebApplication session found in SecurityContext - scoping to TenantId: $currentTenantId")
-                    connection.configureTenantIdScope(schema, currentTenantId.toString())
+                    ConnectionScope(schema, tenantId = currentTenantId.toString())
                 }
 
                 else -> {
                     log.debug("Configuring connection - no scoping needed")
-                    connection.configureUnscoped(schema)
+                    ConnectionScope(schema)
                 }
             }
+
+            try {
+                connectionScopeCache.apply(connection, scope)
+            } catch (e: SQLException) {
+                connectionScopeCache.invalidate(connection)
+                connectionScopeCache.release(connection)
+                connection.close()
+                throw e
+            }
         } catch (e: SQLException) {
             throw SQLException("Could not alter JDBC connection: ", e)
         }
         return connection
     }
 
+    /**
+     * Scope cache hit/miss counters since startup
+     */
+    val connectionScopeStats: ConnectionScopeStats
+        get() = connectionScopeCache.stats
+
+    override fun <T> outOfBandScopeChange(change: () -> T): T =
+        connectionScopeCache.outOfBandScopeChange(change)
+
     override fun releaseAnyConnection(connection: Connection) {
         this.releaseConnection("1", connection)
     }
 
     override fun releaseConnection(regionId: String, connection: Connection) {
         log.debug("Releasing connection")
+        connectionScopeCache.release(connection)
         connection.close()
     }
 
@@ -165,57 +189,3 @@ open class IntegratedMultiTenantConnectionProvider(
         }
     }
 }
-
-// ===== KEEP ALL YOUR EXISTING DATABASE CONFIGURATION METHODS =====
-
-private fun Connection.configureUnscoped(schema: String) {
-    prepareCall("select pg_catalog.set_config('search_path', ?, false)")
-        .use { statement ->
-            statement.setString(1, schema)
-            statement.execute()
-        }
-}
-
-private fun Connection.configureTenantIdScope(schema: String, tenantId: String) {
-    prepareCall("{? = CALL set_tenant_session(CAST(? AS TEXT), CAST(? AS TEXT)) }")
-        .use { statement ->
-            statement.registerOutParameter(1, Types.INTEGER)
-            statement.setString(2, schema)
-            statement.setString(3, tenantId)
-            statement.execute()
-        }
-}
-
-private fun Connection.configureTenantSessionScope(schema: String, tenantId: String, sessionId: String) {
-    prepareCall("{? = CALL set_tenant_session(CAST(? AS TEXT), CAST(? AS TEXT), CAST(? AS TEXT)) }")
-        .use { statement ->
-            statement.registerOutParameter(1, Types.INTEGER)
-            statement.setString(2, schema)
-            statement.setString(3, tenantId)
-            statement.setString(4, sessionId)
-            statement.execute()
-        }
-}
-
-private fun Connection.configureBusinessUnitIdScope(schema: String, tenantId: String, businessUnitId: String) {
-    prepareCall("{? = CALL set_business_unit_session(CAST(? AS TEXT), CAST(? AS TEXT), CAST(? AS TEXT)) }")
-        .use { statement ->
-            statement.registerOutParameter(1, Types.INTEGER)
-            statement.setString(2, schema)
-            statement.setString(3, tenantId)
-            statement.setString(4, businessUnitId)
-            statement.execute()
-        }
-}
-
-private fun Connection.configureBusinessUnitSessionScope(schema: String, tenantId: String, businessUnitId: String, sessionId: String) {
-    prepareCall("{? = CALL set_business_unit_session(CAST(? AS TEXT), CAST(? AS TEXT), CAST(? AS TEXT), CAST(? AS TEXT)) }")
-        .use { statement ->
-            statement.registerOutParameter(1, Types.INTEGER)
-            statement.setString(2, schema)
-            statement.setString(3, tenantId)
-            statement.setString(4, businessUnitId)
-            statement.setString(5, sessionId)
-            statement.execute()
-        }
-}
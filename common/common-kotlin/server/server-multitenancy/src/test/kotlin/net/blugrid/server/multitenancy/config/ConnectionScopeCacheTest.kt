@@ -0,0 +1,218 @@
+package net.blugrid.server.multitenancy.config
+
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+import java.lang.reflect.Proxy
+import java.sql.Connection
+import java.sql.PreparedStatement
+import java.util.concurrent.ArrayBlockingQueue
+import java.util.concurrent.ConcurrentLinkedQueue
+import java.util.concurrent.Executors
+import java.util.concurrent.TimeUnit
+import kotlin.random.Random
+
+class ConnectionScopeCacheTest {
+
+    private val scopes = listOf(
+        ConnectionScope("public"),
+        ConnectionScope("public", tenantId = "1"),
+        ConnectionScope("public", tenantId = "2"),
+        ConnectionScope("public", tenantId = "1", sessionId = "10"),
+        ConnectionScope("public", tenantId = "2", businessUnitId = "20"),
+        ConnectionScope("public", tenantId = "2", businessUnitId = "20", sessionId = "30"),
+    )
+
+    @Test
+    fun `Every checkout sees exactly the requested scope under concurrent reuse`() {
+        val cache = ConnectionScopeCache(enabled = true)
+        val pool = ArrayBlockingQueue<FakeConnection>(POOL_SIZE)
+        repeat(POOL_SIZE) { pool.add(FakeConnection()) }
+        val violations = ConcurrentLinkedQueue<String>()
+
+        val executor = Executors.newFixedThreadPool(THREADS)
+        repeat(THREADS) {
+            executor.execute {
+                repeat(CHECKOUTS_PER_THREAD) {
+                    val scope = scopes[Random.nextInt(scopes.size)]
+                    val physical = pool.take()
+                    // Pools hand out a fresh wrapper per checkout around the same physical connection
+                    val connection = physical.checkout()
+                    try {
+                        cache.apply(connection, scope)
+                        if (physical.settings != expectedSettings(scope)) {
+                            violations.add("expected ${expectedSettings(scope)} but was ${physical.settings}")
+                        }
+                        if (Random.nextInt(10) == 0) {
+                            // Out-of-band change on the checked out connection, as RequestScopeService makes
+                            cache.outOfBandScopeChange { physical.settings["tenant.id"] = "99" }
+                        }
+                    } finally {
+                        cache.release(connection)
+                        pool.put(physical)
+                    }
+                }
+            }
+        }
+        executor.shutdown()
+        executor.awaitTermination(1, TimeUnit.MINUTES)
+
+        val stats = cache.stats
+        assertTrue(violations.isEmpty(), violations.take(5).joinToString())
+        assertEquals(THREADS.toLong() * CHECKOUTS_PER_THREAD, stats.hits + stats.misses)
+        assertTrue(stats.hits > 0)
+        assertEquals(stats.misses, pool.sumOf { it.scopeStatements }.toLong())
+    }
+
+    @Test
+    fun `Switching scope clears identifiers from the previous scope`() {
+        val cache = ConnectionScopeCache(enabled = true)
+        val physical = FakeConnection()
+
+        cache.apply(physical.checkout(), ConnectionScope("public", tenantId = "2", businessUnitId = "20", sessionId = "30"))
+        cache.apply(physical.checkout(), ConnectionScope("public", tenantId = "1"))
+
+        assertEquals(expectedSettings(ConnectionScope("public", tenantId = "1")), physical.settings)
+    }
+
+    @Test
+    fun `Connections changed out of band re-apply their scope on the next checkout`() {
+        val cache = ConnectionScopeCache(enabled = true)
+        val physical = FakeConnection()
+        val scope = ConnectionScope("public", tenantId = "1")
+
+        val connection = physical.checkout()
+        cache.apply(connection, scope)
+        cache.outOfBandScopeChange { physical.settings["tenant.id"] = "2" }
+        cache.release(connection)
+        cache.apply(physical.checkout(), scope)
+
+        assertEquals(expectedSettings(scope), physical.settings)
+        assertEquals(ConnectionScopeStats(hits = 0, misses = 2), cache.stats)
+    }
+
+    @Test
+    fun `Connections checked out during an out-of-band change are not recorded`() {
+        val cache = ConnectionScopeCache(enabled = true)
+        val physical = FakeConnection()
+        val scope = ConnectionScope("public", tenantId = "1")
+
+        cache.outOfBandScopeChange {
+            val connection = physical.checkout()
+            cache.apply(connection, scope)
+            physical.settings["tenant.id"] = "0"
+            cache.release(connection)
+        }
+        cache.apply(physical.checkout(), scope)
+
+        assertEquals(expectedSettings(scope), physical.settings)
+        assertEquals(ConnectionScopeStats(hits = 0, misses = 2), cache.stats)
+    }
+
+    @Test
+    fun `Scope applied without auto-commit is committed before it is recorded`() {
+        val cache = ConnectionScopeCache(enabled = true)
+        val physical = FakeConnection().apply { autoCommit = false }
+
+        repeat(2) { cache.apply(physical.checkout(), scopes[1]) }
+
+        assertEquals(1, physical.commits)
+        assertEquals(ConnectionScopeStats(hits = 1, misses = 1), cache.stats)
+    }
+
+    @Test
+    fun `Disabled cache applies the scope on every checkout`() {
+        val cache = ConnectionScopeCache(enabled = false)
+        val physical = FakeConnection()
+
+        repeat(3) { cache.apply(physical.checkout(), scopes[1]) }
+
+        assertEquals(3, physical.scopeStatements)
+        assertEquals(ConnectionScopeStats(hits = 0, misses = 3), cache.stats)
+    }
+
+    private fun expectedSettings(scope: ConnectionScope) = mapOf(
+        "search_path" to scope.schema,
+        "tenant.id" to (scope.tenantId ?: "0"),
+        "business_unit.id" to (scope.businessUnitId ?: "0"),
+        "session.id" to (scope.sessionId ?: "0"),
+        "operator.party.id" to "0",
+    )
+
+    /**
+     * Physical connection that records the session settings written by the scope statement
+     */
+    private class FakeConnection {
+        val settings = mutableMapOf<String, String>()
+        var scopeStatements = 0
+        var autoCommit = true
+        var commits = 0
+
+        private val physical: Connection = proxy { method, _ ->
+            when (method) {
+                "prepareStatement" -> statement()
+                "getSchema" -> settings["search_path"] ?: "public"
+                "getAutoCommit" -> autoCommit
+                "commit" -> {
+                    commits++
+                    null
+                }
+                "isWrapperFor" -> false
+                else -> null
+            }
+        }
+
+        /**
+         * Per-checkout wrapper that unwraps to the physical connection, as pooled connections do
+         */
+        fun checkout(): Connection = proxy { method, args ->
+            when (method) {
+                "isWrapperFor" -> true
+                "unwrap" -> physical
+                "prepareStatement" -> physical.prepareStatement(args!![0] as String)
+                "getSchema" -> physical.schema
+                "getAutoCommit" -> physical.autoCommit
+                "commit" -> physical.commit()
+                else -> null
+            }
+        }
+
+        private fun statement(): PreparedStatement {
+            val params = arrayOfNulls<String>(4)
+            return proxy { method, args ->
+                when (method) {
+                    "setString" -> {
+                        params[(args!![0] as Int) - 1] = args[1] as String?
+                        null
+                    }
+                    "execute" -> {
+                        scopeStatements++
+                        settings["search_path"] = params[0]!!
+                        settings["tenant.id"] = params[1] ?: "0"
+                        settings["business_unit.id"] = params[2] ?: "0"
+                        settings["session.id"] = params[3] ?: "0"
+                        settings["operator.party.id"] = "0"
+                        true
+                    }
+                    else -> null
+                }
+            }
+        }
+    }
+
+    companion object {
+        private const val POOL_SIZE = 3
+        private const val THREADS = 8
+        private const val CHECKOUTS_PER_THREAD = 2_000
+    }
+}
+
+private inline fun <reified T> proxy(crossinline handler: (String, Array<out Any?>?) -> Any?): T =
+    Proxy.newProxyInstance(T::class.java.classLoader, arrayOf(T::class.java)) { self, method, args ->
+        when (method.name) {
+            "hashCode" -> System.identityHashCode(self)
+            "equals" -> self === args?.get(0)
+            "toString" -> T::class.java.simpleName
+            else -> handler(method.name, args)
+        }
+    } as T
@@ -2,7 +2,9 @@ package net.blugrid.server.persistence.scope
 
 import jakarta.inject.Singleton
 import net.blugrid.platform.logging.logger
+import net.blugrid.server.api.persistence.ConnectionScopeTracker
 import net.blugrid.server.persistence.repositories.RequestScopeRepository
+import java.util.Optional
 
 /**
  * Implementation that delegates to your existing PostgreSQL function calls
@@ -10,23 +12,31 @@ import net.blugrid.server.persistence.repositories.RequestScopeRepository
  */
 @Singleton
 class RequestScopeServiceImpl(
-    private val requestScopeRepository: RequestScopeRepository
+    private val requestScopeRepository: RequestScopeRepository,
+    private val connectionScopeTracker: Optional<ConnectionScopeTracker>,
 ) : RequestScopeService {
 
     private val log = logger()
 
     override fun setTenantScope(tenantId: String): Int {
         log.debug("Setting database tenant scope via PostgreSQL function: {}", tenantId)
-        return requestScopeRepository.setTenantId(tenantId)
+        return outOfBandScopeChange { requestScopeRepository.setTenantId(tenantId) }
     }
 
     override fun setBusinessUnitScope(businessUnitId: String): Int {
         log.debug("Setting database business unit scope via PostgreSQL function: {}", businessUnitId)
-        return requestScopeRepository.setBusinessUnitId(businessUnitId)
+        return outOfBandScopeChange { requestScopeRepository.setBusinessUnitId(businessUnitId) }
     }
 
     override fun resetRequestScope(): Int {
         log.debug("Resetting database request scope via PostgreSQL function")
-        return requestScopeRepository.resetRequestScope()
+        return outOfBandScopeChange { requestScopeRepository.resetRequestScope() }
     }
+
+    /**
+     * Scope set here bypasses the connection provider, so the connections it touches must re-apply
+     * their scope on their next checkout
+     */
+    private fun <T> outOfBandScopeChange(change: () -> T): T =
+        if (connectionScopeTracker.isPresent) connectionScopeTracker.get().outOfBandScopeChange(change) else change()
 }
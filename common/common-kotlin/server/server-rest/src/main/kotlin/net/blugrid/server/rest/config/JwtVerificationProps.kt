@@ -0,0 +1,41 @@
+package net.blugrid.server.rest.config
+
+import io.micronaut.context.annotation.ConfigurationProperties
+import io.micronaut.core.bind.annotation.Bindable
+import java.time.Duration
+
+@ConfigurationProperties("security.jwt")
+interface JwtVerificationProps {
+
+    /**
+     * Keep verified tokens in memory so a token is only verified once until it expires
+     */
+    @get:Bindable(defaultValue = "true")
+    val tokenCacheEnabled: Boolean
+
+    @get:Bindable(defaultValue = "10000")
+    val tokenCacheMaxSize: Int
+
+    /**
+     * Longest time a verified token is trusted without verifying it again, capped at its `exp`
+     */
+    @get:Bindable(defaultValue = "5m")
+    val tokenCacheMaxTtl: Duration
+
+    /**
+     * Local JWKS file to verify against instead of the provider's `jwks_uri`
+     */
+    val jwksPath: String?
+
+    /**
+     * Interval at which signing keys are reloaded in the background
+     */
+    @get:Bindable(defaultValue = "10m")
+    val jwksRefreshInterval: Duration
+
+    /**
+     * Minimum time between reloads triggered by a token signed with an unknown key
+     */
+    @get:Bindable(defaultValue = "30s")
+    val jwksMinRefreshInterval: Duration
+}
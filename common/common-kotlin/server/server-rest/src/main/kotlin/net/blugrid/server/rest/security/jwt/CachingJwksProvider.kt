@@ -0,0 +1,173 @@
+package net.blugrid.server.rest.security.jwt
+
+import com.nimbusds.jose.KeySourceException
+import com.nimbusds.jose.jwk.JWK
+import com.nimbusds.jose.jwk.JWKSelector
+import com.nimbusds.jose.jwk.JWKSet
+import com.nimbusds.jose.jwk.source.JWKSource
+import com.nimbusds.jose.proc.SecurityContext
+import net.blugrid.platform.logging.logger
+import java.io.File
+import java.net.URL
+import java.time.Clock
+import java.time.Duration
+import java.util.concurrent.Executors
+import java.util.concurrent.ScheduledExecutorService
+import java.util.concurrent.TimeUnit
+import java.util.concurrent.atomic.AtomicLong
+
+/**
+ * Signing keys served from memory and reloaded in the background
+ *
+ * Keys are loaded on first use and then every [refreshInterval] from a background thread, so
+ * verification never waits on the network once keys are loaded. A token signed with a key that
+ * is not known yet, e.g. straight after a key rotation, triggers one synchronous reload, at most
+ * once per [minRefreshInterval]. A failed reload keeps serving the previously loaded keys.
+ */
+class CachingJwksProvider(
+    private val loader: () -> JWKSet,
+    refreshInterval: Duration,
+    private val minRefreshInterval: Duration,
+    private val clock: Clock = Clock.systemUTC(),
+) : JWKSource<SecurityContext>, AutoCloseable {
+
+    private val log = logger()
+
+    @Volatile
+    private var jwkSet: JWKSet? = null
+
+    @Volatile
+    private var lastLoadMillis = 0L
+
+    private val hits = AtomicLong()
+    private val misses = AtomicLong()
+    private val refreshes = AtomicLong()
+    private val refreshFailures = AtomicLong()
+
+    private val scheduler: ScheduledExecutorService? =
+        if (refreshInterval.isZero || refreshInterval.isNegative) {
+            null
+        } else {
+            Executors.newSingleThreadScheduledExecutor { runnable ->
+                Thread(runnable, "jwks-refresh").apply { isDaemon = true }
+            }.apply {
+                scheduleWithFixedDelay(::refreshQuietly, refreshInterval.toMillis(), refreshInterval.toMillis(), TimeUnit.MILLISECONDS)
+            }
+        }
+
+    override fun get(jwkSelector: JWKSelector, context: SecurityContext?): List<JWK> {
+        val matches = jwkSelector.select(current())
+        if (matches.isNotEmpty()) {
+            hits.incrementAndGet()
+            return matches
+        }
+
+        misses.incrementAndGet()
+        return if (reloadForUnknownKey()) jwkSelector.select(current()) else matches
+    }
+
+    val stats: JwksProviderStats
+        get() = JwksProviderStats(
+            hits = hits.get(),
+            misses = misses.get(),
+            refreshes = refreshes.get(),
+            refreshFailures = refreshFailures.get(),
+            keys = jwkSet?.keys?.size ?: 0,
+        )
+
+    override fun close() {
+        scheduler?.shutdownNow()
+    }
+
+    private fun current(): JWKSet =
+        jwkSet ?: synchronized(this) {
+            jwkSet ?: try {
+                load()
+            } catch (e: Exception) {
+                recordFailure(e)
+                throw KeySourceException("Failed to load JWKS", e)
+            }
+        }
+
+    private fun reloadForUnknownKey(): Boolean =
+        synchronized(this) {
+            if (clock.millis() - lastLoadMillis < minRefreshInterval.toMillis()) {
+                false
+            } else {
+                log.debug("Reloading JWKS for a token signed with an unknown key")
+                runCatching { load() }.onFailure(::recordFailure).isSuccess
+            }
+        }
+
+    private fun refreshQuietly() {
+        try {
+            synchronized(this) { load() }
+        } catch (e: Exception) {
+            recordFailure(e)
+        }
+    }
+
+    private fun load(): JWKSet =
+        loader().also {
+            jwkSet = it
+            lastLoadMillis = clock.millis()
+            refreshes.incrementAndGet()
+            log.debug("Loaded {} signing keys", it.keys.size)
+        }
+
+    private fun recordFailure(e: Throwable) {
+        refreshFailures.incrementAndGet()
+        log.warn("Failed to reload JWKS, keeping {} cached keys: {}", jwkSet?.keys?.size ?: 0, e.message)
+    }
+
+    companion object {
+        private const val CONNECT_TIMEOUT_MILLIS = 2_000
+        private const val READ_TIMEOUT_MILLIS = 2_000
+        private const val SIZE_LIMIT_BYTES = 512 * 1024
+
+        fun fromUrl(url: URL, refreshInterval: Duration, minRefreshInterval: Duration): CachingJwksProvider =
+            CachingJwksProvider(
+                { JWKSet.load(url, CONNECT_TIMEOUT_MILLIS, READ_TIMEOUT_MILLIS, SIZE_LIMIT_BYTES) },
+                refreshInterval,
+                minRefreshInterval
+            )
+
+        /**
+         * Keys from a JWKS file on disk, falling back to a classpath resource of the same path
+         */
+        fun fromPath(path: String, refreshInterval: Duration, minRefreshInterval: Duration): CachingJwksProvider =
+            CachingJwksProvider(
+                {
+                    val file = File(path)
+                    if (file.isFile) {
+                        JWKSet.load(file)
+                    } else {
+                        val resource = CachingJwksProvider::class.java.classLoader.getResourceAsStream(path)
+                            ?: throw IllegalArgumentException("Cannot load file: $path")
+                        JWKSet.parse(resource.bufferedReader().use { it.readText() })
+                    }
+                },
+                refreshInterval,
+                minRefreshInterval
+            )
+
+        /**
+         * Fixed keys held in memory, e.g. for offline verification in tests
+         */
+        fun fromJwkSet(jwkSet: JWKSet): CachingJwksProvider =
+            CachingJwksProvider({ jwkSet }, Duration.ZERO, Duration.ofDays(365))
+    }
+}
+
+/**
+ * Snapshot of JWKS provider metrics
+ *
+ * @param misses Lookups for a key that was not in the cached set
+ */
+data class JwksProviderStats(
+    val hits: Long,
+    val misses: Long,
+    val refreshes: Long,
+    val refreshFailures: Long,
+    val keys: Int,
+)
@@ -2,72 +2,103 @@
 
 package net.blugrid.server.rest.security.jwt
 
+import com.nimbusds.jose.JOSEException
 import com.nimbusds.jose.JOSEObjectType
 import com.nimbusds.jose.JWSAlgorithm
-import com.nimbusds.jose.jwk.source.RemoteJWKSet
+import com.nimbusds.jose.jwk.source.JWKSource
+import com.nimbusds.jose.proc.BadJOSEException
 import com.nimbusds.jose.proc.DefaultJOSEObjectTypeVerifier
 import com.nimbusds.jose.proc.JWSVerificationKeySelector
 import com.nimbusds.jose.proc.SecurityContext
 import com.nimbusds.jwt.JWT
-import com.nimbusds.jwt.JWTClaimsSet
-import com.nimbusds.jwt.JWTParser
 import com.nimbusds.jwt.SignedJWT
 import com.nimbusds.jwt.proc.DefaultJWTClaimsVerifier
 import com.nimbusds.jwt.proc.DefaultJWTProcessor
-import com.nimbusds.jwt.proc.JWTProcessor
 import io.micronaut.context.annotation.Requires
 import io.micronaut.context.env.Environment
 import io.micronaut.security.authentication.AuthorizationException
 import io.micronaut.security.oauth2.configuration.OauthClientConfigurationProperties
+import jakarta.annotation.PreDestroy
+import jakarta.inject.Inject
 import jakarta.inject.Singleton
 import net.blugrid.platform.logging.logger
 import net.blugrid.security.tokens.model.JwtDecoder
+import net.blugrid.server.rest.config.JwtVerificationProps
 import java.net.URL
 import java.nio.charset.StandardCharsets
 import java.text.ParseException
 import java.util.Base64
 
-// Not used. The Micronuat JwtValidator does this via configuration
+/**
+ * Verifies RS256 signed JWTs issued by the OAuth provider against its signing keys
+ *
+ * Request authentication does not go through this decoder: session cookies carry self-signed
+ * tokens verified by [SelfSignedJwtDecoderImpl]. It is for code that handles provider tokens
+ * directly. Each token is parsed once and verified once, then served from [VerifiedTokenCache]
+ * until it expires. Signing keys come from a [CachingJwksProvider], loaded from
+ * `security.jwt.jwks-path` when set and from the provider's `jwks_uri` otherwise.
+ */
 @Singleton
 @Requires(notEnv = [Environment.TEST])
-class JwtDecoderImpl(
-    private val oauthClientProps: OauthClientConfigurationProperties
-) : JwtDecoder {
+class JwtDecoderImpl internal constructor(
+    private val jwkSource: JWKSource<SecurityContext>,
+    private val tokenCache: VerifiedTokenCache,
+) : JwtDecoder, AutoCloseable {
 
     private val log = logger()
 
-    companion object {
-        private var exactClaims: JWTClaimsSet? = null
-        private var requiredClaims: Set<String>? = null
-        private lateinit var processor: JWTProcessor<SecurityContext>
-        private lateinit var jwksUri: String
+    @Inject
+    constructor(
+        oauthClientProps: OauthClientConfigurationProperties,
+        props: JwtVerificationProps,
+    ) : this(
+        jwkSource = jwksProvider(oauthClientProps, props),
+        tokenCache = VerifiedTokenCache(props.tokenCacheEnabled, props.tokenCacheMaxSize, props.tokenCacheMaxTtl),
+    )
 
-        fun initialize(oauthClientProps: OauthClientConfigurationProperties) {
-            jwksUri = oauthClientProps.openid.flatMap { it.jwksUri }.orElseThrow {
-                IllegalStateException("jwksUri is not available")
-            }
-            processor = DefaultJWTProcessor<SecurityContext>().apply {
-                jwsTypeVerifier = DefaultJOSEObjectTypeVerifier(JOSEObjectType("jwt"))
-                jwsKeySelector = JWSVerificationKeySelector(
-                    JWSAlgorithm.RS256,
-                    RemoteJWKSet(URL(jwksUri))
-                )
-                jwtClaimsSetVerifier = DefaultJWTClaimsVerifier(exactClaims, requiredClaims)
-            }
-        }
-    }
-
-    init {
-        initialize(oauthClientProps)
+    private val processor = DefaultJWTProcessor<SecurityContext>().apply {
+        jwsTypeVerifier = DefaultJOSEObjectTypeVerifier(JOSEObjectType("jwt"))
+        jwsKeySelector = JWSVerificationKeySelector(JWSAlgorithm.RS256, jwkSource)
+        jwtClaimsSetVerifier = DefaultJWTClaimsVerifier(null, null)
     }
 
     override fun decode(token: String): JWT {
         return try {
-            processor.process(token, null)
-                .let { JWTParser.parse(token) }
+            tokenCache.getOrVerify(token) { raw ->
+                SignedJWT.parse(raw).also { processor.process(it, null) }
+            }
         } catch (e: ParseException) {
             log.error("Parsing error: $e")
             throw AuthorizationException(null)
+        } catch (e: BadJOSEException) {
+            log.debug("JWT rejected: {}", e.message)
+            throw AuthorizationException(null)
+        } catch (e: JOSEException) {
+            log.error("JWT verification error: $e")
+            throw AuthorizationException(null)
+        }
+    }
+
+    val tokenCacheStats: VerifiedTokenCacheStats
+        get() = tokenCache.stats
+
+    val jwksStats: JwksProviderStats?
+        get() = (jwkSource as? CachingJwksProvider)?.stats
+
+    @PreDestroy
+    override fun close() {
+        (jwkSource as? AutoCloseable)?.close()
+    }
+
+    companion object {
+        private fun jwksProvider(oauthClientProps: OauthClientConfigurationProperties, props: JwtVerificationProps): CachingJwksProvider {
+            props.jwksPath?.takeIf { it.isNotBlank() }?.let {
+                return CachingJwksProvider.fromPath(it, props.jwksRefreshInterval, props.jwksMinRefreshInterval)
+            }
+            val jwksUri = oauthClientProps.openid.flatMap { it.jwksUri }.orElseThrow {
+                IllegalStateException("jwksUri is not available")
+            }
+            return CachingJwksProvider.fromUrl(URL(jwksUri), props.jwksRefreshInterval, props.jwksMinRefreshInterval)
         }
     }
 }
@@ -5,36 +5,58 @@ import com.nimbusds.jose.crypto.RSASSAVerifier
 import com.nimbusds.jwt.JWT
 import com.nimbusds.jwt.JWTParser
 import com.nimbusds.jwt.SignedJWT
+import com.nimbusds.jwt.proc.BadJWTException
 import io.micronaut.context.annotation.Requires
 import io.micronaut.context.annotation.Value
+import jakarta.inject.Inject
 import jakarta.inject.Singleton
 import net.blugrid.platform.logging.logger
 import net.blugrid.security.tokens.model.SelfSignedJwtDecoder
+import net.blugrid.server.rest.config.JwtVerificationProps
 import java.security.interfaces.RSAPublicKey
 import java.util.Optional
 
+/**
+ * Verifies the self-signed session JWTs that [net.blugrid.server.rest.security.filters.JwtAuthenticationFetcher]
+ * reads from the session cookie on every request
+ *
+ * A token that verifies is served from [VerifiedTokenCache] until it expires, so each session
+ * token is parsed and signature checked once rather than on every request.
+ */
 @Singleton
 @Requires(property = "micronaut.security.token.jwt.signatures.jwks-static.selfSigned.path")
-class SelfSignedJwtDecoderImpl(
-    @Value("\${micronaut.security.token.jwt.signatures.jwks-static.selfSigned.path}") jwksFilePath: String
+class SelfSignedJwtDecoderImpl internal constructor(
+    publicKey: RSAPublicKey,
+    private val tokenCache: VerifiedTokenCache,
 ) : SelfSignedJwtDecoder {
-    private val log = logger()
-    private val publicKey: RSAPublicKey
 
-    init {
-        val jwksLoader = JwksLoader(jwksFilePath)
-        publicKey = jwksLoader.publicKey
-    }
+    @Inject
+    constructor(
+        @Value("\${micronaut.security.token.jwt.signatures.jwks-static.selfSigned.path}") jwksFilePath: String,
+        props: JwtVerificationProps,
+    ) : this(
+        publicKey = JwksLoader(jwksFilePath).publicKey,
+        tokenCache = VerifiedTokenCache(props.tokenCacheEnabled, props.tokenCacheMaxSize, props.tokenCacheMaxTtl),
+    )
 
-    override fun decode(token: String): Optional<JWT> {
-        val jwt: SignedJWT = JWTParser.parse(token) as SignedJWT
-        val verifier: JWSVerifier = RSASSAVerifier(publicKey)
+    private val log = logger()
+    private val verifier: JWSVerifier = RSASSAVerifier(publicKey)
 
-        return if (jwt.verify(verifier)) {
-            Optional.of(jwt)
-        } else {
+    override fun decode(token: String): Optional<JWT> {
+        return try {
+            Optional.of(tokenCache.getOrVerify(token, ::verify))
+        } catch (e: BadJWTException) {
             log.error("JWT verification failed")
             Optional.empty()
         }
     }
+
+    val tokenCacheStats: VerifiedTokenCacheStats
+        get() = tokenCache.stats
+
+    private fun verify(token: String): JWT {
+        val jwt: SignedJWT = JWTParser.parse(token) as SignedJWT
+        if (!jwt.verify(verifier)) throw BadJWTException("Invalid signature")
+        return jwt
+    }
 }
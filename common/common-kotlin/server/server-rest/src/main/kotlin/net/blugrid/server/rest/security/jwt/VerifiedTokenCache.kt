@@ -0,0 +1,108 @@
+package net.blugrid.server.rest.security.jwt
+
+import com.nimbusds.jwt.JWT
+import java.security.MessageDigest
+import java.time.Clock
+import java.time.Duration
+import java.util.Base64
+import java.util.concurrent.ConcurrentHashMap
+import java.util.concurrent.atomic.AtomicLong
+
+/**
+ * Bounded cache of verified tokens
+ *
+ * Entries are keyed by a SHA-256 hash of the raw token, so bearer tokens are never held as map
+ * keys, and are trusted for at most [maxTtl] and never past the token's `exp`. Tokens without
+ * an `exp` are not cached. Lookups take no lock. Once [maxSize] is reached, a sweep drops the
+ * expired entries and then evicts arbitrary live ones until the cache is back to 90% of [maxSize],
+ * so a stream of distinct tokens pays for one sweep per tenth of the cache rather than per miss.
+ */
+class VerifiedTokenCache(
+    private val enabled: Boolean,
+    private val maxSize: Int,
+    private val maxTtl: Duration,
+    private val clock: Clock = Clock.systemUTC(),
+) {
+
+    private val entries = ConcurrentHashMap<String, Entry>()
+    private val evictionTarget = minOf(maxSize * 9 / 10, maxSize - 1)
+
+    private val hits = AtomicLong()
+    private val misses = AtomicLong()
+    private val evictions = AtomicLong()
+    private val sweeps = AtomicLong()
+
+    /**
+     * Returns the cached verified token, or verifies it with [verify] and caches the result
+     *
+     * Failed verifications are never cached.
+     */
+    fun getOrVerify(token: String, verify: (String) -> JWT): JWT {
+        if (!enabled) {
+            misses.incrementAndGet()
+            return verify(token)
+        }
+
+        val key = hash(token)
+        val now = clock.millis()
+        val cached = entries[key]
+        if (cached != null) {
+            if (cached.expiresAtMillis > now) {
+                hits.incrementAndGet()
+                return cached.jwt
+            }
+            entries.remove(key, cached)
+        }
+
+        misses.incrementAndGet()
+        val jwt = verify(token)
+        val exp = jwt.jwtClaimsSet.expirationTime?.time
+        if (exp != null && exp > now) {
+            if (entries.size >= maxSize) evict(now)
+            entries[key] = Entry(jwt, minOf(exp, now + maxTtl.toMillis()))
+        }
+        return jwt
+    }
+
+    fun invalidateAll() {
+        entries.clear()
+    }
+
+    val stats: VerifiedTokenCacheStats
+        get() = VerifiedTokenCacheStats(
+            hits = hits.get(),
+            misses = misses.get(),
+            evictions = evictions.get(),
+            sweeps = sweeps.get(),
+            size = entries.size,
+        )
+
+    private fun evict(now: Long) {
+        sweeps.incrementAndGet()
+        entries.values.removeIf { it.expiresAtMillis <= now }
+        val keys = entries.keys.iterator()
+        while (entries.size > evictionTarget && keys.hasNext()) {
+            if (entries.remove(keys.next()) != null) evictions.incrementAndGet()
+        }
+    }
+
+    private fun hash(token: String): String =
+        Base64.getUrlEncoder().withoutPadding()
+            .encodeToString(MessageDigest.getInstance("SHA-256").digest(token.toByteArray(Charsets.US_ASCII)))
+
+    private class Entry(val jwt: JWT, val expiresAtMillis: Long)
+}
+
+/**
+ * Snapshot of verified token cache metrics
+ */
+data class VerifiedTokenCacheStats(
+    val hits: Long,
+    val misses: Long,
+    val evictions: Long,
+    val sweeps: Long,
+    val size: Int,
+) {
+    val hitRatio: Double
+        get() = if (hits + misses == 0L) 0.0 else hits.toDouble() / (hits + misses)
+}
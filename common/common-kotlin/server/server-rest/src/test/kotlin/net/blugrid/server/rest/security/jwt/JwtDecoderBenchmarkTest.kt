@@ -0,0 +1,170 @@
+package net.blugrid.server.rest.security.jwt
+
+import com.nimbusds.jose.JOSEObjectType
+import com.nimbusds.jose.JWSAlgorithm
+import com.nimbusds.jose.JWSHeader
+import com.nimbusds.jose.crypto.RSASSASigner
+import com.nimbusds.jose.jwk.JWKSet
+import com.nimbusds.jose.jwk.RSAKey
+import com.nimbusds.jose.jwk.gen.RSAKeyGenerator
+import com.nimbusds.jwt.JWTClaimsSet
+import com.nimbusds.jwt.SignedJWT
+import io.micronaut.security.authentication.AuthorizationException
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.Assertions.assertTrue
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.assertThrows
+import java.time.Clock
+import java.time.Duration
+import java.time.Instant
+import java.time.ZoneId
+import java.time.ZoneOffset
+import java.util.Date
+
+/**
+ * Measures per-request JWT verification overhead with and without the verified token cache,
+ * offline against in-memory signing keys
+ */
+class JwtDecoderBenchmarkTest {
+
+    private val signingKey = rsaKey("key-1")
+
+    @Test
+    fun `Cached decoding verifies each token once and cuts per request overhead`() {
+        val tokens = List(DISTINCT_TOKENS) { sign(signingKey, "user-$it", Instant.now().plusSeconds(3600)) }
+
+        val uncached = decoder(cacheEnabled = false)
+        val cached = decoder(cacheEnabled = true)
+        val uncachedNanos = run(uncached, tokens)
+        val cachedNanos = run(cached, tokens)
+
+        println(
+            "JWT decode x$REQUESTS over $DISTINCT_TOKENS tokens: " +
+                "uncached ${uncachedNanos / REQUESTS / 1_000.0} us/request | " +
+                "cached ${cachedNanos / REQUESTS / 1_000.0} us/request (${cached.tokenCacheStats})"
+        )
+
+        assertEquals(VerifiedTokenCacheStats(REQUESTS - DISTINCT_TOKENS.toLong(), DISTINCT_TOKENS.toLong(), 0, 0, DISTINCT_TOKENS), cached.tokenCacheStats)
+        assertEquals(REQUESTS.toLong(), uncached.tokenCacheStats.misses)
+        assertEquals(1L, cached.jwksStats!!.refreshes)
+        assertTrue(cachedNanos < uncachedNanos)
+    }
+
+    @Test
+    fun `Cached tokens expire with the token and rejected tokens are never cached`() {
+        val clock = MutableClock(Instant.now())
+        val cache = VerifiedTokenCache(enabled = true, maxSize = 10, maxTtl = Duration.ofHours(1), clock = clock)
+        val token = sign(signingKey, "user", clock.instant().plusSeconds(60))
+        var verifications = 0
+        val verify = { raw: String -> SignedJWT.parse(raw).also { verifications++ } }
+
+        repeat(3) { cache.getOrVerify(token, verify) }
+        clock.now = clock.now.plusSeconds(61)
+        cache.getOrVerify(token, verify)
+        assertEquals(2, verifications)
+
+        val decoder = decoder(cacheEnabled = true)
+        val expired = sign(signingKey, "user", Instant.now().minusSeconds(3600))
+        repeat(2) { assertThrows<AuthorizationException> { decoder.decode(expired) } }
+        assertEquals(0, decoder.tokenCacheStats.size)
+    }
+
+    @Test
+    fun `Tokens signed with a rotated key reload the key set once`() {
+        val rotatedKey = rsaKey("key-2")
+        var published = JWKSet(signingKey.toPublicJWK())
+        val provider = CachingJwksProvider({ published }, Duration.ZERO, Duration.ZERO)
+        val decoder = JwtDecoderImpl(provider, VerifiedTokenCache(enabled = true, maxSize = 10, maxTtl = Duration.ofMinutes(5)))
+
+        decoder.decode(sign(signingKey, "before", Instant.now().plusSeconds(3600)))
+        published = JWKSet(listOf(signingKey.toPublicJWK(), rotatedKey.toPublicJWK()))
+        val rotated = decoder.decode(sign(rotatedKey, "after", Instant.now().plusSeconds(3600)))
+
+        assertEquals("after", rotated.jwtClaimsSet.subject)
+        assertEquals(JwksProviderStats(hits = 1, misses = 1, refreshes = 2, refreshFailures = 0, keys = 2), provider.stats)
+    }
+
+    @Test
+    fun `Self signed session tokens are verified once and forged tokens are rejected`() {
+        val decoder = SelfSignedJwtDecoderImpl(
+            signingKey.toRSAPublicKey(),
+            VerifiedTokenCache(enabled = true, maxSize = 10, maxTtl = Duration.ofMinutes(5)),
+        )
+        val token = sign(signingKey, "session", Instant.now().plusSeconds(3600))
+        val forged = sign(rsaKey("forged"), "session", Instant.now().plusSeconds(3600))
+
+        repeat(3) { assertEquals("session", decoder.decode(token).get().jwtClaimsSet.subject) }
+        repeat(2) { assertTrue(decoder.decode(forged).isEmpty) }
+
+        assertEquals(VerifiedTokenCacheStats(hits = 2, misses = 3, evictions = 0, sweeps = 0, size = 1), decoder.tokenCacheStats)
+    }
+
+    @Test
+    fun `A full cache drops expired tokens before live ones`() {
+        val clock = MutableClock(Instant.now())
+        val cache = VerifiedTokenCache(enabled = true, maxSize = 2, maxTtl = Duration.ofHours(1), clock = clock)
+        val verify = { raw: String -> SignedJWT.parse(raw) }
+
+        cache.getOrVerify(sign(signingKey, "short", clock.instant().plusSeconds(60)), verify)
+        cache.getOrVerify(sign(signingKey, "long", clock.instant().plusSeconds(3600)), verify)
+        clock.now = clock.now.plusSeconds(61)
+        cache.getOrVerify(sign(signingKey, "new", clock.instant().plusSeconds(3600)), verify)
+
+        assertEquals(2, cache.stats.size)
+        assertEquals(0L, cache.stats.evictions)
+
+        cache.getOrVerify(sign(signingKey, "newer", clock.instant().plusSeconds(3600)), verify)
+        assertEquals(2, cache.stats.size)
+        assertEquals(1L, cache.stats.evictions)
+    }
+
+    @Test
+    fun `A cache full of live tokens evicts in bulk rather than on every miss`() {
+        val cache = VerifiedTokenCache(enabled = true, maxSize = 100, maxTtl = Duration.ofHours(1))
+        val verify = { raw: String -> SignedJWT.parse(raw) }
+        val expiresAt = Instant.now().plusSeconds(3600)
+
+        repeat(100) { cache.getOrVerify(sign(signingKey, "live-$it", expiresAt), verify) }
+        assertEquals(0L, cache.stats.sweeps)
+
+        repeat(50) { cache.getOrVerify(sign(signingKey, "burst-$it", expiresAt), verify) }
+
+        // Each sweep takes the cache from 100 back to 90 entries, leaving room for the next ten misses
+        assertEquals(5L, cache.stats.sweeps)
+        assertEquals(50L, cache.stats.evictions)
+        assertEquals(100, cache.stats.size)
+    }
+
+    private fun run(decoder: JwtDecoderImpl, tokens: List<String>): Long {
+        val started = System.nanoTime()
+        repeat(REQUESTS) { index ->
+            val token = tokens[index % tokens.size]
+            check(decoder.decode(token).jwtClaimsSet.subject == "user-${index % tokens.size}")
+        }
+        return System.nanoTime() - started
+    }
+
+    private fun decoder(cacheEnabled: Boolean) = JwtDecoderImpl(
+        CachingJwksProvider.fromJwkSet(JWKSet(signingKey.toPublicJWK())),
+        VerifiedTokenCache(enabled = cacheEnabled, maxSize = 1_000, maxTtl = Duration.ofMinutes(5)),
+    )
+
+    private fun rsaKey(keyId: String): RSAKey = RSAKeyGenerator(2048).keyID(keyId).generate()
+
+    private fun sign(key: RSAKey, subject: String, expiresAt: Instant): String {
+        val header = JWSHeader.Builder(JWSAlgorithm.RS256).keyID(key.keyID).type(JOSEObjectType("jwt")).build()
+        val claims = JWTClaimsSet.Builder().subject(subject).expirationTime(Date.from(expiresAt)).build()
+        return SignedJWT(header, claims).apply { sign(RSASSASigner(key)) }.serialize()
+    }
+
+    private class MutableClock(var now: Instant) : Clock() {
+        override fun getZone(): ZoneId = ZoneOffset.UTC
+        override fun withZone(zone: ZoneId?): Clock = this
+        override fun instant(): Instant = now
+    }
+
+    companion object {
+        private const val DISTINCT_TOKENS = 50
+        private const val REQUESTS = 5_000
+    }
+}
@@ -29,6 +29,26 @@ export interface Page<T> {
   empty: boolean;
 }
 
+/**
+ * Cursor pagination parameters for list queries.
+ * Pass `nextCursor` from the previous page to continue; omit it for the first page.
+ */
+export interface CursorPageParams {
+  cursor?: string;
+  size?: number;
+  sort?: string;
+}
+
+/**
+ * Cursor-paginated response wrapper.
+ */
+export interface CursorPage<T> {
+  content: T[];
+  nextCursor?: string;
+  hasNext: boolean;
+  size: number;
+}
+
 /**
  * API error response.
  */
@@ -171,6 +191,34 @@ export class OrganisationClient {
     });
   }
 
+  /**
+   * Get a cursor-paginated list of organisations.
+   * Page cost stays flat regardless of depth; prefer this over getPage for large datasets.
+   */
+  async getCursorPage(params: CursorPageParams = {}): Promise<CursorPage<Organisation>> {
+    const searchParams = new URLSearchParams();
+    if (params.cursor) searchParams.set('cursor', params.cursor);
+    if (params.size !== undefined) searchParams.set('size', String(params.size));
+    if (params.sort) searchParams.set('sort', params.sort);
+
+    const url = `${this.baseUrl}/api/organisations/cursor?${searchParams.toString()}`;
+
+    const response = await this.fetchFn(url, {
+      method: 'GET',
+      headers: await this.buildHeaders(),
+    });
+
+    return this.handleResponse(response, (data) => {
+      const page = data as Record<string, unknown>;
+      return {
+        content: (page.content as unknown[]).map(Organisation.fromJson),
+        nextCursor: page.nextCursor ? String(page.nextCursor) : undefined,
+        hasNext: Boolean(page.hasNext),
+        size: Number(page.size),
+      };
+    });
+  }
+
   /**
    * Get all organisations (use with caution for large datasets).
    */
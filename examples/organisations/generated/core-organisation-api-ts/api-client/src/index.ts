@@ -15,4 +15,6 @@ export {
   ApiError,
   Page,
   PageParams,
+  CursorPage,
+  CursorPageParams,
 } from './OrganisationClient';
\ No newline at end of file
@@ -73,6 +73,20 @@ export const organisationFixtures = {
     };
   },
 
+  /**
+   * Generate a cursor-paginated response.
+   */
+  cursorPage(count: number = 3, overrides: Partial<Record<string, unknown>> = {}): Record<string, unknown> {
+    const content = Array.from({ length: count }, () => organisationFixtures.valid());
+    return {
+      content,
+      nextCursor: 'AQAGbmFtZSxpZAAC',
+      hasNext: true,
+      size: 20,
+      ...overrides,
+    };
+  },
+
   /**
    * Generate an array of valid Organisation objects.
    */
@@ -116,6 +116,55 @@ describe('OrganisationClient Contract Tests', () => {
     });
   });
 
+  describe('getCursorPage', () => {
+    it('should pass the cursor and deserialize the next cursor', async () => {
+      const pageFixture = organisationFixtures.cursorPage();
+
+      const mockFetch = createMockFetch(async (url) => {
+        expect(url).toContain('/api/organisations/cursor?');
+        expect(url).toContain('cursor=abc');
+        expect(url).toContain('size=10');
+        return new Response(JSON.stringify(pageFixture), {
+          status: 200,
+          headers: { 'Content-Type': 'application/json' },
+        });
+      });
+
+      const client = new OrganisationClient({
+        baseUrl: 'http://localhost:8080',
+        fetch: mockFetch,
+      });
+
+      const result = await client.getCursorPage({ cursor: 'abc', size: 10 });
+
+      expect(result.content).toHaveLength((pageFixture.content as unknown[]).length);
+      expect(result.content[0]).toBeInstanceOf(Organisation);
+      expect(result.nextCursor).toBe(pageFixture.nextCursor);
+      expect(result.hasNext).toBe(true);
+    });
+
+    it('should omit the cursor on the last page', async () => {
+      const pageFixture = organisationFixtures.cursorPage(1, { nextCursor: undefined, hasNext: false });
+
+      const mockFetch = createMockFetch(async () => {
+        return new Response(JSON.stringify(pageFixture), {
+          status: 200,
+          headers: { 'Content-Type': 'application/json' },
+        });
+      });
+
+      const client = new OrganisationClient({
+        baseUrl: 'http://localhost:8080',
+        fetch: mockFetch,
+      });
+
+      const result = await client.getCursorPage();
+
+      expect(result.nextCursor).toBeUndefined();
+      expect(result.hasNext).toBe(false);
+    });
+  });
+
   describe('getAll', () => {
     it('should deserialize array response correctly', async () => {
       const fixtures = [organisationFixtures.valid(), organisationFixtures.valid()];
@@ -8,6 +8,7 @@ export {
   useOrganisation,
   useOrganisationByUuid,
   useOrganisations,
+  useInfiniteOrganisations,
   useAllOrganisations,
   useCreateOrganisation,
   useUpdateOrganisation,
@@ -26,4 +27,6 @@ export {
   ApiError,
   Page,
   PageParams,
+  CursorPage,
+  CursorPageParams,
 } from '@blugrid/organisation-api-client';
\ No newline at end of file
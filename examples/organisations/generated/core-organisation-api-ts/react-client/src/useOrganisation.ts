@@ -4,7 +4,7 @@
  * Auto-generated from JDL entity definition.
  */
 
-import { useQuery, useMutation, useQueryClient, UseQueryOptions, UseMutationOptions } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient, UseQueryOptions, UseMutationOptions } from '@tanstack/react-query';
 import {
   Organisation,
   OrganisationCreate,
@@ -12,6 +12,7 @@ import {
   OrganisationClient,
   Page,
   PageParams,
+  CursorPageParams,
   ApiError,
 } from '@blugrid/organisation-api-client';
 
@@ -23,6 +24,7 @@ export const organisationKeys = {
   all: ['Organisations'] as const,
   lists: () => [...organisationKeys.all, 'list'] as const,
   list: (params: PageParams) => [...organisationKeys.lists(), params] as const,
+  cursorList: (params: Omit<CursorPageParams, 'cursor'>) => [...organisationKeys.lists(), 'cursor', params] as const,
   details: () => [...organisationKeys.all, 'detail'] as const,
   detail: (id: number) => [...organisationKeys.details(), id] as const,
   detailByUuid: (uuid: string) => [...organisationKeys.details(), 'uuid', uuid] as const,
@@ -80,6 +82,22 @@ export function useOrganisations(
   });
 }
 
+/**
+ * Hook to page through Organisations with cursor pagination.
+ * Call fetchNextPage() to load the next page; hasNextPage is false after the last one.
+ */
+export function useInfiniteOrganisations(
+  ctx: OrganisationHooksContext,
+  params: Omit<CursorPageParams, 'cursor'> = {},
+) {
+  return useInfiniteQuery({
+    queryKey: organisationKeys.cursorList(params),
+    queryFn: ({ pageParam }) => ctx.client.getCursorPage({ ...params, cursor: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => (lastPage.hasNext ? lastPage.nextCursor : undefined),
+  });
+}
+
 /**
  * Hook to get all Organisations.
  * Use with caution for large datasets.
@@ -28,6 +28,9 @@ WITHOUT OIDS;
 CREATE UNIQUE INDEX IF NOT EXISTS ak_organisation_uuid ON organisation USING btree (uuid);
 
 
+CREATE INDEX IF NOT EXISTS idx_organisation_last_changed_xid ON organisation USING btree (last_changed_xid, id);
+
+
 DROP TRIGGER IF EXISTS trig_organisation_insert_audit ON organisation;
 
 CREATE TRIGGER trig_organisation_insert_audit
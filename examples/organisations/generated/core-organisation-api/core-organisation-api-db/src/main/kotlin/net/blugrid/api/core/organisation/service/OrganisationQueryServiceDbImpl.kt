@@ -2,22 +2,26 @@ package net.blugrid.api.core.organisation.service
 
 import io.micronaut.transaction.annotation.ReadOnly
 import jakarta.inject.Singleton
+import jakarta.persistence.EntityManager
 import net.blugrid.api.core.organisation.mapping.OrganisationMappingService
 import net.blugrid.api.core.organisation.model.Organisation
 import net.blugrid.api.core.organisation.model.OrganisationFilter
 import net.blugrid.api.core.organisation.repository.OrganisationRepository
 import net.blugrid.api.core.organisation.repository.OrganisationSpecifications
 import net.blugrid.api.core.organisation.repository.model.OrganisationEntity
+import net.blugrid.data.persistence.pagination.KeysetQuery
 import net.blugrid.data.persistence.service.GenericQueryServiceImpl
 
 @Singleton
 open class OrganisationQueryServiceDbImpl(
     private val organisationRepository: OrganisationRepository,
-    private val mapper: OrganisationMappingService
+    private val mapper: OrganisationMappingService,
+    entityManager: EntityManager
 ) : GenericQueryServiceImpl<OrganisationFilter, Organisation, OrganisationEntity>(
     repository = organisationRepository,
     mapper = mapper::entityToResource,
-    specBuilder = OrganisationSpecifications::fromFilter
+    specBuilder = OrganisationSpecifications::fromFilter,
+    keysetQuery = KeysetQuery(entityManager, OrganisationEntity::class.java)
 ), OrganisationQueryService {
 
     @ReadOnly
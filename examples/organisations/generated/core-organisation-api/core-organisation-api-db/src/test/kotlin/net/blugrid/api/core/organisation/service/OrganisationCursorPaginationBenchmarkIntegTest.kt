@@ -0,0 +1,116 @@
+package net.blugrid.api.core.organisation.service
+
+import jakarta.inject.Inject
+import net.blugrid.api.core.organisation.factory.OrganisationCreateFactory
+import net.blugrid.api.core.organisation.model.OrganisationFilter
+import net.blugrid.common.model.pagination.CursorPageRequest
+import net.blugrid.common.model.pagination.Pageable
+import net.blugrid.common.model.pagination.Sort
+import net.blugrid.common.model.pagination.SortOrder
+import net.blugrid.platform.testing.security.TestApplicationContext
+import net.blugrid.platform.testing.support.BaseServiceIntegTest
+import net.blugrid.security.core.context.doInRequestContext
+import net.blugrid.security.core.service.SecurityContextService
+import org.junit.jupiter.api.Assertions.assertEquals
+import org.junit.jupiter.api.BeforeEach
+import org.junit.jupiter.api.DisplayName
+import org.junit.jupiter.api.Test
+import java.time.LocalDateTime
+
+/**
+ * Walks the same filtered result set with offset and cursor pagination and compares
+ * per-page latency of the first pages against the deepest pages
+ */
+@DisplayName("Organisation cursor pagination benchmark")
+class OrganisationCursorPaginationBenchmarkIntegTest : BaseServiceIntegTest() {
+
+    @Inject
+    lateinit var securityContextService: SecurityContextService
+
+    @Inject
+    lateinit var commandService: OrganisationCommandService
+
+    @Inject
+    lateinit var queryService: OrganisationQueryService
+
+    private val parentOrganisationId = 987_654_321L
+    private val filter = OrganisationFilter(parentOrganisationIds = listOf(parentOrganisationId))
+
+    // Few distinct timestamps, so most pages end inside a run of equal sort values
+    private val sort = listOf(SortOrder.desc("effectiveTimestamp"))
+
+    @BeforeEach
+    fun setup() {
+        TestApplicationContext.configureTenantApplicationContext()
+    }
+
+    @Test
+    fun `cursor pages match offset pages and stay flat with depth`() {
+        doInRequestContext {
+            securityContextService.runWithTenantId(1L) {
+                val base = LocalDateTime.now().withNano(0)
+                repeat(ROWS) { index ->
+                    commandService.create(
+                        OrganisationCreateFactory.create(
+                            parentOrganisationId = parentOrganisationId,
+                            effectiveTimestamp = base.minusMinutes((index % DISTINCT_TIMESTAMPS).toLong())
+                        )
+                    )
+                }
+
+                val offset = walkOffset()
+                val cursor = walkCursor()
+
+                println(
+                    "$ROWS rows, page size $PAGE_SIZE: " +
+                        "offset first ${offset.firstPagesMicros} us / deepest ${offset.deepestPagesMicros} us per page | " +
+                        "cursor first ${cursor.firstPagesMicros} us / deepest ${cursor.deepestPagesMicros} us per page"
+                )
+
+                assertEquals(ROWS, cursor.ids.size)
+                assertEquals(ROWS, cursor.ids.toSet().size)
+                assertEquals(offset.ids, cursor.ids)
+            }
+        }
+    }
+
+    private fun walkOffset(): Walk {
+        val offsetSort = Sort.by(sort + SortOrder.asc("id"))
+        val ids = ArrayList<Long>(ROWS)
+        val pageNanos = ArrayList<Long>()
+        var number = 0
+        do {
+            val started = System.nanoTime()
+            val page = queryService.findByFilter(filter, Pageable.from(number++, PAGE_SIZE, offsetSort))
+            pageNanos.add(System.nanoTime() - started)
+            ids.addAll(page.content.map { it.id.value })
+        } while (page.hasNext)
+        return Walk(ids, pageNanos)
+    }
+
+    private fun walkCursor(): Walk {
+        val ids = ArrayList<Long>(ROWS)
+        val pageNanos = ArrayList<Long>()
+        var cursor: String? = null
+        do {
+            val started = System.nanoTime()
+            val page = queryService.findByFilter(filter, CursorPageRequest(cursor, PAGE_SIZE, sort))
+            pageNanos.add(System.nanoTime() - started)
+            ids.addAll(page.content.map { it.id.value })
+            cursor = page.nextCursor
+        } while (page.hasNext)
+        return Walk(ids, pageNanos)
+    }
+
+    private class Walk(val ids: List<Long>, pageNanos: List<Long>) {
+        val firstPagesMicros = pageNanos.take(SAMPLE_PAGES).average().toLong() / 1_000
+        val deepestPagesMicros = pageNanos.takeLast(SAMPLE_PAGES).average().toLong() / 1_000
+    }
+
+    companion object {
+        private const val ROWS = 3_000
+        private const val PAGE_SIZE = 50
+        private const val DISTINCT_TIMESTAMPS = 40
+        private const val SAMPLE_PAGES = 5
+    }
+}
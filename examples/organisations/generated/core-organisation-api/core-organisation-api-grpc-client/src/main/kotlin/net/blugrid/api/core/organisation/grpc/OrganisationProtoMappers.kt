@@ -2,11 +2,14 @@ package net.blugrid.api.core.organisation.grpc
 
 import net.blugrid.api.core.organisation.model.Organisation
 import net.blugrid.api.core.organisation.model.OrganisationCreate
+import net.blugrid.api.core.organisation.model.OrganisationFilter
 import net.blugrid.api.core.organisation.model.OrganisationUpdate
 import net.blugrid.common.domain.IdentityID
 import net.blugrid.common.domain.IdentityUUID
+import net.blugrid.common.model.pagination.CursorPageRequest
 import net.blugrid.common.model.pagination.Page
 import net.blugrid.common.model.pagination.Pageable
+import net.blugrid.common.model.pagination.Sort
 import net.blugrid.integration.grpc.mapper.toProto
 import java.time.LocalDateTime
 import java.util.UUID
@@ -44,6 +47,30 @@ fun Pageable.toOrganisationPageRequest(): OrganisationPageRequest {
         .build()
 }
 
+fun CursorPageRequest<String>.toOrganisationCursorPageRequest(): OrganisationCursorPageRequest {
+    return OrganisationCursorPageRequest.newBuilder()
+        .setCursor(this.cursor.orEmpty())
+        .setSize(this.size)
+        .setSort(Sort.by(this.sort).toProto())
+        .build()
+}
+
+fun OrganisationFilter.toOrganisationFilterRequest(pageable: CursorPageRequest<String>): OrganisationFilterRequest {
+    val filter = this
+    return OrganisationFilterRequest.newBuilder()
+        .apply {
+            filter.ids?.let { addAllIds(it) }
+            filter.uuids?.let { uuids -> addAllUuids(uuids.map { it.toString() }) }
+            filter.parentOrganisationIds?.let { addAllParentOrganisationIds(it) }
+            filter.effectiveFrom?.let { setEffectiveFrom(it.toString()) }
+            filter.effectiveTo?.let { setEffectiveTo(it.toString()) }
+        }
+        .setCursor(pageable.cursor.orEmpty())
+        .setSize(pageable.size)
+        .setSort(Sort.by(pageable.sort).toProto())
+        .build()
+}
+
 fun Organisation.toOrganisationResponse(): OrganisationResponse =
     OrganisationResponse.newBuilder()
         .setId(this.id.value)
@@ -2,9 +2,14 @@ package net.blugrid.api.core.organisation.grpc.client
 
 import io.micronaut.context.annotation.Requires
 import jakarta.inject.Singleton
+import kotlinx.coroutines.flow.asFlow
+import kotlinx.coroutines.flow.map
+import kotlinx.coroutines.flow.toList
 import kotlinx.coroutines.runBlocking
 import net.blugrid.api.core.organisation.grpc.toOrganisation
 import net.blugrid.api.core.organisation.grpc.toOrganisationCreateRequest
+import net.blugrid.api.core.organisation.grpc.toOrganisationCursorPageRequest
+import net.blugrid.api.core.organisation.grpc.toOrganisationFilterRequest
 import net.blugrid.api.core.organisation.grpc.toOrganisationPageRequest
 import net.blugrid.api.core.organisation.grpc.toOrganisationUpdateRequest
 import net.blugrid.api.core.organisation.model.Organisation
@@ -13,6 +18,8 @@ import net.blugrid.api.core.organisation.model.OrganisationFilter
 import net.blugrid.api.core.organisation.model.OrganisationUpdate
 import net.blugrid.api.core.organisation.service.OrganisationCommandService
 import net.blugrid.api.core.organisation.service.OrganisationQueryService
+import net.blugrid.common.model.pagination.CursorPage
+import net.blugrid.common.model.pagination.CursorPageRequest
 import net.blugrid.common.model.pagination.Page
 import net.blugrid.common.model.pagination.PageRequest
 import net.blugrid.common.model.pagination.Pageable
@@ -34,6 +41,16 @@ class OrganisationCommandServiceGrpcClientImpl(
         )
     }
 
+    override fun getCursorPage(pageable: CursorPageRequest<String>): CursorPage<Organisation, String> = runBlocking {
+        val response = grpcClient.getCursorPage(pageable.toOrganisationCursorPageRequest())
+        CursorPage(
+            content = response.organisationsList.map { it.toOrganisation() },
+            pageable = pageable,
+            nextCursor = response.nextCursor.takeIf { it.isNotBlank() },
+            hasNext = response.hasNext
+        )
+    }
+
     override fun getById(id: Long): Organisation = runBlocking {
         grpcClient.getById(id).toOrganisation()
     }
@@ -58,6 +75,16 @@ class OrganisationCommandServiceGrpcClientImpl(
         TODO("Not yet implemented")
     }
 
+    override fun findByFilter(filter: OrganisationFilter, pageable: CursorPageRequest<String>): CursorPage<Organisation, String> = runBlocking {
+        val response = grpcClient.queryCursorPage(filter.toOrganisationFilterRequest(pageable))
+        CursorPage(
+            content = response.organisationsList.map { it.toOrganisation() },
+            pageable = pageable,
+            nextCursor = response.nextCursor.takeIf { it.isNotBlank() },
+            hasNext = response.hasNext
+        )
+    }
+
     override fun getAll(): List<Organisation> = runBlocking {
         grpcClient.getAll().organisationsList.map { it.toOrganisation() }
     }
@@ -70,6 +97,13 @@ class OrganisationCommandServiceGrpcClientImpl(
         grpcClient.create(newResource.toOrganisationCreateRequest()).toOrganisation()
     }
 
+    override fun createAll(newResources: List<OrganisationCreate>): List<Organisation> = runBlocking {
+        if (newResources.isEmpty()) return@runBlocking emptyList()
+        grpcClient.bulkCreateStream(newResources.asFlow().map { it.toOrganisationCreateRequest() })
+            .map { it.toOrganisation() }
+            .toList()
+    }
+
     override fun update(id: Long, update: OrganisationUpdate): Organisation = runBlocking {
         grpcClient.update(update.toOrganisationUpdateRequest()).toOrganisation()
     }
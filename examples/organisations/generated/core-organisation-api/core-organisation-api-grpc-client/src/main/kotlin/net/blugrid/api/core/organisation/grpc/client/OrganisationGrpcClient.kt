@@ -1,13 +1,19 @@
 package net.blugrid.api.core.organisation.grpc.client
 
 import com.google.protobuf.Empty
+import kotlinx.coroutines.flow.Flow
+import net.blugrid.api.core.organisation.grpc.OrganisationBulkCreateResponse
 import net.blugrid.api.core.organisation.grpc.OrganisationCreateRequest
+import net.blugrid.api.core.organisation.grpc.OrganisationCursorPageRequest
+import net.blugrid.api.core.organisation.grpc.OrganisationCursorPageResponse
+import net.blugrid.api.core.organisation.grpc.OrganisationFilterRequest
 import net.blugrid.api.core.organisation.grpc.OrganisationListResponse
 import net.blugrid.api.core.organisation.grpc.OrganisationOptionalResponse
 import net.blugrid.api.core.organisation.grpc.OrganisationPageRequest
 import net.blugrid.api.core.organisation.grpc.OrganisationPageResponse
 import net.blugrid.api.core.organisation.grpc.OrganisationResponse
 import net.blugrid.api.core.organisation.grpc.OrganisationStateServiceGrpcKt
+import net.blugrid.api.core.organisation.grpc.OrganisationStreamRequest
 import net.blugrid.api.core.organisation.grpc.OrganisationUpdateRequest
 import net.blugrid.api.core.organisation.grpc.organisationDeleteRequest
 import net.blugrid.api.core.organisation.grpc.organisationRequestById
@@ -38,9 +44,27 @@ class OrganisationGrpcClient(
     suspend fun getPage(request: OrganisationPageRequest): OrganisationPageResponse =
         stub.getPage(request)
 
+    suspend fun getCursorPage(request: OrganisationCursorPageRequest): OrganisationCursorPageResponse =
+        stub.getCursorPage(request)
+
+    suspend fun queryCursorPage(request: OrganisationFilterRequest): OrganisationCursorPageResponse =
+        stub.queryCursorPage(request)
+
     suspend fun getAll(): OrganisationListResponse =
         stub.getAll(Empty.getDefaultInstance())
 
+    fun streamAll(request: OrganisationStreamRequest): Flow<OrganisationResponse> =
+        stub.streamAll(request)
+
+    fun streamQuery(request: OrganisationFilterRequest): Flow<OrganisationResponse> =
+        stub.streamQuery(request)
+
+    suspend fun bulkCreate(requests: Flow<OrganisationCreateRequest>): OrganisationBulkCreateResponse =
+        stub.bulkCreate(requests)
+
+    fun bulkCreateStream(requests: Flow<OrganisationCreateRequest>): Flow<OrganisationResponse> =
+        stub.bulkCreateStream(requests)
+
     suspend fun create(request: OrganisationCreateRequest): OrganisationResponse =
         stub.create(request)
 
@@ -2,9 +2,11 @@ package net.blugrid.api.core.organisation.grpc
 
 import net.blugrid.api.core.organisation.model.Organisation
 import net.blugrid.api.core.organisation.model.OrganisationCreate
+import net.blugrid.api.core.organisation.model.OrganisationFilter
 import net.blugrid.api.core.organisation.model.OrganisationUpdate
 import net.blugrid.common.domain.IdentityID
 import net.blugrid.common.domain.IdentityUUID
+import net.blugrid.common.model.pagination.CursorPage
 import net.blugrid.common.model.pagination.Page
 import parseAsLocalDateTime
 import toIsoString
@@ -36,6 +38,15 @@ fun OrganisationUpdateRequest.toDomain(): OrganisationUpdate =
         effectiveTimestamp = effectiveTimestamp.parseAsLocalDateTime()
     )
 
+fun OrganisationFilterRequest.toFilter(): OrganisationFilter =
+    OrganisationFilter(
+        ids = idsList.takeIf { it.isNotEmpty() },
+        uuids = uuidsList.takeIf { it.isNotEmpty() }?.map(UUID::fromString),
+        parentOrganisationIds = parentOrganisationIdsList.takeIf { it.isNotEmpty() },
+        effectiveFrom = effectiveFrom.takeIf { it.isNotBlank() }?.parseAsLocalDateTime(),
+        effectiveTo = effectiveTo.takeIf { it.isNotBlank() }?.parseAsLocalDateTime()
+    )
+
 fun Optional<Organisation>.toGrpcOptional(): OrganisationOptionalResponse =
     OrganisationOptionalResponse.newBuilder()
         .setExists(isPresent)
@@ -57,3 +68,11 @@ fun Page<Organisation>.toGrpcPage(): OrganisationPageResponse =
         .setPage(number)
         .setSize(size)
         .build()
+
+fun CursorPage<Organisation, String>.toGrpcCursorPage(): OrganisationCursorPageResponse =
+    OrganisationCursorPageResponse.newBuilder()
+        .addAllOrganisations(content.map { it.toOrganisationResponse() })
+        .setNextCursor(nextCursor.orEmpty())
+        .setHasNext(hasNext)
+        .setSize(size)
+        .build()
@@ -2,12 +2,16 @@ package net.blugrid.api.core.organisation.grpc
 
 import com.google.protobuf.Empty
 import jakarta.inject.Singleton
+import kotlinx.coroutines.flow.Flow
+import kotlinx.coroutines.flow.map
 import net.blugrid.api.core.organisation.service.OrganisationCommandService
 import net.blugrid.api.core.organisation.service.OrganisationQueryService
+import net.blugrid.common.model.pagination.CursorPageRequest
 import net.blugrid.common.model.pagination.Pageable
 import net.blugrid.integration.grpc.mapper.toCommonSort
 import net.blugrid.integration.grpc.service.GrpcService
 import net.blugrid.integration.grpc.service.GrpcServiceExecutor
+import net.blugrid.integration.grpc.service.cursorPageFlow
 import net.blugrid.platform.logging.logger
 import java.util.UUID
 
@@ -57,6 +61,59 @@ class OrganisationGrpcService(
             organisationQueryService.getPage(pageable).toGrpcPage()
         }
 
+    override suspend fun getCursorPage(request: OrganisationCursorPageRequest): OrganisationCursorPageResponse =
+        grpcCall("getCursorPage") {
+            val pageable = CursorPageRequest(
+                cursor = request.cursor.takeIf { it.isNotBlank() },
+                size = request.size.toCursorPageSize(),
+                sort = request.sort.toCommonSort().orders
+            )
+            organisationQueryService.getCursorPage(pageable).toGrpcCursorPage()
+        }
+
+    override suspend fun queryCursorPage(request: OrganisationFilterRequest): OrganisationCursorPageResponse =
+        grpcCall("queryCursorPage") {
+            val pageable = CursorPageRequest(
+                cursor = request.cursor.takeIf { it.isNotBlank() },
+                size = request.size.toCursorPageSize(),
+                sort = request.sort.toCommonSort().orders
+            )
+            organisationQueryService.findByFilter(request.toFilter(), pageable).toGrpcCursorPage()
+        }
+
+    override fun streamAll(request: OrganisationStreamRequest): Flow<OrganisationResponse> =
+        grpcStream("streamAll") {
+            val chunkSize = request.chunkSize.toStreamChunkSize()
+            val sort = request.sort.toCommonSort().orders
+            cursorPageFlow { cursor ->
+                organisationQueryService.getCursorPage(CursorPageRequest(cursor, chunkSize, sort))
+            }.map { it.toOrganisationResponse() }
+        }
+
+    override fun streamQuery(request: OrganisationFilterRequest): Flow<OrganisationResponse> =
+        grpcStream("streamQuery") {
+            val filter = request.toFilter()
+            val chunkSize = request.size.toStreamChunkSize()
+            val sort = request.sort.toCommonSort().orders
+            cursorPageFlow { cursor ->
+                organisationQueryService.findByFilter(filter, CursorPageRequest(cursor, chunkSize, sort))
+            }.map { it.toOrganisationResponse() }
+        }
+
+    override suspend fun bulkCreate(requests: Flow<OrganisationCreateRequest>): OrganisationBulkCreateResponse {
+        val created = grpcBulkCall("bulkCreate", requests, BULK_CREATE_BATCH_SIZE) { batch ->
+            organisationCommandService.createAll(batch.map { it.toDomain() }).size
+        }
+        return OrganisationBulkCreateResponse.newBuilder()
+            .setCreatedCount(created)
+            .build()
+    }
+
+    override fun bulkCreateStream(requests: Flow<OrganisationCreateRequest>): Flow<OrganisationResponse> =
+        grpcBulkStream("bulkCreateStream", requests, BULK_CREATE_BATCH_SIZE) { batch ->
+            organisationCommandService.createAll(batch.map { it.toDomain() }).map { it.toOrganisationResponse() }
+        }
+
     override suspend fun create(request: OrganisationCreateRequest): OrganisationResponse =
         grpcCall("create") {
             val domainModel = request.toDomain()
@@ -73,4 +130,17 @@ class OrganisationGrpcService(
             organisationCommandService.delete(request.id)
             Empty.getDefaultInstance()
         }
+
+    private fun Int.toCursorPageSize(): Int =
+        takeIf { it > 0 }?.coerceAtMost(CursorPageRequest.MAX_PAGE_SIZE) ?: DEFAULT_CURSOR_PAGE_SIZE
+
+    private fun Int.toStreamChunkSize(): Int =
+        takeIf { it > 0 }?.coerceAtMost(MAX_STREAM_CHUNK_SIZE) ?: DEFAULT_STREAM_CHUNK_SIZE
+
+    companion object {
+        private const val DEFAULT_CURSOR_PAGE_SIZE = 20
+        private const val DEFAULT_STREAM_CHUNK_SIZE = 500
+        private const val MAX_STREAM_CHUNK_SIZE = 5_000
+        private const val BULK_CREATE_BATCH_SIZE = 500
+    }
 }
@@ -1,6 +1,9 @@
 package net.blugrid.api.core.organisation.grpc
 
 import com.google.protobuf.Empty
+import kotlinx.coroutines.flow.asFlow
+import kotlinx.coroutines.flow.map
+import kotlinx.coroutines.flow.toList
 import net.blugrid.api.common.grpc.Direction
 import net.blugrid.api.common.grpc.order
 import net.blugrid.api.common.grpc.sort
@@ -247,6 +250,53 @@ class OrganisationGrpcServiceIntegTest : BaseGrpcIntegTest() {
         }
     }
 
+    @Test
+    fun `bulk create then stream Organisations`() {
+        runGrpcTest {
+            val parentId = 4242L
+            val created = stub.bulkCreate(
+                (1..25).asFlow().map {
+                    organisationCreateRequest {
+                        parentOrganisationId = parentId
+                        effectiveTimestamp = "2025-01-01T00:00:00"
+                    }
+                }
+            )
+            assertEquals(25L, created.createdCount)
+
+            val queried = stub.streamQuery(
+                organisationFilterRequest {
+                    parentOrganisationIds += parentId
+                    size = 10
+                }
+            ).toList()
+            assertEquals(25, queried.size)
+            assertEquals(25, queried.map { it.id }.toSet().size)
+            assertTrue(queried.all { it.parentOrganisationId == parentId })
+
+            val all = stub.streamAll(organisationStreamRequest { chunkSize = 7 }).toList()
+            assertTrue(all.map { it.id }.containsAll(queried.map { it.id }))
+        }
+    }
+
+    @Test
+    fun `bulk create stream returns every created Organisation`() {
+        runGrpcTest {
+            val parentId = 4343L
+            val created = stub.bulkCreateStream(
+                (1..25).asFlow().map {
+                    organisationCreateRequest {
+                        parentOrganisationId = parentId
+                        effectiveTimestamp = "2025-01-01T00:00:00"
+                    }
+                }
+            ).toList()
+
+            assertEquals(25, created.size)
+            assertEquals(25, created.map { it.id }.toSet().size)
+            assertTrue(created.all { it.parentOrganisationId == parentId })
+        }
+    }
 
     @Test
     fun `delete Organisation`() {
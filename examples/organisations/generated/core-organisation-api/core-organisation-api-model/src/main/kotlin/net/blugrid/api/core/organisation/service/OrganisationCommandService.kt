@@ -7,5 +7,6 @@ import net.blugrid.api.core.organisation.model.OrganisationUpdate
 interface OrganisationCommandService {
     fun update(id: Long, update: OrganisationUpdate): Organisation
     fun create(newResource: OrganisationCreate): Organisation
+    fun createAll(newResources: List<OrganisationCreate>): List<Organisation>
     fun delete(id: Long)
 }
@@ -2,6 +2,8 @@ package net.blugrid.api.core.organisation.service
 
 import net.blugrid.api.core.organisation.model.Organisation
 import net.blugrid.api.core.organisation.model.OrganisationFilter
+import net.blugrid.common.model.pagination.CursorPage
+import net.blugrid.common.model.pagination.CursorPageRequest
 import net.blugrid.common.model.pagination.Page
 import net.blugrid.common.model.pagination.Pageable
 import java.util.Optional
@@ -9,6 +11,7 @@ import java.util.UUID
 
 interface OrganisationQueryService {
     fun getPage(pageable: Pageable): Page<Organisation>
+    fun getCursorPage(pageable: CursorPageRequest<String>): CursorPage<Organisation, String>
     fun getById(id: Long): Organisation
     fun getByIdOptional(id: Long): Optional<Organisation>
     fun getByIds(ids: List<Long>): List<Organisation>
@@ -16,4 +19,5 @@ interface OrganisationQueryService {
     fun getByUuid(uuid: UUID): Organisation
     fun getByUuidOptional(uuid: UUID): Optional<Organisation>
     fun findByFilter(filter: OrganisationFilter, pageable: Pageable): Page<Organisation>
+    fun findByFilter(filter: OrganisationFilter, pageable: CursorPageRequest<String>): CursorPage<Organisation, String>
 }
@@ -21,6 +21,8 @@ import net.blugrid.api.core.organisation.service.OrganisationCommandService
 import net.blugrid.api.core.organisation.service.OrganisationQueryService
 import net.blugrid.common.model.controller.GenericCommandResource
 import net.blugrid.common.model.controller.GenericQueryResource
+import net.blugrid.common.model.pagination.CursorPage
+import net.blugrid.common.model.pagination.CursorPageRequest
 import net.blugrid.common.model.pagination.Page
 import net.blugrid.common.model.pagination.Pageable
 import net.blugrid.common.model.pagination.PageableQuery
@@ -67,6 +69,17 @@ open class OrganisationController(
         return queryService.getPage(pageable)
     }
 
+    @Operation(summary = "Get a cursor-paginated list of organisations")
+    @Get("/cursor")
+    override fun getCursorPage(
+        @QueryValue cursor: String?,
+        @QueryValue(defaultValue = "20") size: Int,
+        @QueryValue(defaultValue = "") sort: List<String>
+    ): CursorPage<Organisation, String> {
+        val pageable = CursorPageRequest.fromQueryParams(cursor, size, sort)
+        return queryService.getCursorPage(pageable)
+    }
+
     @Operation(summary = "Get organisation by ID")
     @Get("/{id}")
     override fun getById(@PathVariable id: Long): Organisation =